@@ -0,0 +1,87 @@
+"""
+Compare HTML backends on a large synthetic TOC bids page.
+
+The page holds one table per debate event, like a season-long
+toc_bids.mhtml, and each run extracts a single event's table:
+
+    python benchmarks/bench_html.py [--rows 2000] [--repeat 5]
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from bs4 import BeautifulSoup
+
+from tabroom.scraping import Bs4Backend, LxmlBackend, SelectolaxBackend
+
+EVENTS = (102, 103, 104, 105)
+
+
+def season_page(rows: int) -> str:
+    tables = []
+    for event in EVENTS:
+        body = "".join(
+            "<tr>\n"
+            f'\t<td><a href="/school/{i}">School {i}</a></td>\n'
+            "\t<td>TX</td>\n"
+            f"\t<td>School {i} AB</td>\n"
+            f"\t<td class='bids'>{i % 6}</td>\n"
+            "</tr>\n"
+            for i in range(rows)
+        )
+        tables.append(
+            f'<h4>Event {event}</h4>\n<table id="{event}">\n'
+            "<thead><tr><th>School</th><th>State</th><th>Entry</th><th>Bids</th>"
+            f"</tr></thead>\n<tbody>\n{body}</tbody>\n</table>\n"
+        )
+    tables = "".join(tables)
+    return f"<html><head><title>Bids</title></head><body>{tables}</body></html>"
+
+
+def full_soup(html: str, table_id: str) -> list[list[str]]:
+    """The previous approach: parse the whole page, then find the table."""
+    table = BeautifulSoup(html, "html.parser").find(id=table_id)
+    return [
+        [cell.get_text().strip() for cell in row.find_all("td")]
+        for row in table.tbody.find_all("tr")
+    ]
+
+
+def best(fn: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    html = season_page(args.rows)
+    strategies = {"full soup": lambda: full_soup(html, "104")}
+    for backend in (Bs4Backend, LxmlBackend, SelectolaxBackend):
+        try:
+            instance = backend()
+        except ImportError:
+            continue
+        strategies[instance.name] = lambda b=instance: b.table_rows(html, "104")
+
+    expected = full_soup(html, "104")
+    print(f"page: {len(html) / 1e6:.1f} MB, {args.rows} rows per table")
+    print(f"{'strategy':<12} {'seconds':>9} {'speedup':>8}")
+    baseline = None
+    for label, fn in strategies.items():
+        assert fn() == expected, label
+        seconds = best(fn, args.repeat)
+        baseline = baseline or seconds
+        print(f"{label:<12} {seconds:>9.4f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare the memory retained by large list results in each return type.
+
+Runs offline against synthetic Person, Student, Chapter and bid rows:
+
+    python benchmarks/bench_memory.py [--items 20000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+from tabroom import Chapter, ParseMode, Person, Student
+from tabroom.parsing import Parser
+from tabroom.records import Columns
+from tabroom.resources.extra import BidRecord
+
+
+def people(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "email": f"user{i}@example.com",
+            "first": "First",
+            "last": f"Last{i}",
+            "nsda": 100000 + i,
+            "last_access": "2024-01-02 03:04:05",
+        }
+        for i in range(n)
+    ]
+
+
+def named(n: int) -> list[dict[str, Any]]:
+    return [{"id": i, "name": f"Name {i}"} for i in range(n)]
+
+
+def bids(n: int) -> list[BidRecord]:
+    return [
+        BidRecord(f"School {i}", "TX", f"School {i} AB", i % 5) for i in range(n)
+    ]
+
+
+def retained(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by the result of ``build`` once it returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.items
+
+    print(f"{'rows':<8} {'return type':<12} {'bytes/row':>10}")
+    for name, model, make in (
+        ("Person", Person, people),
+        ("Student", Student, named),
+        ("Chapter", Chapter, named),
+    ):
+        for mode in (ParseMode.VALIDATE, ParseMode.RECORDS, ParseMode.COLUMNS):
+            # Decode inside the measurement, as a response would be
+            size = retained(lambda: Parser(model, mode).parse(make(n)))
+            print(f"{name:<8} {mode.value:<12} {size / n:>10.0f}")
+
+    for label, build in (
+        ("dicts", lambda: [row._asdict() for row in bids(n)]),
+        ("records", lambda: bids(n)),
+        ("columns", lambda: Columns.from_records(BidRecord, bids(n))),
+    ):
+        print(f"{'Bid':<8} {label:<12} {retained(build) / n:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Compare parsing many scraped pages inline and in a process pool.
+
+Parses synthetic season bids pages (see bench_html.py) the way
+``ExtraResource.get_bids`` does, inline and through a ProcessPoolExecutor:
+
+    python benchmarks/bench_parse_pool.py [--pages 32] [--rows 2000] [--workers N]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from bench_html import season_page
+
+from tabroom.resources.extra import BIDS
+from tabroom.scraping import Bs4Backend, HTMLPage, default_html_backend
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=32)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    page = HTMLPage(season_page(args.rows).encode())
+    print(f"{args.pages} pages, {args.workers} workers")
+    print(f"{'backend':<12} {'inline s':>9} {'pool s':>9} {'speedup':>8}")
+    for backend in (Bs4Backend(), default_html_backend()):
+        start = time.perf_counter()
+        for _ in range(args.pages):
+            BIDS.extract(page, backend, "104")
+        inline = time.perf_counter() - start
+
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            BIDS.extract_in(pool, page, backend, "104")  # start the workers
+            start = time.perf_counter()
+            futures = [
+                BIDS.submit(pool, page, backend, "104") for _ in range(args.pages)
+            ]
+            for future in futures:
+                BIDS.records(future.result())
+            pooled = time.perf_counter() - start
+        print(
+            f"{backend.name:<12} {inline:>9.3f} {pooled:>9.3f} {inline / pooled:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
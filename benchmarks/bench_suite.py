@@ -0,0 +1,332 @@
+"""
+Offline benchmark suite for the client against a local fake Tabroom.
+
+Starts the fake api and www hosts of fake_tabroom.py and measures per-call
+overhead, validation cost, scrape throughput and concurrency scaling. The
+results are written as JSON; pass an earlier file to ``--compare`` to see
+regressions between releases:
+
+    python benchmarks/bench_suite.py [--quick] [--output bench-results.json]
+    python benchmarks/bench_suite.py --compare bench-0.1.0.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import requests
+from bench_validation import best
+from fake_tabroom import COOKIE, FakeTabroom
+
+import tabroom
+from tabroom import (
+    AsyncTabroomClient,
+    Bs4Backend,
+    DebateEvent,
+    LxmlBackend,
+    ParseMode,
+    PoolLimits,
+    SelectolaxBackend,
+    TabroomClient,
+    use_parse_mode,
+)
+
+# Changes smaller than this are reported as noise by --compare
+THRESHOLD = 0.10
+
+
+class Suite:
+    """Collects timed results."""
+
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.results: list[dict[str, Any]] = []
+
+    def measure(
+        self, name: str, fn: Callable[[], Any], ops: int, **extra: Any
+    ) -> float:
+        """
+        Time ``fn`` (best of ``repeat`` runs after a warm-up) and record it.
+
+        Args:
+            name: Result name, ``group/case``
+            fn: Runs ``ops`` operations
+            ops: Operations per run: calls, rows, pages...
+            **extra: Stored with the result
+
+        Returns:
+            Seconds per operation
+        """
+        fn()
+        return self.record(name, best(fn, self.repeat), ops, **extra)
+
+    def record(self, name: str, seconds: float, ops: int, **extra: Any) -> float:
+        """Record a result timed elsewhere; returns seconds per operation."""
+        per_op = seconds / ops
+        self.results.append(
+            {
+                "name": name,
+                "seconds": seconds,
+                "ops": ops,
+                "per_op_us": per_op * 1e6,
+                "ops_per_s": ops / seconds,
+                **extra,
+            }
+        )
+        print(f"{name:<44} {per_op * 1e6:>11.1f} us/op {ops / seconds:>11.0f} ops/s")
+        return per_op
+
+
+def client_for(fake: FakeTabroom, **kwargs: Any) -> TabroomClient:
+    return TabroomClient(
+        api_base_url=fake.api_url,
+        site_base_url=fake.site_url,
+        username="bench",
+        password="bench",
+        **kwargs,
+    )
+
+
+def html_backends() -> list[Any]:
+    backends = [Bs4Backend()]
+    for backend in (LxmlBackend, SelectolaxBackend):
+        try:
+            backends.append(backend())
+        except ImportError:
+            pass
+    return backends
+
+
+def bench_import(suite: Suite, runs: int) -> None:
+    """Time ``import tabroom`` in fresh interpreters."""
+    source = os.path.dirname(os.path.dirname(tabroom.__file__))
+    env = {**os.environ, "PYTHONPATH": source}
+    code = (
+        "import time\nstart = time.perf_counter()\nimport tabroom\n"
+        "print(time.perf_counter() - start)"
+    )
+    seconds = min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    )
+    suite.record("import/tabroom", seconds, 1)
+
+
+def bench_overhead(suite: Suite, fake: FakeTabroom, calls: int) -> None:
+    """Per-call cost of the client over a bare requests session."""
+    session = requests.Session()
+    profile_url = f"{fake.api_url}/user/profile"
+    headers = {"Cookie": COOKIE}
+
+    def raw() -> None:
+        for _ in range(calls):
+            session.get(profile_url, headers=headers).json()
+
+    client = client_for(fake)
+    base = client._base_client
+    baseline = suite.measure("overhead/raw_requests", raw, calls)
+    cases = {
+        "overhead/get_profile": lambda: client.user.get_profile(),
+        "overhead/get_profile_no_model": lambda: base.get("/user/profile"),
+        "overhead/tab_dashboard": lambda: client.tab.tournament(1).get_dashboard(),
+    }
+    for name, call in cases.items():
+        run = lambda call=call: [call() for _ in range(calls)]  # noqa: E731
+        per_op = suite.measure(name, run, calls)
+        suite.results[-1]["overhead_us"] = (per_op - baseline) * 1e6
+    client.close()
+    session.close()
+
+
+def bench_validation(suite: Suite, fake: FakeTabroom, invites: int) -> None:
+    """Decoding and validating a large list response in every parse mode."""
+    client = client_for(fake)
+    suite.measure(
+        "validation/upcoming_raw",
+        lambda: client._base_client.get("/public/invite/upcoming"),
+        invites,
+    )
+    for mode in ParseMode:
+
+        def fetch(mode: ParseMode = mode) -> None:
+            with use_parse_mode(mode):
+                client.public.get_upcoming_tournaments()
+
+        suite.measure(f"validation/upcoming_{mode.value}", fetch, invites)
+    client.close()
+
+
+def bench_scrape(suite: Suite, fake: FakeTabroom) -> None:
+    """Rows scraped per second, per HTML backend and scraper."""
+    for backend in html_backends():
+        client = client_for(fake, html_backend=backend)
+        suite.measure(
+            f"scrape/get_bids_{backend.name}",
+            lambda: client.extra.get_bids(DebateEvent.POLICY),
+            fake.rows,
+        )
+        client.close()
+
+    client = client_for(fake)
+    suite.measure(
+        "scrape/iter_bids",
+        lambda: sum(1 for _ in client.extra.iter_bids(DebateEvent.POLICY)),
+        fake.rows,
+    )
+    with use_parse_mode("records"):
+        suite.measure(
+            "scrape/tournament_fields",
+            lambda: client.extra.get_tournament_fields("1"),
+            fake.events * fake.entries,
+            events=fake.events,
+        )
+    client.close()
+
+
+def bench_concurrency(
+    suite: Suite, fake: FakeTabroom, calls: int, levels: list[int]
+) -> None:
+    """Throughput of many dashboard and bids calls as parallelism grows."""
+    limits = PoolLimits(
+        api_max_connections=max(levels), site_max_connections=max(levels)
+    )
+    client = client_for(fake, pool_limits=limits)
+    tourns = list(range(calls))
+    events = list(DebateEvent)
+    for workers in levels:
+
+        def dashboards(workers: int = workers) -> None:
+            results = client.map_many(
+                lambda t: client.tab.tournament(t).get_dashboard(), tourns, workers
+            )
+            assert all(result.ok for result in results)
+
+        suite.measure(
+            f"concurrency/dashboards_threads_{workers}",
+            dashboards,
+            calls,
+            latency=fake.latency,
+        )
+        suite.measure(
+            f"concurrency/bids_many_threads_{workers}",
+            lambda workers=workers: client.extra.get_bids_many(
+                events, ["2025"], max_workers=workers
+            ),
+            len(events),
+            latency=fake.latency,
+        )
+    client.close()
+
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return
+
+    async def gather(concurrency: int) -> None:
+        async with AsyncTabroomClient(
+            api_base_url=fake.api_url,
+            site_base_url=fake.site_url,
+            username="bench",
+            password="bench",
+            pool_limits=limits,
+        ) as client:
+            results = await client.map_many(
+                lambda t: client.tab.tournament(t).get_dashboard(), tourns, concurrency
+            )
+            assert all(result.ok for result in results)
+
+    for concurrency in levels:
+        suite.measure(
+            f"concurrency/dashboards_async_{concurrency}",
+            lambda concurrency=concurrency: asyncio.run(gather(concurrency)),
+            calls,
+            latency=fake.latency,
+        )
+
+
+def compare(old: dict[str, Any], new: dict[str, Any]) -> None:
+    """Print the change of every result present in both runs."""
+    before = {result["name"]: result for result in old["results"]}
+    print(
+        f"\ncompared with tabroom {old['meta']['tabroom']} ({old['meta']['created']})"
+    )
+    print(f"{'benchmark':<44} {'before us':>11} {'after us':>11} {'change':>8}")
+    for result in new["results"]:
+        previous = before.get(result["name"])
+        if previous is None:
+            continue
+        change = result["per_op_us"] / previous["per_op_us"] - 1
+        flag = ""
+        if change > THRESHOLD:
+            flag = "  slower"
+        elif change < -THRESHOLD:
+            flag = "  faster"
+        print(
+            f"{result['name']:<44} {previous['per_op_us']:>11.1f} "
+            f"{result['per_op_us']:>11.1f} {change:>+7.0%}{flag}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="smaller, faster run")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--rows", type=int, default=2000, help="bids per page")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--output", default="bench-results.json")
+    parser.add_argument("--compare", help="earlier results file")
+    args = parser.parse_args()
+
+    calls = 50 if args.quick else 200
+    invites = 200 if args.quick else 1000
+    rows = 200 if args.quick else args.rows
+    events = 8 if args.quick else 40
+    levels = [1, 4, 16] if args.quick else [1, 2, 4, 8, 16]
+
+    suite = Suite(1 if args.quick else args.repeat)
+    bench_import(suite, 5 if args.quick else 20)
+    with FakeTabroom(rows=rows, events=events, invite_count=invites) as fake:
+        bench_overhead(suite, fake, calls)
+        bench_validation(suite, fake, invites)
+        bench_scrape(suite, fake)
+    with FakeTabroom(rows=rows, latency=args.latency) as fake:
+        bench_concurrency(suite, fake, calls // 2, levels)
+
+    report = {
+        "meta": {
+            "tabroom": tabroom.__version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "options": vars(args),
+        },
+        "results": suite.results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nwrote {len(suite.results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compare ways of turning decoded JSON lists into models.
+
+Runs offline against synthetic payloads shaped like the public invite list,
+search results and user profiles:
+
+    python benchmarks/bench_validation.py [--items 5000] [--repeat 5]
+"""
+
+import argparse
+import time
+from typing import Any, Callable
+
+from tabroom import Invite, ParseMode, Person, Search
+from tabroom.parsing import Parser
+
+
+def invites(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": f"Tournament {i}",
+            "tourn": {"id": i, "webname": f"t{i}", "start": "2024-09-01 08:00:00"},
+            "circuit": 6,
+        }
+        for i in range(n)
+    ]
+
+
+def searches(n: int) -> list[dict[str, Any]]:
+    return [{"result": f"Result {i}"} for i in range(n)]
+
+
+def people(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "email": f"user{i}@example.com",
+            "first": "First",
+            "last": "Last",
+            "nsda": 100000 + i,
+            "no_email": False,
+            "last_access": "2024-01-02 03:04:05",
+            "pass_timstamp": "2023-06-07 08:09:10",
+        }
+        for i in range(n)
+    ]
+
+
+def best(fn: Callable[[], Any], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("Invite", Invite, invites, "name"),
+        ("Search", Search, searches, "result"),
+        ("Person", Person, people, "id"),
+    ]
+    print(f"{'model':<8} {'strategy':<16} {'seconds':>9} {'speedup':>8}")
+    for name, model, make, field in cases:
+        data = make(args.items)
+        strategies = {
+            "per-item": lambda: [model.model_validate(item) for item in data],
+            "TypeAdapter": lambda: Parser(model).parse(data),
+            "trusted": lambda: Parser(model, ParseMode.TRUSTED).parse(data),
+            # Bulk jobs typically read one or two fields per record
+            f"lazy (.{field})": lambda: [
+                getattr(view, field)
+                for view in Parser(model, ParseMode.LAZY).parse(data)
+            ],
+        }
+        baseline = None
+        for label, fn in strategies.items():
+            fn()  # warm up schema and adapter caches
+            seconds = best(fn, args.repeat)
+            baseline = baseline or seconds
+            print(f"{name:<8} {label:<16} {seconds:>9.4f} {baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+"""
+Local fake of api.tabroom.com and www.tabroom.com for offline benchmarks.
+
+Serves the endpoints the client uses, with realistic payload sizes:
+
+- www: the cookie login form, ``toc_bids.mhtml`` (one table per requested
+  event) and ``fields.mhtml``
+- api: ``/user/profile``, ``/tab/*`` dashboards (login required) and
+  ``/public/invite/*``
+
+Payloads are rendered once, so the server's own cost stays small next to the
+client's. Run it standalone to poke at it with a client:
+
+    python benchmarks/fake_tabroom.py [--latency 0.02]
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from bench_validation import invites, people
+
+TOKEN = "fake-session-token"
+COOKIE = f"TabroomToken={TOKEN}"
+
+
+def dashboard(tourn_id: int, rounds: int = 12, sections: int = 60) -> dict[str, Any]:
+    """A tournament dashboard: rounds with their sections and judges."""
+    return {
+        "tourn": {"id": tourn_id, "name": f"Tournament {tourn_id}"},
+        "rounds": [
+            {
+                "id": tourn_id * 100 + r,
+                "name": f"Round {r}",
+                "start": "2024-11-02 08:00:00",
+                "sections": [
+                    {
+                        "id": r * 1000 + s,
+                        "room": f"Room {s}",
+                        "judges": [
+                            {"id": s * 3 + j, "checked_in": j % 2 == 0}
+                            for j in range(3)
+                        ],
+                        "entries": [f"Entry {s}A", f"Entry {s}B"],
+                        "status": "started" if s % 4 else "pending",
+                    }
+                    for s in range(sections)
+                ],
+            }
+            for r in range(rounds)
+        ],
+    }
+
+
+def table_page(
+    table_id: str, header: tuple[str, ...], rows: list[tuple[str, ...]]
+) -> bytes:
+    """A Tabroom-like page: navigation, then the table."""
+    cell = "\t<td>\n\t\t{}\n\t</td>\n"
+    body = "".join(
+        "<tr>\n" + "".join(map(cell.format, row)) + "</tr>\n" for row in rows
+    )
+    head = "".join(f"<th>{name}</th>" for name in header)
+    link = "<li><a href='/index/tourn/{0}'>Link {0}</a></li>"
+    menu = "".join(map(link.format, range(200)))
+    return (
+        '<html><head><meta charset="utf-8"><title>Tabroom</title></head><body>'
+        f'<ul id="menu">{menu}</ul>'
+        f'<table id="{table_id}">\n<thead><tr>{head}</tr></thead>\n'
+        f"<tbody>\n{body}</tbody>\n</table>\n</body></html>"
+    ).encode()
+
+
+class FakeTabroom:
+    """
+    Both Tabroom hosts on two local ports.
+
+    Example:
+        >>> with FakeTabroom(rows=500) as fake:
+        ...     client = TabroomClient(
+        ...         api_base_url=fake.api_url, site_base_url=fake.site_url
+        ...     )
+    """
+
+    def __init__(
+        self,
+        rows: int = 2000,
+        events: int = 40,
+        entries: int = 200,
+        invite_count: int = 1000,
+        latency: float = 0.0,
+    ):
+        """
+        Initialize the fake.
+
+        Args:
+            rows: Bids per toc_bids table
+            events: Events listed in each tournament invite
+            entries: Entries per fields page
+            invite_count: Invites in the upcoming list
+            latency: Seconds each response is delayed, to mimic the network
+        """
+        self.rows = rows
+        self.events = events
+        self.entries = entries
+        self.latency = latency
+        self.hits: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.profile = json.dumps(people(1)[0]).encode()
+        self.upcoming = json.dumps(invites(invite_count)).encode()
+        self._servers: list[ThreadingHTTPServer] = []
+
+    @lru_cache(maxsize=None)
+    def dashboard(self, tourn_id: int) -> bytes:
+        return json.dumps(dashboard(tourn_id)).encode()
+
+    @lru_cache(maxsize=None)
+    def invite(self, tourn_id: int) -> bytes:
+        events = [
+            {"id": tourn_id * 1000 + e, "name": f"Event {e}"}
+            for e in range(self.events)
+        ]
+        return json.dumps({"tourn": {"id": tourn_id}, "events": events}).encode()
+
+    @lru_cache(maxsize=None)
+    def bids(self, code: str, year: str) -> bytes:
+        rows = [
+            (f"School {i}", "TX", f"School {i} {code}", str(i % 6))
+            for i in range(self.rows)
+        ]
+        return table_page(code, ("School", "State", "Entry", "Bids"), rows)
+
+    @lru_cache(maxsize=None)
+    def fields(self, event_id: str) -> bytes:
+        rows = [
+            (f"School {i}", "Austin, TX", f"School {i} {event_id}", f"S{i}")
+            for i in range(self.entries)
+        ]
+        return table_page("fieldsort", ("School", "Location", "Entry", "Code"), rows)
+
+    def count(self, route: str) -> None:
+        with self._lock:
+            self.hits[route] = self.hits.get(route, 0) + 1
+
+    def __enter__(self) -> "FakeTabroom":
+        for handler in (ApiHandler, SiteHandler):
+            server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+            server.daemon_threads = True
+            server.fake = self
+            self._servers.append(server)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        api, site = (server.server_address[1] for server in self._servers)
+        self.api_url = f"http://127.0.0.1:{api}/v1"
+        self.site_url = f"http://127.0.0.1:{site}"
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        self._servers.clear()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY every
+    # keep-alive response stalls on delayed ACKs
+    disable_nagle_algorithm = True
+    routes: list[tuple[str, re.Pattern, str, bool]] = []
+
+    @property
+    def fake(self) -> FakeTabroom:
+        return self.server.fake
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        form = parse_qs(self.rfile.read(length).decode()) if length else {}
+        form.update(parse_qs(url.query))
+        if self.fake.latency:
+            time.sleep(self.fake.latency)
+
+        for route_method, pattern, name, private in self.routes:
+            match = pattern.fullmatch(url.path)
+            if match is None or route_method != method:
+                continue
+            if private and COOKIE not in (self.headers.get("Cookie") or ""):
+                return self._send(401, b'{"message": "Not logged in"}')
+            self.fake.count(name)
+            return getattr(self, name)(match, form)
+        self._send(404, b'{"message": "Not found"}')
+
+    def _send(
+        self,
+        status: int,
+        body: bytes,
+        content_type: str = "application/json",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ApiHandler(_Handler):
+    routes = [
+        ("GET", re.compile(r"/v1/user/profile(?:/\d+)?"), "profile", True),
+        ("GET", re.compile(r"/v1/tab/(\d+)/.+/dashboard"), "tab_dashboard", True),
+        ("GET", re.compile(r"/v1/public/invite/upcoming(?:/\d+)?"), "upcoming", False),
+        ("GET", re.compile(r"/v1/public/invite/tourn/(\d+)"), "invite", False),
+    ]
+
+    def profile(self, match: re.Match, form: dict) -> None:
+        self._send(200, self.fake.profile)
+
+    def tab_dashboard(self, match: re.Match, form: dict) -> None:
+        self._send(200, self.fake.dashboard(int(match.group(1))))
+
+    def upcoming(self, match: re.Match, form: dict) -> None:
+        self._send(200, self.fake.upcoming)
+
+    def invite(self, match: re.Match, form: dict) -> None:
+        self._send(200, self.fake.invite(int(match.group(1))))
+
+
+class SiteHandler(_Handler):
+    routes = [
+        ("POST", re.compile(r"/user/login/login_save\.mhtml"), "login", False),
+        ("POST", re.compile(r"/index/results/toc_bids\.mhtml"), "toc_bids", False),
+        ("GET", re.compile(r"/index/tourn/fields\.mhtml"), "fields", False),
+    ]
+
+    def login(self, match: re.Match, form: dict) -> None:
+        if not form.get("password"):
+            return self._send(200, b"<html>Login failed</html>", "text/html")
+        cookie = f"{COOKIE}; Path=/; HttpOnly"
+        self._send(200, b"<html>ok</html>", "text/html", {"Set-Cookie": cookie})
+
+    def toc_bids(self, match: re.Match, form: dict) -> None:
+        code, year = form["code"][0], form.get("year", ["2025"])[0]
+        self._send(200, self.fake.bids(code, year), "text/html; charset=utf-8")
+
+    def fields(self, match: re.Match, form: dict) -> None:
+        page = self.fake.fields(form["event_id"][0])
+        self._send(200, page, "text/html; charset=utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with FakeTabroom(latency=args.latency) as fake:
+        print(f"api:  {fake.api_url}\nwww:  {fake.site_url}\nCtrl-C to stop")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,215 +2,160 @@
 Tabroom API Client
 
 A Python client library for the Tabroom.com API with type-safe models and organized resources.
-"""
-
-from .client import BaseClient
-from .exceptions import (
-    TabroomAPIError,
-    TabroomAuthError,
-    TabroomError,
-    TabroomNotFoundError,
-    TabroomServerError,
-    TabroomValidationError,
-)
-from .models import (
-    Ad,
-    CaselistLink,
-    Chapter,
-    Err,
-    Event,
-    Invite,
-    LoginRequest,
-    Person,
-    Round,
-    School,
-    SchoolSetting,
-    Search,
-    Session,
-    Share,
-    Student,
-)
-from .resources import (
-    AccessResource,
-    CaselistResource,
-    ExtraResource,
-    NsdaResource,
-    PaymentResource,
-    PublicResource,
-    ShareResource,
-    SystemResource,
-    TabResource,
-    UserResource,
-)
-from .types import DebateEvent
-
-
-class TabroomClient:
-    """
-    Main client for interacting with the Tabroom API.
-
-    Example:
-        >>> client = TabroomClient(username="user@example.com", password="password")
-        >>> profile = client.user.get_profile()
-        >>> tournaments = client.public.search_tournaments("future", "TOC")
-        >>> dashboard = client.tab.tournament(123).get_dashboard()
-    """
-
-    def __init__(
-        self,
-        api_base_url: str = "https://api.tabroom.com/v1",
-        site_base_url: str = "https://www.tabroom.com",
-        username: str | None = None,
-        password: str | None = None,
-        token: str | None = None,
-        timeout: float = 30.0,
-        auto_login: bool = True,
-    ):
-        """
-        Initialize the Tabroom API client.
-
-        Args:
-            api_base_url: Base URL for API endpoints (default: https://api.tabroom.com/v1)
-            auth_base_url: Base URL for authentication (default: https://www.tabroom.com)
-            username: Username for login
-            password: Password for login
-            token: Optional existing TabroomToken (skips login if provided)
-            timeout: Request timeout in seconds (default: 30.0)
-            auto_login: Automatically login if username/password provided (default: True)
-        """
-        self._base_client = BaseClient(
-            api_base_url=api_base_url,
-            site_base_url=site_base_url,
-            username=username,
-            password=password,
-            token=token,
-            timeout=timeout,
-            auto_login=auto_login,
-        )
-
-        # Initialize resources lazily
-        self._user_resource: UserResource | None = None
-        self._public_resource: PublicResource | None = None
-        self._tab_resource: TabResource | None = None
-        self._access_resource: AccessResource | None = None
-        self._caselist_resource: CaselistResource | None = None
-        self._nsda_resource: NsdaResource | None = None
-        self._share_resource: ShareResource | None = None
-        self._payment_resource: PaymentResource | None = None
-        self._system_resource: SystemResource | None = None
-        self._extra_resource: ExtraResource | None = None
-
-    def login(self, username: str, password: str) -> None:
-        """
-        Log in to Tabroom.
-
-        Args:
-            username: Username
-            password: Password
-        """
-        self._base_client.login(username, password)
-
-    def logout(self) -> None:
-        """Log out and clear authentication."""
-        self._base_client.logout()
-
-    def is_authenticated(self) -> bool:
-        """Check if client is authenticated."""
-        return self._base_client.is_authenticated()
-
-    @property
-    def token(self) -> str | None:
-        """Get the current authentication token."""
-        return self._base_client.token
 
-    @property
-    def user(self) -> UserResource:
-        """Access user profile operations."""
-        if self._user_resource is None:
-            self._user_resource = UserResource(self._base_client)
-        return self._user_resource
-
-    @property
-    def public(self) -> PublicResource:
-        """Access public tournament search and listing operations."""
-        if self._public_resource is None:
-            self._public_resource = PublicResource(self._base_client)
-        return self._public_resource
-
-    @property
-    def tab(self) -> TabResource:
-        """Access tournament tabulation operations."""
-        if self._tab_resource is None:
-            self._tab_resource = TabResource(self._base_client)
-        return self._tab_resource
-
-    @property
-    def access(self) -> AccessResource:
-        """Access permission and access control operations."""
-        if self._access_resource is None:
-            self._access_resource = AccessResource(self._base_client)
-        return self._access_resource
-
-    @property
-    def caselist(self) -> CaselistResource:
-        """Access caselist integration operations."""
-        if self._caselist_resource is None:
-            self._caselist_resource = CaselistResource(self._base_client)
-        return self._caselist_resource
-
-    @property
-    def nsda(self) -> NsdaResource:
-        """Access NSDA integration operations."""
-        if self._nsda_resource is None:
-            self._nsda_resource = NsdaResource(self._base_client)
-        return self._nsda_resource
-
-    @property
-    def share(self) -> ShareResource:
-        """Access document sharing operations."""
-        if self._share_resource is None:
-            self._share_resource = ShareResource(self._base_client)
-        return self._share_resource
-
-    @property
-    def payment(self) -> PaymentResource:
-        """Access payment processing operations."""
-        if self._payment_resource is None:
-            self._payment_resource = PaymentResource(self._base_client)
-        return self._payment_resource
-
-    @property
-    def system(self) -> SystemResource:
-        """Access system status operations."""
-        if self._system_resource is None:
-            self._system_resource = SystemResource(self._base_client)
-        return self._system_resource
-
-    @property
-    def extra(self) -> ExtraResource:
-        """Access extra status operations."""
-        if self._extra_resource is None:
-            self._extra_resource = ExtraResource(self._base_client)
-        return self._extra_resource
-
-    def close(self) -> None:
-        """Close the HTTP client connection."""
-        self._base_client.close()
-
-    def __enter__(self):
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
+Names are imported from their modules on first use, so ``import tabroom`` is
+cheap and e.g. BeautifulSoup and unused models are only loaded when needed.
+"""
 
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .async_client import AsyncBaseClient
+    from .async_tabroom_client import AsyncTabroomClient
+    from .batch import BatchResult, run_batch, run_batch_async
+    from .cache import CachePolicy, ResponseCache
+    from .changes import Change, ChangeKind, ChangeTracker
+    from .client import BaseClient
+    from .codec import JSONCodec, MsgspecCodec, OrjsonCodec, StdlibCodec
+    from .exceptions import (
+        TabroomAPIError,
+        TabroomAuthError,
+        TabroomError,
+        TabroomNotFoundError,
+        TabroomServerError,
+        TabroomValidationError,
+    )
+    from .http_cache import FileCacheStorage, HTTPCache, MemoryCacheStorage
+    from .models import (
+        Ad,
+        CaselistLink,
+        Chapter,
+        Err,
+        Event,
+        Invite,
+        LoginRequest,
+        Person,
+        Round,
+        School,
+        SchoolSetting,
+        Search,
+        Session,
+        Share,
+        Student,
+    )
+    from .parsing import ModelView, ParseMode, use_parse_mode
+    from .pool import PoolLimits
+    from .ratelimit import (
+        MemoryBucketBackend,
+        RateLimit,
+        RateLimiter,
+        SQLiteBucketBackend,
+    )
+    from .records import Columns, record_type
+    from .resources import (
+        AccessResource,
+        AsyncExtraResource,
+        CaselistResource,
+        ExtraResource,
+        NsdaResource,
+        PaymentResource,
+        PublicResource,
+        ShareResource,
+        SystemResource,
+        TabResource,
+        UserResource,
+    )
+    from .retry import RetryBudget, RetryPolicy
+    from .scraping import Bs4Backend, HTMLBackend, LxmlBackend, SelectolaxBackend
+    from .snapshots import SnapshotStore
+    from .tables import Column, TableSpec
+    from .tabroom_client import TabroomClient
+    from .types import DebateEvent
+
+_EXPORTS = {
+    "AsyncBaseClient": ".async_client",
+    "AsyncTabroomClient": ".async_tabroom_client",
+    "BatchResult": ".batch",
+    "run_batch": ".batch",
+    "run_batch_async": ".batch",
+    "CachePolicy": ".cache",
+    "ResponseCache": ".cache",
+    "Change": ".changes",
+    "ChangeKind": ".changes",
+    "ChangeTracker": ".changes",
+    "BaseClient": ".client",
+    "JSONCodec": ".codec",
+    "MsgspecCodec": ".codec",
+    "OrjsonCodec": ".codec",
+    "StdlibCodec": ".codec",
+    "TabroomAPIError": ".exceptions",
+    "TabroomAuthError": ".exceptions",
+    "TabroomError": ".exceptions",
+    "TabroomNotFoundError": ".exceptions",
+    "TabroomServerError": ".exceptions",
+    "TabroomValidationError": ".exceptions",
+    "FileCacheStorage": ".http_cache",
+    "HTTPCache": ".http_cache",
+    "MemoryCacheStorage": ".http_cache",
+    "Ad": ".models",
+    "CaselistLink": ".models",
+    "Chapter": ".models",
+    "Err": ".models",
+    "Event": ".models",
+    "Invite": ".models",
+    "LoginRequest": ".models",
+    "Person": ".models",
+    "Round": ".models",
+    "School": ".models",
+    "SchoolSetting": ".models",
+    "Search": ".models",
+    "Session": ".models",
+    "Share": ".models",
+    "Student": ".models",
+    "ModelView": ".parsing",
+    "ParseMode": ".parsing",
+    "use_parse_mode": ".parsing",
+    "PoolLimits": ".pool",
+    "MemoryBucketBackend": ".ratelimit",
+    "RateLimit": ".ratelimit",
+    "RateLimiter": ".ratelimit",
+    "SQLiteBucketBackend": ".ratelimit",
+    "Columns": ".records",
+    "record_type": ".records",
+    "AccessResource": ".resources",
+    "AsyncExtraResource": ".resources",
+    "CaselistResource": ".resources",
+    "ExtraResource": ".resources",
+    "NsdaResource": ".resources",
+    "PaymentResource": ".resources",
+    "PublicResource": ".resources",
+    "ShareResource": ".resources",
+    "SystemResource": ".resources",
+    "TabResource": ".resources",
+    "UserResource": ".resources",
+    "RetryBudget": ".retry",
+    "RetryPolicy": ".retry",
+    "Bs4Backend": ".scraping",
+    "HTMLBackend": ".scraping",
+    "LxmlBackend": ".scraping",
+    "SelectolaxBackend": ".scraping",
+    "SnapshotStore": ".snapshots",
+    "Column": ".tables",
+    "TableSpec": ".tables",
+    "TabroomClient": ".tabroom_client",
+    "DebateEvent": ".types",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __version__ = "0.1.1"
 
 __all__ = [
     # Main client
     "TabroomClient",
+    "AsyncTabroomClient",
     # Exceptions
     "TabroomError",
     "TabroomAuthError",
@@ -245,6 +190,40 @@ __all__ = [
     "PaymentResource",
     "SystemResource",
     "ExtraResource",
+    "AsyncExtraResource",
+    "BatchResult",
+    # Configuration
+    "PoolLimits",
+    "RetryPolicy",
+    "RetryBudget",
+    "RateLimit",
+    "RateLimiter",
+    "MemoryBucketBackend",
+    "SQLiteBucketBackend",
+    "HTTPCache",
+    "MemoryCacheStorage",
+    "FileCacheStorage",
+    "ResponseCache",
+    "CachePolicy",
+    "JSONCodec",
+    "StdlibCodec",
+    "OrjsonCodec",
+    "MsgspecCodec",
+    "ParseMode",
+    "ModelView",
+    "Columns",
+    "record_type",
+    "HTMLBackend",
+    "Bs4Backend",
+    "LxmlBackend",
+    "SelectolaxBackend",
+    "TableSpec",
+    "Column",
+    "SnapshotStore",
+    "ChangeTracker",
+    "Change",
+    "ChangeKind",
+    "use_parse_mode",
     # Common Types
     "DebateEvent",
 ]
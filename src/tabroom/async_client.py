@@ -0,0 +1,447 @@
+"""Asynchronous HTTP client for Tabroom API."""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, AsyncIterator
+
+from .cache import CachePolicy, CacheState, ResponseCache
+from .client import COOKIE_NAME, ClientCore, T
+from .coalesce import AsyncSingleFlight
+from .codec import JSONCodec, default_codec
+from .exceptions import TabroomAPIError, TabroomAuthError
+from .http_cache import HTTPCache
+from .parsing import Parser, ParseMode
+from .pool import PoolLimits
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .streaming import JSONArrayDecoder
+
+if TYPE_CHECKING:
+    from .scraping import HTMLBackend, HTMLPage, HTMLStream
+    from .snapshots import SnapshotStore
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncBaseClient(ClientCore):
+    """
+    Asyncio HTTP client with cookie-based authentication and error handling.
+
+    Mirrors :class:`~tabroom.client.BaseClient` on top of ``httpx.AsyncClient``.
+    Every request method is a coroutine, so resources built on this client
+    return awaitables.
+    """
+
+    # httpx takes raw bytes as content=; data= is for forms
+    _body_key = "content"
+
+    def __init__(
+        self,
+        api_base_url: str = "https://api.tabroom.com/v1",
+        site_base_url: str = "https://www.tabroom.com",
+        username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+        timeout: float = 30.0,
+        auto_login: bool = True,
+        pool_limits: PoolLimits | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http_cache: HTTPCache | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        codec: JSONCodec | None = None,
+        parse_mode: ParseMode | str = ParseMode.VALIDATE,
+        html_backend: "HTMLBackend | None" = None,
+        parse_executor: Executor | None = None,
+        snapshots: "SnapshotStore | None" = None,
+    ):
+        """
+        Initialize the async base client.
+
+        Login cannot run in a constructor, so with ``auto_login`` the cookie
+        login happens on the first request (or on ``async with`` entry).
+
+        Args:
+            api_base_url: Base URL for API endpoints
+            site_base_url: Base URL for the main site
+            username: Username for login
+            password: Password for login
+            token: Optional existing TabroomToken (skips login if provided)
+            timeout: Request timeout in seconds
+            auto_login: Automatically login if username/password provided
+            pool_limits: Connection pool sizing; httpx has no per-host limit,
+                so the per-host maximums are summed into one pool
+            retry: Retry policy for transient failures (default: no retries)
+            rate_limiter: Client-side pacing applied to every attempt
+            http_cache: Conditional-request cache for GET responses
+            cache: TTL cache of parsed GET results
+            coalesce: Share one request between identical concurrent GETs
+            codec: JSON codec (default: orjson or msgspec if installed, else stdlib)
+            parse_mode: Default model parsing mode (see :class:`ParseMode`)
+            html_backend: HTML parser for scraped pages (default: selectolax or
+                lxml if installed, else BeautifulSoup)
+            parse_executor: Executor, e.g. a ProcessPoolExecutor, that parses
+                scraped pages off the calling thread (default: parse inline)
+            snapshots: Reuses the rows of scraped pages whose body is unchanged
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncBaseClient requires httpx: pip install 'tabroom[async]'"
+            )
+
+        self._configure(api_base_url, site_base_url, username, password, timeout)
+        self.pool_limits = pool_limits or PoolLimits()
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.http_cache = http_cache
+        self.cache = cache
+        # Pending background refreshes and the cache key each one claimed
+        self._refresh_tasks: dict[asyncio.Task, str] = {}
+        self._flights = AsyncSingleFlight() if coalesce else None
+        self.codec = codec or default_codec()
+        self.parse_mode = ParseMode(parse_mode)
+        self.html_backend = html_backend
+        self.parse_executor = parse_executor
+        self.snapshots = snapshots
+
+        limits = httpx.Limits(
+            max_connections=self.pool_limits.max_connections,
+            max_keepalive_connections=(
+                self.pool_limits.max_connections if self.pool_limits.keep_alive else 0
+            ),
+            keepalive_expiry=self.pool_limits.keepalive_expiry,
+        )
+        # requests follows redirects by default; match it for the login form
+        self._client = httpx.AsyncClient(follow_redirects=True, limits=limits)
+
+        if token:
+            self._client.cookies.set(COOKIE_NAME, token, domain=".tabroom.com")
+
+        self._login_pending = bool(auto_login and username and password and not token)
+        self._login_lock = asyncio.Lock()
+
+    async def login(self, username: str, password: str) -> None:
+        """
+        Log in to Tabroom and obtain authentication cookie.
+
+        Args:
+            username: Username
+            password: Password
+
+        Raises:
+            TabroomAuthError: If login fails
+        """
+        try:
+            response = await self._client.post(
+                self._login_url(),
+                data={"username": username, "password": password},
+            )
+        except httpx.HTTPError as e:
+            raise TabroomAuthError(f"Login request failed: {str(e)}")
+
+        self._check_login(response, username, password)
+        self._login_pending = False
+
+    async def _ensure_login(self) -> None:
+        """Run the deferred auto-login exactly once, even under concurrency."""
+        if not self._login_pending:
+            return
+        async with self._login_lock:
+            username, password = self.username, self.password
+            if self._login_pending and username and password:
+                await self.login(username, password)
+
+    async def _attempt(
+        self, method: str, url: str, stream: bool = False, **kwargs: Any
+    ) -> Any:
+        """Send a single attempt, waiting for the rate limiter first."""
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve(url)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        if stream:
+            request = self._client.build_request(method, url, **kwargs)
+            return await self._client.send(request, stream=True)
+        return await self._client.request(method, url, **kwargs)
+
+    async def _send(
+        self, method: str, url: str, stream: bool = False, **kwargs: Any
+    ) -> Any:
+        """Send a request, retrying transient failures per ``self.retry``."""
+        policy = self.retry
+        if policy is None:
+            return await self._attempt(method, url, stream, **kwargs)
+
+        policy.begin()
+        attempt = 0
+        while True:
+            try:
+                response = await self._attempt(method, url, stream, **kwargs)
+            except httpx.TransportError:
+                delay = policy.delay(method, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = policy.delay(
+                    method,
+                    attempt,
+                    response.status_code,
+                    response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        response_model: type[T] | None = None,
+        **kwargs: Any,
+    ) -> T | dict[str, Any] | list[Any] | None:
+        """
+        Make an HTTP request to the API.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            response_model: Pydantic model to parse response into
+            **kwargs: Additional arguments to pass to httpx; ``parse_mode``
+                overrides the client's parse mode for this call
+
+        Returns:
+            Parsed response data
+
+        Raises:
+            TabroomError: On API errors
+        """
+        parser = self._parser(response_model, kwargs.pop("parse_mode", None))
+        cache = self.cache
+        plan = self._cache_plan(method, path, parser, kwargs)
+        if cache is None or plan is None:
+            result, _ = await self._fetch_shared(method, path, parser, kwargs)
+            if cache is not None and method.upper() != "GET":
+                cache.invalidate(path)
+            return result
+
+        key, policy = plan
+        state, value = cache.lookup(key)
+        if state is CacheState.FRESH:
+            return value
+        if state is CacheState.STALE:
+            if cache.begin_refresh(key):
+                task = asyncio.create_task(
+                    self._refresh(cache, key, policy, method, path, parser, kwargs)
+                )
+                self._refresh_tasks[task] = key
+                task.add_done_callback(self._forget_refresh)
+            return value
+
+        result, size = await self._fetch_shared(method, path, parser, kwargs)
+        cache.put(key, path, result, size, policy)
+        return result
+
+    async def _refresh(
+        self,
+        cache: ResponseCache,
+        key: str,
+        policy: CachePolicy,
+        method: str,
+        path: str,
+        parser: Parser,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Re-fetch a stale cache entry in the background."""
+        try:
+            result, size = await self._fetch(method, path, parser, dict(kwargs))
+        except Exception:
+            cache.end_refresh(key)
+            return
+        cache.put(key, path, result, size, policy)
+
+    def _forget_refresh(self, task: asyncio.Task) -> None:
+        self._refresh_tasks.pop(task, None)
+
+    async def _fetch_shared(
+        self, method: str, path: str, parser: Parser, kwargs: dict[str, Any]
+    ) -> tuple[T | dict[str, Any] | list[Any] | None, int]:
+        """Fetch, coalescing identical concurrent GETs into one request."""
+        key = self._flight_key(method, path, parser, kwargs)
+        if self._flights is None or key is None:
+            return await self._fetch(method, path, parser, kwargs)
+        return await self._flights.do(
+            key, lambda: self._fetch(method, path, parser, kwargs)
+        )
+
+    async def _fetch(
+        self, method: str, path: str, parser: Parser, kwargs: dict[str, Any]
+    ) -> tuple[T | dict[str, Any] | list[Any] | None, int]:
+        """Send a request and parse it, returning the result and body size."""
+        await self._ensure_login()
+        url, headers = self._prepare(self.api_base_url, path, kwargs)
+        key, entry = self._cache_lookup(method, url, headers, kwargs)
+
+        try:
+            response = await self._send(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError as e:
+            raise TabroomAPIError(f"HTTP error occurred: {str(e)}")
+
+        result = self._cached_response(response, parser, key, entry)
+        return result, self._body_size(response, entry)
+
+    async def stream_json(
+        self,
+        method: str,
+        path: str,
+        response_model: type[T] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[T | Any]:
+        """
+        Stream a JSON list response, yielding each element as it arrives.
+
+        See :meth:`tabroom.client.BaseClient.stream_json`.
+        """
+        parser = self._parser(response_model, kwargs.pop("parse_mode", None))
+        await self._ensure_login()
+        url, headers = self._prepare(self.api_base_url, path, kwargs)
+
+        try:
+            response = await self._send(
+                method, url, stream=True, headers=headers, **kwargs
+            )
+            try:
+                if response.status_code >= 400:
+                    await response.aread()
+                    self._handle_error(response)
+
+                decoder = JSONArrayDecoder()
+                async for chunk in response.aiter_bytes():
+                    for item in decoder.feed(chunk):
+                        yield parser.parse_item(item)
+                for item in decoder.close():
+                    yield parser.parse_item(item)
+            finally:
+                await response.aclose()
+        except httpx.HTTPError as e:
+            raise TabroomAPIError(f"HTTP error occurred: {str(e)}")
+        except ValueError as e:
+            raise TabroomAPIError(f"Invalid JSON response: {str(e)}")
+
+    async def request_html(
+        self, path: str, method: str, stream: bool = False, **kwargs: Any
+    ) -> "str | HTMLStream | None":
+        """
+        Returns html content of a webpath
+
+        See :meth:`tabroom.client.BaseClient.request_html`; iterate a
+        streamed page with ``async for`` and release it with ``aclose()``.
+        """
+        if stream:
+            return await self._stream_html(path, method, kwargs)
+        page = await self.request_html_page(path, method, **kwargs)
+        return None if page is None else page.text
+
+    async def _stream_html(
+        self, path: str, method: str, kwargs: dict[str, Any]
+    ) -> "HTMLStream":
+        from .scraping import HTMLStream
+
+        await self._ensure_login()
+        url, headers = self._prepare(self.site_base_url, path, kwargs)
+        try:
+            response = await self._send(
+                method, url, stream=True, headers=headers, **kwargs
+            )
+        except httpx.HTTPError as e:
+            raise TabroomAPIError(f"HTTP error occured: {str(e)}")
+
+        if response.status_code >= 400:
+            try:
+                await response.aread()
+                self._handle_error(response)
+            finally:
+                await response.aclose()
+
+        async def chunks() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+            except httpx.HTTPError as e:
+                raise TabroomAPIError(f"HTTP error occured: {str(e)}")
+
+        return HTMLStream(
+            chunks(), response.headers.get("Content-Type"), response.aclose
+        )
+
+    async def request_html_page(
+        self, path: str, method: str, **kwargs: Any
+    ) -> "HTMLPage | None":
+        """
+        Fetch a web page as raw bytes plus its charset.
+
+        See :meth:`tabroom.client.BaseClient.request_html_page`.
+        """
+        await self._ensure_login()
+        url, headers = self._prepare(self.site_base_url, path, kwargs)
+
+        try:
+            response = await self._send(method, url, headers=headers, **kwargs)
+        except httpx.HTTPError as e:
+            raise TabroomAPIError(f"HTTP error occured: {str(e)}")
+
+        return self._html_page(response)
+
+    async def get(
+        self, path: str, response_model: type[T] | None = None, **kwargs: Any
+    ) -> T | dict[str, Any] | list[Any] | None:
+        """Make a GET request."""
+        return await self.request("GET", path, response_model=response_model, **kwargs)
+
+    async def post(
+        self, path: str, response_model: type[T] | None = None, **kwargs: Any
+    ) -> T | dict[str, Any] | list[Any] | None:
+        """Make a POST request."""
+        return await self.request("POST", path, response_model=response_model, **kwargs)
+
+    async def put(
+        self, path: str, response_model: type[T] | None = None, **kwargs: Any
+    ) -> T | dict[str, Any] | list[Any] | None:
+        """Make a PUT request."""
+        return await self.request("PUT", path, response_model=response_model, **kwargs)
+
+    async def delete(
+        self, path: str, response_model: type[T] | None = None, **kwargs: Any
+    ) -> T | dict[str, Any] | list[Any] | None:
+        """Make a DELETE request."""
+        return await self.request(
+            "DELETE", path, response_model=response_model, **kwargs
+        )
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        for task, key in list(self._refresh_tasks.items()):
+            task.cancel()
+            # The cache may be shared; release the claim so others can refresh
+            if self.cache is not None:
+                self.cache.end_refresh(key)
+        self._refresh_tasks.clear()
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self._ensure_login()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,277 @@
+"""High-level asyncio Tabroom client."""
+
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, TypeVar
+
+from . import resources
+from .async_client import AsyncBaseClient
+from .batch import BatchResult, run_batch_async
+from .cache import ResponseCache
+from .codec import JSONCodec
+from .http_cache import HTTPCache
+from .parsing import ParseMode
+from .pool import PoolLimits
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from .resources import (
+        AccessResource,
+        AsyncExtraResource,
+        CaselistResource,
+        NsdaResource,
+        PaymentResource,
+        PublicResource,
+        ShareResource,
+        SystemResource,
+        TabResource,
+        UserResource,
+    )
+    from .scraping import HTMLBackend
+    from .snapshots import SnapshotStore
+
+R = TypeVar("R")
+
+
+class AsyncTabroomClient:
+    """
+    Asyncio client for interacting with the Tabroom API.
+
+    Exposes the same resources as :class:`TabroomClient`, but every endpoint
+    method returns an awaitable. Requires the ``async`` extra (httpx).
+
+    Example:
+        >>> async with AsyncTabroomClient(username="user@example.com", password="pw") as client:
+        ...     profile = await client.user.get_profile()
+        ...     dashboards = await asyncio.gather(
+        ...         *(client.tab.tournament(t).get_dashboard() for t in tourn_ids)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        api_base_url: str = "https://api.tabroom.com/v1",
+        site_base_url: str = "https://www.tabroom.com",
+        username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+        timeout: float = 30.0,
+        auto_login: bool = True,
+        pool_limits: PoolLimits | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http_cache: HTTPCache | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        codec: JSONCodec | None = None,
+        parse_mode: ParseMode | str = ParseMode.VALIDATE,
+        html_backend: "HTMLBackend | None" = None,
+        parse_executor: Executor | None = None,
+        snapshots: "SnapshotStore | None" = None,
+    ):
+        """
+        Initialize the async Tabroom API client.
+
+        Args:
+            api_base_url: Base URL for API endpoints (default: https://api.tabroom.com/v1)
+            site_base_url: Base URL for the main site (default: https://www.tabroom.com)
+            username: Username for login
+            password: Password for login
+            token: Optional existing TabroomToken (skips login if provided)
+            timeout: Request timeout in seconds (default: 30.0)
+            auto_login: Login on first request if username/password provided (default: True)
+            pool_limits: Connection pool sizing and keep-alive
+            retry: Retry policy for transient failures (default: no retries)
+            rate_limiter: Client-side request pacing (default: unlimited)
+            http_cache: ETag/Last-Modified cache for GET responses (default: off)
+            cache: Per-endpoint TTL cache of parsed GET results (default: off)
+            coalesce: Share one request between identical concurrent GETs (default: False)
+            codec: JSON codec (default: orjson or msgspec if installed, else stdlib)
+            parse_mode: Default model parsing mode (see :class:`ParseMode`)
+            html_backend: HTML parser for scraped pages (default: selectolax or
+                lxml if installed, else BeautifulSoup)
+            parse_executor: Executor, e.g. a ProcessPoolExecutor, that parses
+                scraped pages off the calling thread (default: parse inline)
+            snapshots: Reuses the rows of scraped pages whose body is
+                unchanged (default: off)
+        """
+        self._base_client = AsyncBaseClient(
+            api_base_url=api_base_url,
+            site_base_url=site_base_url,
+            username=username,
+            password=password,
+            token=token,
+            timeout=timeout,
+            auto_login=auto_login,
+            pool_limits=pool_limits,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            http_cache=http_cache,
+            cache=cache,
+            coalesce=coalesce,
+            codec=codec,
+            parse_mode=parse_mode,
+            html_backend=html_backend,
+            parse_executor=parse_executor,
+            snapshots=snapshots,
+        )
+
+        # Initialize resources lazily
+        self._user_resource: UserResource | None = None
+        self._public_resource: PublicResource | None = None
+        self._tab_resource: TabResource | None = None
+        self._access_resource: AccessResource | None = None
+        self._caselist_resource: CaselistResource | None = None
+        self._nsda_resource: NsdaResource | None = None
+        self._share_resource: ShareResource | None = None
+        self._payment_resource: PaymentResource | None = None
+        self._system_resource: SystemResource | None = None
+        self._extra_resource: AsyncExtraResource | None = None
+
+    async def login(self, username: str, password: str) -> None:
+        """
+        Log in to Tabroom.
+
+        Args:
+            username: Username
+            password: Password
+        """
+        await self._base_client.login(username, password)
+
+    def logout(self) -> None:
+        """Log out and clear authentication."""
+        self._base_client.logout()
+
+    def is_authenticated(self) -> bool:
+        """Check if client is authenticated."""
+        return self._base_client.is_authenticated()
+
+    @property
+    def token(self) -> str | None:
+        """Get the current authentication token."""
+        return self._base_client.token
+
+    @property
+    def user(self) -> "UserResource":
+        """Access user profile operations."""
+        if self._user_resource is None:
+            self._user_resource = resources.UserResource(self._base_client)
+        return self._user_resource
+
+    @property
+    def public(self) -> "PublicResource":
+        """Access public tournament search and listing operations."""
+        if self._public_resource is None:
+            self._public_resource = resources.PublicResource(self._base_client)
+        return self._public_resource
+
+    @property
+    def tab(self) -> "TabResource":
+        """Access tournament tabulation operations."""
+        if self._tab_resource is None:
+            self._tab_resource = resources.TabResource(self._base_client)
+        return self._tab_resource
+
+    @property
+    def access(self) -> "AccessResource":
+        """Access permission and access control operations."""
+        if self._access_resource is None:
+            self._access_resource = resources.AccessResource(self._base_client)
+        return self._access_resource
+
+    @property
+    def caselist(self) -> "CaselistResource":
+        """Access caselist integration operations."""
+        if self._caselist_resource is None:
+            self._caselist_resource = resources.CaselistResource(self._base_client)
+        return self._caselist_resource
+
+    @property
+    def nsda(self) -> "NsdaResource":
+        """Access NSDA integration operations."""
+        if self._nsda_resource is None:
+            self._nsda_resource = resources.NsdaResource(self._base_client)
+        return self._nsda_resource
+
+    @property
+    def share(self) -> "ShareResource":
+        """Access document sharing operations."""
+        if self._share_resource is None:
+            self._share_resource = resources.ShareResource(self._base_client)
+        return self._share_resource
+
+    @property
+    def payment(self) -> "PaymentResource":
+        """Access payment processing operations."""
+        if self._payment_resource is None:
+            self._payment_resource = resources.PaymentResource(self._base_client)
+        return self._payment_resource
+
+    @property
+    def system(self) -> "SystemResource":
+        """Access system status operations."""
+        if self._system_resource is None:
+            self._system_resource = resources.SystemResource(self._base_client)
+        return self._system_resource
+
+    @property
+    def extra(self) -> "AsyncExtraResource":
+        """Access extra status operations."""
+        if self._extra_resource is None:
+            self._extra_resource = resources.AsyncExtraResource(self._base_client)
+        return self._extra_resource
+
+    async def batch(
+        self,
+        calls: Iterable[Callable[[], Awaitable[R]]],
+        max_concurrency: int | None = None,
+    ) -> list[BatchResult[R]]:
+        """
+        Await many calls with bounded concurrency.
+
+        Failures are collected per call instead of aborting the batch.
+
+        Args:
+            calls: Zero-argument coroutine functions
+            max_concurrency: Calls in flight (default: the connection pool size)
+
+        Returns:
+            One BatchResult per call, in input order
+        """
+        if max_concurrency is None:
+            max_concurrency = self._base_client.pool_limits.max_connections
+        return await run_batch_async(calls, max_concurrency)
+
+    async def map_many(
+        self,
+        fn: Callable[[Any], Awaitable[R]],
+        items: Iterable[Any],
+        max_concurrency: int | None = None,
+    ) -> list[BatchResult[R]]:
+        """
+        Await ``fn`` on every item with bounded concurrency.
+
+        Args:
+            fn: Coroutine function taking one item, typically a resource method
+            items: Arguments to call ``fn`` with
+            max_concurrency: Calls in flight (default: the connection pool size)
+
+        Returns:
+            One BatchResult per item, in input order
+        """
+        return await self.batch(
+            [lambda item=item: fn(item) for item in items], max_concurrency
+        )
+
+    async def close(self) -> None:
+        """Close the HTTP client connection."""
+        await self._base_client.close()
+
+    async def __aenter__(self):
+        """Async context manager entry (performs a pending auto-login)."""
+        await self._base_client.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,87 @@
+"""Bounded-concurrency fan-out of many client calls."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, Iterable, TypeVar
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[R]):
+    """
+    Outcome of one call in a batch.
+
+    Attributes:
+        value: Return value of the call, if it succeeded
+        error: Exception raised by the call, if it failed
+    """
+
+    value: R | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None
+
+    def unwrap(self) -> R:
+        """Return the value, or raise the call's exception."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def _capture(call: Callable[[], R]) -> BatchResult[R]:
+    try:
+        return BatchResult(value=call())
+    except Exception as e:
+        return BatchResult(error=e)
+
+
+def run_batch(
+    calls: Iterable[Callable[[], R]], max_workers: int
+) -> list[BatchResult[R]]:
+    """
+    Run calls on a thread pool and collect their outcomes in input order.
+
+    Args:
+        calls: Zero-argument callables
+        max_workers: Calls running at the same time
+
+    Returns:
+        One result per call, in input order
+    """
+    calls = list(calls)
+    if not calls:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(calls)), thread_name_prefix="tabroom-batch"
+    ) as pool:
+        return list(pool.map(_capture, calls))
+
+
+async def run_batch_async(
+    calls: Iterable[Callable[[], Awaitable[R]]], max_concurrency: int
+) -> list[BatchResult[R]]:
+    """
+    Await calls with bounded concurrency and collect their outcomes in input order.
+
+    Args:
+        calls: Zero-argument coroutine functions
+        max_concurrency: Calls awaited at the same time
+
+    Returns:
+        One result per call, in input order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def capture(call: Callable[[], Awaitable[R]]) -> BatchResult[R]:
+        async with semaphore:
+            try:
+                return BatchResult(value=await call())
+            except Exception as e:
+                return BatchResult(error=e)
+
+    return list(await asyncio.gather(*(capture(call) for call in calls)))
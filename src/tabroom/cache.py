@@ -0,0 +1,189 @@
+"""In-memory TTL + LRU cache for parsed GET responses."""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from fnmatch import fnmatchcase
+from typing import Any, Mapping
+
+from .http_cache import HTTPCache
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    How long responses of an endpoint stay cached.
+
+    Attributes:
+        ttl: Seconds a response is served without contacting the server
+        stale_ttl: Extra seconds an expired response is still served while a
+            background refresh runs (stale-while-revalidate)
+    """
+
+    ttl: float
+    stale_ttl: float = 0.0
+
+
+class CacheState(Enum):
+    """Freshness of a cache lookup."""
+
+    MISS = "miss"
+    FRESH = "fresh"
+    STALE = "stale"
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires: float
+    stale_until: float
+    refreshing: bool = False
+
+
+class ResponseCache:
+    """
+    Bounded cache of parsed GET results, with per-endpoint TTLs.
+
+    Only GET paths matching one of ``policies`` (shell-style patterns on the
+    API path) are cached; everything else, and every non-GET request, goes
+    straight to the server. A non-GET request also evicts cached GETs of the
+    same path, so e.g. marking attendance drops the cached attendance.
+
+    Entries are accounted by response body size and evicted least recently
+    used first once ``max_bytes`` or ``max_entries`` is exceeded. Cached
+    results are shared between callers and must not be mutated.
+
+    Example:
+        >>> cache = ResponseCache(
+        ...     {
+        ...         "/user/profile/*": CachePolicy(ttl=3600),
+        ...         "/tab/*/dashboard": CachePolicy(ttl=5, stale_ttl=30),
+        ...     }
+        ... )
+        >>> client = TabroomClient(username="u", password="p", cache=cache)
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, CachePolicy],
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entries: int = 10_000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            policies: Path pattern to policy; the first matching pattern wins
+            max_bytes: Total response bytes kept
+            max_entries: Entries kept
+        """
+        self.policies = dict(policies)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._paths: dict[str, str] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self) -> int:
+        """Total accounted bytes currently cached."""
+        return self._size
+
+    def policy_for(self, path: str) -> CachePolicy | None:
+        """Get the policy for an API path, or None if it is not cached."""
+        path = "/" + path.lstrip("/")
+        for pattern, policy in self.policies.items():
+            if fnmatchcase(path, pattern):
+                return policy
+        return None
+
+    @staticmethod
+    def key(
+        method: str,
+        path: str,
+        params: Mapping[str, Any] | None,
+        identity: str | None,
+        variant: str = "",
+    ) -> str:
+        """Build the cache key for a request; ``variant`` separates parse modes."""
+        return HTTPCache.key(
+            f"{method.upper()} /{path.lstrip('/')} {variant}", params, identity
+        )
+
+    def lookup(self, key: str) -> tuple[CacheState, Any]:
+        """
+        Look up a key.
+
+        Returns:
+            The entry state and its value (None on a miss)
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.stale_until:
+                self.misses += 1
+                return CacheState.MISS, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            if now < entry.expires:
+                return CacheState.FRESH, entry.value
+            return CacheState.STALE, entry.value
+
+    def begin_refresh(self, key: str) -> bool:
+        """Claim the background refresh of a stale entry; False if one is running."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refreshing:
+                return False
+            entry.refreshing = True
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        """Release a refresh claim after a failed refresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refreshing = False
+
+    def put(
+        self, key: str, path: str, value: Any, size: int, policy: CachePolicy
+    ) -> None:
+        """Store a parsed result for ``path`` under ``key``."""
+        now = time.monotonic()
+        expires = now + policy.ttl
+        entry = _Entry(value, size, expires, expires + policy.stale_ttl)
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = entry
+            self._paths[key] = "/" + path.lstrip("/")
+            self._size += size
+            while self._entries and (
+                self._size > self.max_bytes or len(self._entries) > self.max_entries
+            ):
+                self._discard(next(iter(self._entries)))
+
+    def invalidate(self, path: str) -> None:
+        """Drop every cached GET of an API path."""
+        path = "/" + path.lstrip("/")
+        with self._lock:
+            for key in [k for k, p in self._paths.items() if p == path]:
+                self._discard(key)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._paths.clear()
+            self._size = 0
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+            del self._paths[key]
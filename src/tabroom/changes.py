@@ -0,0 +1,144 @@
+"""Change feeds of scraped tables: inserts, updates and deletes between polls."""
+
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Hashable, Iterable, Sequence
+
+
+class ChangeKind(str, Enum):
+    """What happened to a row between two extractions."""
+
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class Change:
+    """
+    One changed row of a tracked table.
+
+    Attributes:
+        kind: Insert, update or delete
+        scope: The table the row belongs to, e.g. ``("bids", 103, "2025")``
+        key: Stable key of the row within its scope
+        row: The row now (None for deletes)
+        previous: The row before (None for inserts)
+    """
+
+    kind: ChangeKind
+    scope: Hashable
+    key: tuple
+    row: Any = None
+    previous: Any = None
+
+
+class ChangeTracker:
+    """
+    Keeps the last rows of each scraped table and reports what changed.
+
+    Each table is identified by a scope, such as an (event, year) of bids or
+    a (tournament, event) of entries. Rows are matched between extractions
+    by key fields; a row whose key is new is an insert, a row whose other
+    fields differ is an update, and a key that is gone is a delete.
+    Identical duplicate rows are kept once. Rows that share key fields are
+    keyed by their full content instead, so they keep their keys when rows
+    are added or removed around them; if exactly one of them changed, it is
+    still reported as an update. The first extraction of a scope reports
+    every row as an insert. Safe to share between threads.
+
+    Example:
+        >>> tracker = ChangeTracker()
+        >>> client.extra.get_bid_changes(tracker, DebateEvent.POLICY)  # all inserts
+        >>> client.extra.get_bid_changes(tracker, DebateEvent.POLICY)
+        [Change(kind=<ChangeKind.UPDATE: 'update'>, ...)]
+    """
+
+    def __init__(self):
+        self._tables: dict[Hashable, list[tuple]] = {}
+        self._lock = threading.Lock()
+
+    def diff(
+        self, scope: Hashable, rows: Iterable[tuple], key: Sequence[str]
+    ) -> list[Change]:
+        """
+        Record the current rows of a scope and get what changed since last time.
+
+        Args:
+            scope: Identifies the table
+            rows: Current rows, as namedtuple records
+            key: Record fields that identify a row
+
+        Returns:
+            Inserts and updates in row order, then deletes in their old order
+        """
+        current = list(dict.fromkeys(rows))
+        with self._lock:
+            previous = self._tables.get(scope, [])
+            self._tables[scope] = current
+
+        new_groups = self._grouped(current, key)
+        old_groups = self._grouped(previous, key)
+        # Changed rows of each key: current row -> the row it replaced, if any
+        replaced: dict[tuple, tuple | None] = {}
+        deleted: set[tuple] = set()
+        for base, group in new_groups.items():
+            old = old_groups.get(base, {})
+            added = [row for row in group if row not in old]
+            removed = [row for row in old if row not in group]
+            if len(added) == 1 and len(removed) == 1:
+                replaced[added[0]] = removed[0]
+            else:
+                replaced.update(dict.fromkeys(added))
+                deleted.update(removed)
+        for base, old in old_groups.items():
+            if base not in new_groups:
+                deleted.update(old)
+
+        changes = []
+        for row in current:
+            if row in replaced:
+                row_key = self._key(row, key, new_groups)
+                old_row = replaced[row]
+                kind = ChangeKind.INSERT if old_row is None else ChangeKind.UPDATE
+                changes.append(Change(kind, scope, row_key, row, old_row))
+        for old_row in previous:
+            if old_row in deleted:
+                row_key = self._key(old_row, key, old_groups)
+                changes.append(
+                    Change(ChangeKind.DELETE, scope, row_key, previous=old_row)
+                )
+        return changes
+
+    def rows(self, scope: Hashable) -> list[tuple]:
+        """Get the last rows recorded for a scope."""
+        with self._lock:
+            return list(self._tables.get(scope, []))
+
+    def forget(self, scope: Hashable | None = None) -> None:
+        """Drop the rows of one scope, or of every scope."""
+        with self._lock:
+            if scope is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(scope, None)
+
+    @staticmethod
+    def _grouped(
+        rows: list[tuple], key: Sequence[str]
+    ) -> dict[tuple, dict[tuple, None]]:
+        """Group distinct rows by their key fields, keeping row order."""
+        groups: dict[tuple, dict[tuple, None]] = {}
+        for row in rows:
+            base = tuple(getattr(row, name) for name in key)
+            groups.setdefault(base, {})[row] = None
+        return groups
+
+    @staticmethod
+    def _key(
+        row: tuple, key: Sequence[str], groups: dict[tuple, dict[tuple, None]]
+    ) -> tuple:
+        """Get a row's key fields, or its whole content if they are shared."""
+        base = tuple(getattr(row, name) for name in key)
+        return base if len(groups[base]) == 1 else tuple(row)
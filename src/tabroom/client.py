@@ -1,10 +1,15 @@
 """Base HTTP client for Tabroom API."""
 
-from typing import Any, TypeVar
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Iterator, Protocol, TypeVar
 
 import requests
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 
+from .cache import CachePolicy, CacheState, ResponseCache
+from .coalesce import SingleFlight
+from .codec import JSONCodec, default_codec
 from .exceptions import (
     TabroomAPIError,
     TabroomAuthError,
@@ -13,15 +18,299 @@ from .exceptions import (
     TabroomServerError,
     TabroomValidationError,
 )
+from .http_cache import CacheEntry, HTTPCache
 from .models import Err
+from .parsing import Parser, ParseMode, resolve_mode
+from .pool import PoolLimits, mount_pools
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .streaming import JSONArrayDecoder
+
+if TYPE_CHECKING:
+    # Scraping pulls in the HTML parsers; it is imported on first use
+    from .scraping import HTMLBackend, HTMLPage, HTMLStream
+    from .snapshots import SnapshotStore
 
 T = TypeVar("T", bound=BaseModel)
 
 COOKIE_NAME = "TabroomToken"
 
 
-class BaseClient:
-    """Base HTTP client with cookie-based authentication and error handling."""
+class ResourceClient(Protocol):
+    """
+    The client methods API resources call.
+
+    :class:`BaseClient` returns results directly and
+    :class:`~tabroom.async_client.AsyncBaseClient` returns awaitables of
+    them, so results are typed ``Any``. Resource return annotations describe
+    the sync client; with the async client, await them for that type.
+    """
+
+    def get(
+        self, path: str, response_model: type[Any] | None = None, **kwargs: Any
+    ) -> Any: ...
+
+    def post(
+        self, path: str, response_model: type[Any] | None = None, **kwargs: Any
+    ) -> Any: ...
+
+    def delete(
+        self, path: str, response_model: type[Any] | None = None, **kwargs: Any
+    ) -> Any: ...
+
+    def stream_json(
+        self,
+        method: str,
+        path: str,
+        response_model: type[Any] | None = None,
+        **kwargs: Any,
+    ) -> Any: ...
+
+
+class ClientCore:
+    """
+    Transport-independent state and response handling.
+
+    Shared by :class:`BaseClient` (requests) and
+    :class:`~tabroom.async_client.AsyncBaseClient` (httpx) so both map errors
+    and parse responses identically. Subclasses set ``self._client`` to an
+    HTTP session whose ``cookies`` behave like a mapping.
+    """
+
+    _client: Any
+    # Request keyword taking a pre-encoded body
+    _body_key = "data"
+    http_cache: HTTPCache | None = None
+    cache: ResponseCache | None = None
+    codec: JSONCodec
+    parse_mode: ParseMode = ParseMode.VALIDATE
+    snapshots: "SnapshotStore | None" = None
+    _html_backend: "HTMLBackend | None" = None
+
+    def _configure(
+        self,
+        api_base_url: str,
+        site_base_url: str,
+        username: str | None,
+        password: str | None,
+        timeout: float,
+    ) -> None:
+        self.api_base_url = api_base_url.rstrip("/")
+        self.site_base_url = site_base_url.rstrip("/")
+        self.timeout = timeout
+        self.username = username
+        self.password = password
+
+    def logout(self) -> None:
+        """Clear authentication token from session."""
+        if COOKIE_NAME in self._client.cookies:
+            del self._client.cookies[COOKIE_NAME]
+
+    def is_authenticated(self) -> bool:
+        """Check if client has authentication token."""
+        return COOKIE_NAME in self._client.cookies
+
+    @property
+    def token(self) -> str | None:
+        """Get the current authentication token."""
+        return self._client.cookies.get(COOKIE_NAME)
+
+    def _get_headers(self) -> dict[str, str]:
+        """Get headers for requests."""
+        return {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+
+    def _login_url(self) -> str:
+        """Get the URL of the cookie login form."""
+        return f"{self.site_base_url}/user/login/login_save.mhtml"
+
+    def _check_login(self, response: Any, username: str, password: str) -> None:
+        """Verify the login response set the auth cookie and store credentials."""
+        # Session automatically stores the cookie - just verify it exists
+        if COOKIE_NAME not in self._client.cookies:
+            raise TabroomAuthError(
+                "Login failed: No authentication cookie received",
+                response.status_code,
+            )
+
+        self.username = username
+        self.password = password
+
+    def _prepare(
+        self, base_url: str, path: str, kwargs: dict[str, Any]
+    ) -> tuple[str, dict[str, str]]:
+        """Build the request URL and headers, applying the default timeout."""
+        url = f"{base_url}/{path.lstrip('/')}"
+        headers = self._get_headers()
+
+        # Merge custom headers if provided
+        if "headers" in kwargs:
+            headers.update(kwargs.pop("headers"))
+
+        # Set timeout if not provided
+        if "timeout" not in kwargs:
+            kwargs["timeout"] = self.timeout
+
+        # Encode JSON bodies with the client's codec
+        if "json" in kwargs:
+            body = kwargs.pop("json")
+            if body is not None:
+                kwargs[self._body_key] = self.codec.dumps(body)
+
+        return url, headers
+
+    def _handle_error(self, response: Any) -> None:
+        """Handle error responses from the API."""
+        # Try to parse error message from response
+        try:
+            error_data = response.json()
+            if isinstance(error_data, dict) and "message" in error_data:
+                message = error_data["message"]
+            else:
+                message = response.text or f"HTTP {response.status_code}"
+        except Exception:
+            message = response.text or f"HTTP {response.status_code}"
+
+        # Raise appropriate exception based on status code
+        if response.status_code == 401 or response.status_code == 403:
+            raise TabroomAuthError(message, response.status_code)
+        elif response.status_code == 404:
+            raise TabroomNotFoundError(message, response.status_code)
+        elif response.status_code == 422:
+            raise TabroomValidationError(message, response.status_code)
+        elif response.status_code >= 500:
+            raise TabroomServerError(message, response.status_code)
+        else:
+            raise TabroomAPIError(message, response.status_code)
+
+    def _parser(
+        self, response_model: type[T] | None, parse_mode: ParseMode | str | None
+    ) -> Parser:
+        """Build the parser for a call from its model and parse mode."""
+        return Parser(response_model, resolve_mode(parse_mode, self.parse_mode))
+
+    def _parse_response(
+        self, response: Any, parser: Parser
+    ) -> T | dict[str, Any] | list[Any] | None:
+        """Check a response for errors and decode/validate its JSON body."""
+        # Check for errors
+        if response.status_code >= 400:
+            self._handle_error(response)
+
+        # Handle empty responses
+        if response.status_code == 204 or not response.content:
+            return None
+
+        return parser.parse(self._decode(response.content))
+
+    def _decode(self, content: bytes) -> Any:
+        """Decode a JSON response body."""
+        try:
+            return self.codec.loads(content)
+        except ValueError as e:
+            raise TabroomAPIError(f"Invalid JSON response: {str(e)}")
+
+    def _cache_lookup(
+        self, method: str, url: str, headers: dict[str, str], kwargs: dict[str, Any]
+    ) -> tuple[str | None, CacheEntry | None]:
+        """Find the HTTP cache entry for a GET and add conditional headers."""
+        if self.http_cache is None or method.upper() != "GET":
+            return None, None
+
+        key = self.http_cache.key(url, kwargs.get("params"), self.token)
+        entry = self.http_cache.get(key)
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+        return key, entry
+
+    def _cache_plan(
+        self, method: str, path: str, parser: Parser, kwargs: dict[str, Any]
+    ) -> tuple[str, CachePolicy] | None:
+        """Get the response cache key and policy for a cacheable GET."""
+        if self.cache is None or method.upper() != "GET":
+            return None
+        policy = self.cache.policy_for(path)
+        if policy is None:
+            return None
+        key = self.cache.key(
+            method, path, kwargs.get("params"), self.token, parser.mode.value
+        )
+        return key, policy
+
+    def _flight_key(
+        self, method: str, path: str, parser: Parser, kwargs: dict[str, Any]
+    ) -> tuple[str, Parser] | None:
+        """Get the single-flight key of a GET, or None if it is not coalesced."""
+        if method.upper() != "GET" or "headers" in kwargs:
+            return None
+        key = HTTPCache.key(f"/{path.lstrip('/')}", kwargs.get("params"), self.token)
+        return key, parser
+
+    @staticmethod
+    def _body_size(response: Any, entry: CacheEntry | None) -> int:
+        """Get the body size used to account a response in the cache."""
+        if response.status_code == 304 and entry is not None:
+            return len(entry.body)
+        return len(response.content)
+
+    def _cached_response(
+        self,
+        response: Any,
+        parser: Parser,
+        key: str | None,
+        entry: CacheEntry | None,
+    ) -> T | dict[str, Any] | list[Any] | None:
+        """Parse a response, answering 304s from and storing 200s in the cache."""
+        if entry is not None and response.status_code == 304:
+            if parser not in entry.parsed:
+                entry.parsed[parser] = parser.parse(self._decode(entry.body))
+            return entry.parsed[parser]
+
+        result = self._parse_response(response, parser)
+        if key is not None and self.http_cache is not None:
+            self.http_cache.store(key, response, parser, result)
+        return result
+
+    @property
+    def html_backend(self) -> "HTMLBackend":
+        """HTML parser for scraped pages, picked on first use if not given."""
+        if self._html_backend is None:
+            from .scraping import default_html_backend
+
+            self._html_backend = default_html_backend()
+        return self._html_backend
+
+    @html_backend.setter
+    def html_backend(self, backend: "HTMLBackend | None") -> None:
+        self._html_backend = backend
+
+    def _html_page(self, response: Any) -> "HTMLPage | None":
+        """Check an HTML response for errors and return its raw body."""
+        from .scraping import HTMLPage, sniff_encoding
+
+        if response.status_code >= 400:
+            self._handle_error(response)
+
+        if response.status_code == 204 or not response.content:
+            return None
+
+        content = response.content
+        encoding = sniff_encoding(response.headers.get("Content-Type"), content)
+        return HTMLPage(content, encoding)
+
+
+class BaseClient(ClientCore):
+    """
+    Base HTTP client with cookie-based authentication and error handling.
+
+    One instance may be shared by a thread pool: requests are sent through a
+    single ``requests.Session`` whose connection pools and cookie jar are
+    thread-safe. Size the pools with ``pool_limits`` to match the number of
+    threads. Log in before fanning out; ``login``/``logout`` change the shared
+    cookie and should not race with in-flight requests.
+    """
 
     def __init__(
         self,
@@ -32,6 +321,17 @@ class BaseClient:
         token: str | None = None,
         timeout: float = 30.0,
         auto_login: bool = True,
+        pool_limits: PoolLimits | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http_cache: HTTPCache | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        codec: JSONCodec | None = None,
+        parse_mode: ParseMode | str = ParseMode.VALIDATE,
+        html_backend: "HTMLBackend | None" = None,
+        parse_executor: Executor | None = None,
+        snapshots: "SnapshotStore | None" = None,
     ):
         """
         Initialize the base client.
@@ -44,15 +344,44 @@ class BaseClient:
             token: Optional existing TabroomToken (skips login if provided)
             timeout: Request timeout in seconds
             auto_login: Automatically login if username/password provided
+            pool_limits: Per-host connection pool sizing and keep-alive
+            retry: Retry policy for transient failures (default: no retries)
+            rate_limiter: Client-side pacing applied to every attempt
+            http_cache: Conditional-request cache for GET responses
+            cache: TTL cache of parsed GET results
+            coalesce: Share one request between identical concurrent GETs
+            codec: JSON codec (default: orjson or msgspec if installed, else stdlib)
+            parse_mode: Default model parsing mode (see :class:`ParseMode`)
+            html_backend: HTML parser for scraped pages (default: selectolax or
+                lxml if installed, else BeautifulSoup)
+            parse_executor: Executor, e.g. a ProcessPoolExecutor, that parses
+                scraped pages off the calling thread (default: parse inline)
+            snapshots: Reuses the rows of scraped pages whose body is unchanged
         """
-        self.api_base_url = api_base_url.rstrip("/")
-        self.site_base_url = site_base_url.rstrip("/")
-        self.timeout = timeout
-        self.username = username
-        self.password = password
+        self._configure(api_base_url, site_base_url, username, password, timeout)
+        self.pool_limits = pool_limits or PoolLimits()
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.http_cache = http_cache
+        self.cache = cache
+        # Refreshes stale cache entries; threads start on the first stale hit
+        self._refresh_pool: ThreadPoolExecutor | None = None
+        if cache is not None:
+            self._refresh_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="tabroom-refresh"
+            )
+        self._flights = SingleFlight() if coalesce else None
+        self.codec = codec or default_codec()
+        self.parse_mode = ParseMode(parse_mode)
+        self.html_backend = html_backend
+        self.parse_executor = parse_executor
+        self.snapshots = snapshots
 
         # Session automatically handles cookies
         self._client = requests.Session()
+        mount_pools(
+            self._client, self.pool_limits, self.api_base_url, self.site_base_url
+        )
 
         # Set token if provided
         if token:
@@ -73,71 +402,50 @@ class BaseClient:
         Raises:
             TabroomAuthError: If login fails
         """
-        login_url = f"{self.site_base_url}/user/login/login_save.mhtml"
-
         try:
             response = self._client.post(
-                login_url,
+                self._login_url(),
                 data={"username": username, "password": password},
             )
-
-            # Session automatically stores the cookie - just verify it exists
-            if COOKIE_NAME not in self._client.cookies:
-                raise TabroomAuthError(
-                    "Login failed: No authentication cookie received",
-                    response.status_code,
-                )
-
-            self.username = username
-            self.password = password
-
         except requests.RequestException as e:
             raise TabroomAuthError(f"Login request failed: {str(e)}")
 
-    def logout(self) -> None:
-        """Clear authentication token from session."""
-        if COOKIE_NAME in self._client.cookies:
-            del self._client.cookies[COOKIE_NAME]
-
-    def is_authenticated(self) -> bool:
-        """Check if client has authentication token."""
-        return COOKIE_NAME in self._client.cookies
-
-    @property
-    def token(self) -> str | None:
-        """Get the current authentication token."""
-        return self._client.cookies.get(COOKIE_NAME)
-
-    def _get_headers(self) -> dict[str, str]:
-        """Get headers for requests."""
-        return {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-
-    def _handle_error(self, response: requests.Response) -> None:
-        """Handle error responses from the API."""
-        # Try to parse error message from response
-        try:
-            error_data = response.json()
-            if isinstance(error_data, dict) and "message" in error_data:
-                message = error_data["message"]
+        self._check_login(response, username, password)
+
+    def _attempt(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a single attempt, waiting for the rate limiter first."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        return self._client.request(method, url, **kwargs)
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request, retrying transient failures per ``self.retry``."""
+        policy = self.retry
+        if policy is None:
+            return self._attempt(method, url, **kwargs)
+
+        policy.begin()
+        attempt = 0
+        while True:
+            try:
+                response = self._attempt(method, url, **kwargs)
+            except requests.RequestException:
+                delay = policy.delay(method, attempt)
+                if delay is None:
+                    raise
             else:
-                message = response.text or f"HTTP {response.status_code}"
-        except Exception:
-            message = response.text or f"HTTP {response.status_code}"
+                delay = policy.delay(
+                    method,
+                    attempt,
+                    response.status_code,
+                    response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                response.close()
 
-        # Raise appropriate exception based on status code
-        if response.status_code == 401 or response.status_code == 403:
-            raise TabroomAuthError(message, response.status_code)
-        elif response.status_code == 404:
-            raise TabroomNotFoundError(message, response.status_code)
-        elif response.status_code == 422:
-            raise TabroomValidationError(message, response.status_code)
-        elif response.status_code >= 500:
-            raise TabroomServerError(message, response.status_code)
-        else:
-            raise TabroomAPIError(message, response.status_code)
+            time.sleep(delay)
+            attempt += 1
 
     def request(
         self,
@@ -153,7 +461,8 @@ class BaseClient:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
             response_model: Pydantic model to parse response into
-            **kwargs: Additional arguments to pass to requests
+            **kwargs: Additional arguments to pass to requests; ``parse_mode``
+                overrides the client's parse mode for this call
 
         Returns:
             Parsed response data
@@ -161,63 +470,189 @@ class BaseClient:
         Raises:
             TabroomError: On API errors
         """
-        url = f"{self.api_base_url}/{path.lstrip('/')}"
-        headers = self._get_headers()
+        parser = self._parser(response_model, kwargs.pop("parse_mode", None))
+        cache = self.cache
+        plan = self._cache_plan(method, path, parser, kwargs)
+        if cache is None or plan is None:
+            result, _ = self._fetch_shared(method, path, parser, kwargs)
+            if cache is not None and method.upper() != "GET":
+                cache.invalidate(path)
+            return result
+
+        key, policy = plan
+        state, value = cache.lookup(key)
+        if state is CacheState.FRESH:
+            return value
+        if state is CacheState.STALE:
+            pool = self._refresh_pool
+            if pool is not None and cache.begin_refresh(key):
+                pool.submit(
+                    self._refresh, cache, key, policy, method, path, parser, kwargs
+                )
+            return value
 
-        # Merge custom headers if provided
-        if "headers" in kwargs:
-            headers.update(kwargs.pop("headers"))
+        result, size = self._fetch_shared(method, path, parser, kwargs)
+        cache.put(key, path, result, size, policy)
+        return result
 
-        # Set timeout if not provided
-        if "timeout" not in kwargs:
-            kwargs["timeout"] = self.timeout
+    def _refresh(
+        self,
+        cache: ResponseCache,
+        key: str,
+        policy: CachePolicy,
+        method: str,
+        path: str,
+        parser: Parser,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Re-fetch a stale cache entry in the background."""
+        try:
+            result, size = self._fetch(method, path, parser, dict(kwargs))
+        except Exception:
+            cache.end_refresh(key)
+            return
+        cache.put(key, path, result, size, policy)
+
+    def _fetch_shared(
+        self, method: str, path: str, parser: Parser, kwargs: dict[str, Any]
+    ) -> tuple[T | dict[str, Any] | list[Any] | None, int]:
+        """Fetch, coalescing identical concurrent GETs into one request."""
+        key = self._flight_key(method, path, parser, kwargs)
+        if self._flights is None or key is None:
+            return self._fetch(method, path, parser, kwargs)
+        return self._flights.do(key, lambda: self._fetch(method, path, parser, kwargs))
+
+    def _fetch(
+        self, method: str, path: str, parser: Parser, kwargs: dict[str, Any]
+    ) -> tuple[T | dict[str, Any] | list[Any] | None, int]:
+        """Send a request and parse it, returning the result and body size."""
+        url, headers = self._prepare(self.api_base_url, path, kwargs)
+        key, entry = self._cache_lookup(method, url, headers, kwargs)
 
         try:
             # Session automatically includes cookies
-            response = self._client.request(method, url, headers=headers, **kwargs)
+            response = self._send(method, url, headers=headers, **kwargs)
+            result = self._cached_response(response, parser, key, entry)
+        except requests.RequestException as e:
+            raise TabroomAPIError(f"HTTP error occurred: {str(e)}")
+        return result, self._body_size(response, entry)
 
-            # Check for errors
-            if not response.ok:
-                self._handle_error(response)
+    def stream_json(
+        self,
+        method: str,
+        path: str,
+        response_model: type[T] | None = None,
+        chunk_size: int = 64 * 1024,
+        **kwargs: Any,
+    ) -> Iterator[T | Any]:
+        """
+        Stream a JSON list response, yielding each element as it arrives.
 
-            # Handle empty responses
-            if response.status_code == 204 or not response.content:
-                return None
+        The body is decoded incrementally, so the first items are available
+        before the download finishes and memory does not grow with the list.
+        Responses are not cached or coalesced.
 
-            # Parse response
-            data = response.json()
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            response_model: Pydantic model to validate each element into
+            chunk_size: Bytes read from the socket at a time
+            **kwargs: Additional arguments to pass to requests; ``parse_mode``
+                overrides the client's parse mode for this call
 
-            # If response_model provided, validate with Pydantic
-            if response_model:
-                if isinstance(data, list):
-                    return [response_model.model_validate(item) for item in data]
-                return response_model.model_validate(data)
+        Yields:
+            Validated list elements
 
-            return data
+        Raises:
+            TabroomError: On API errors
+        """
+        parser = self._parser(response_model, kwargs.pop("parse_mode", None))
+        url, headers = self._prepare(self.api_base_url, path, kwargs)
 
+        try:
+            response = self._send(method, url, headers=headers, stream=True, **kwargs)
+            with response:
+                if response.status_code >= 400:
+                    self._handle_error(response)
+
+                decoder = JSONArrayDecoder()
+                for chunk in response.iter_content(chunk_size):
+                    for item in decoder.feed(chunk):
+                        yield parser.parse_item(item)
+                for item in decoder.close():
+                    yield parser.parse_item(item)
         except requests.RequestException as e:
             raise TabroomAPIError(f"HTTP error occurred: {str(e)}")
-        except ValidationError as e:
-            raise TabroomValidationError(f"Response validation failed: {str(e)}")
+        except ValueError as e:
+            raise TabroomAPIError(f"Invalid JSON response: {str(e)}")
 
-    def request_html(self, path: str, method: str, **kwargs: Any) -> str | None:
-        """Returns html content of a webpath"""
-        url = f"{self.site_base_url}/{path.lstrip('/')}"
-        headers = self._get_headers()
+    def request_html(
+        self,
+        path: str,
+        method: str,
+        stream: bool = False,
+        chunk_size: int = 64 * 1024,
+        **kwargs: Any,
+    ) -> "str | HTMLStream | None":
+        """
+        Returns html content of a webpath
 
-        if "headers" in kwargs:
-            kwargs.update(kwargs.pop("headers"))
+        With ``stream=True`` the response is returned as soon as its headers
+        arrive, as an :class:`HTMLStream` of raw byte chunks (for example to
+        feed a :class:`~tabroom.scraping.TableRowParser`). Close the stream
+        when done with it.
+        """
+        if stream:
+            return self._stream_html(path, method, chunk_size, kwargs)
+        page = self.request_html_page(path, method, **kwargs)
+        return None if page is None else page.text
+
+    def _stream_html(
+        self, path: str, method: str, chunk_size: int, kwargs: dict[str, Any]
+    ) -> "HTMLStream":
+        from .scraping import HTMLStream
 
+        url, headers = self._prepare(self.site_base_url, path, kwargs)
         try:
-            response = self._client.request(method, url, headers=headers, **kwargs)
+            response = self._send(method, url, headers=headers, stream=True, **kwargs)
+        except requests.RequestException as e:
+            raise TabroomAPIError(f"HTTP error occured: {str(e)}")
 
-            if not response.ok:
+        if response.status_code >= 400:
+            with response:
                 self._handle_error(response)
 
-            if response.status_code == 204 or not response.content:
-                return None
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield from response.iter_content(chunk_size)
+            except requests.RequestException as e:
+                raise TabroomAPIError(f"HTTP error occured: {str(e)}")
 
-            return str(response.content)
+        content_type = response.headers.get("Content-Type")
+        return HTMLStream(chunks(), content_type, response.close)
+
+    def request_html_page(
+        self, path: str, method: str, **kwargs: Any
+    ) -> "HTMLPage | None":
+        """
+        Fetch a web page as raw bytes plus its charset.
+
+        Scrapers use this to decode and parse only the part of the page they
+        need (see :meth:`HTMLPage.table`).
+
+        Args:
+            path: Path on the Tabroom website
+            method: HTTP method
+            **kwargs: Additional arguments to pass to requests
+
+        Returns:
+            The page, or None if the response has no body
+        """
+        url, headers = self._prepare(self.site_base_url, path, kwargs)
+
+        try:
+            response = self._send(method, url, headers=headers, **kwargs)
+            return self._html_page(response)
         except requests.RequestException as e:
             raise TabroomAPIError(f"HTTP error occured: {str(e)}")
 
@@ -247,6 +682,9 @@ class BaseClient:
 
     def close(self) -> None:
         """Close the HTTP client."""
+        if self._refresh_pool is not None:
+            # Pending refreshes are dropped; their entries just stay stale
+            self._refresh_pool.shutdown(wait=False, cancel_futures=True)
         self._client.close()
 
     def __enter__(self):
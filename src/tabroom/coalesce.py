@@ -0,0 +1,101 @@
+"""Single-flight coalescing of identical in-flight requests."""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+R = TypeVar("R")
+
+
+class _Call:
+    """An in-flight call that followers wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time across threads.
+
+    Threads asking for a key that is already in flight block until the first
+    call finishes and receive its result (or exception) instead of repeating
+    the work.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> R:
+        """
+        Call ``fn`` unless a call for ``key`` is in flight, then share its outcome.
+
+        Args:
+            key: Identity of the call
+            fn: Work to run if no identical call is in flight
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Runs at most one coroutine per key at a time on an event loop.
+
+    The shared call runs as its own task, so a cancelled caller does not
+    cancel the request for the other waiters.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[R]]) -> R:
+        """
+        Await ``fn()`` unless a call for ``key`` is in flight, then share its outcome.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function to run if no identical call is in flight
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+
+            def forget(done: asyncio.Task) -> None:
+                if self._calls.get(key) is done:
+                    del self._calls[key]
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
@@ -0,0 +1,92 @@
+"""Pluggable JSON codecs for request and response bodies."""
+
+import json
+from typing import Any, Protocol
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JSONCodec(Protocol):
+    """Encodes request bodies and decodes response bodies."""
+
+    name: str
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes; raise ValueError on invalid input."""
+        ...
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        ...
+
+
+class StdlibCodec:
+    """Codec backed by the standard library ``json`` module."""
+
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes; raise ValueError on invalid input."""
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode()
+
+
+class OrjsonCodec:
+    """Codec backed by orjson."""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson: pip install orjson")
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes; raise ValueError on invalid input."""
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+class MsgspecCodec:
+    """Codec backed by msgspec."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("MsgspecCodec requires msgspec: pip install msgspec")
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: bytes) -> Any:
+        """Decode JSON bytes; raise ValueError on invalid input."""
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON bytes."""
+        return self._encoder.encode(obj)
+
+
+def default_codec() -> JSONCodec:
+    """Get the fastest installed codec: orjson, then msgspec, then stdlib."""
+    if orjson is not None:
+        return OrjsonCodec()
+    if msgspec is not None:
+        return MsgspecCodec()
+    return StdlibCodec()
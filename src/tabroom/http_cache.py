@@ -0,0 +1,190 @@
+"""Conditional-request (ETag / Last-Modified) cache for GET endpoints."""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached GET response and its validators.
+
+    ``parsed`` memoizes the decoded/validated result per response model so a
+    304 can return it without parsing again. It is never persisted.
+    """
+
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    parsed: dict[Any, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that ask the server to answer 304 if nothing changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MemoryCacheStorage:
+    """Bounded in-memory LRU storage for cache entries."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the storage.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the entry for ``key``, if any."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key``."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCacheStorage:
+    """
+    On-disk storage for cache entries, one JSON file per key.
+
+    Bodies are stored base64-encoded, so any bytes round-trip. Entries survive restarts and can be shared by processes. Recently used
+    entries are also kept in memory so their parsed results are reused.
+    """
+
+    def __init__(self, directory: str, memory_entries: int = 256):
+        """
+        Initialize the storage.
+
+        Args:
+            directory: Directory holding the cache files (created if missing)
+            memory_entries: Entries also kept in memory
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._memory = MemoryCacheStorage(memory_entries)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the entry for ``key``, if any."""
+        entry = self._memory.get(key)
+        if entry is not None:
+            return entry
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+            body = base64.b64decode(data["body_base64"], validate=True)
+        except (OSError, ValueError, KeyError):
+            # Unreadable, or written by a version that stored text bodies
+            return None
+        entry = CacheEntry(
+            body=body,
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+        )
+        self._memory.set(key, entry)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key``."""
+        data = {
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "body_base64": base64.b64encode(entry.body).decode("ascii"),
+        }
+        # Write atomically so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self._path(key))
+        self._memory.set(key, entry)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._memory.clear()
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+
+class HTTPCache:
+    """
+    Opt-in cache that revalidates GET responses with the server.
+
+    Responses carrying an ``ETag`` or ``Last-Modified`` header are stored; the
+    next identical GET sends ``If-None-Match``/``If-Modified-Since`` and a 304
+    answer returns the cached, already-parsed result. Entries are keyed by URL,
+    query parameters and a hash of the auth token, so users never see each
+    other's responses. Cached results are shared between callers and must not
+    be mutated.
+
+    Example:
+        >>> client = TabroomClient(http_cache=HTTPCache(FileCacheStorage(".tabroom-cache")))
+    """
+
+    def __init__(self, storage: MemoryCacheStorage | FileCacheStorage | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            storage: Where entries are kept (default: in memory)
+        """
+        self.storage = storage or MemoryCacheStorage()
+
+    @staticmethod
+    def key(url: str, params: Mapping[str, Any] | None, identity: str | None) -> str:
+        """Build the cache key for a request."""
+        parts = [url, json.dumps(sorted((params or {}).items()), default=str)]
+        parts.append(identity or "")
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the stored entry for ``key``, if any."""
+        return self.storage.get(key)
+
+    def store(self, key: str, response: Any, model: Any, result: Any) -> None:
+        """Store a 200 response if it carries validators."""
+        if response.status_code != 200:
+            return
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        entry = CacheEntry(
+            body=response.content, etag=etag, last_modified=last_modified
+        )
+        entry.parsed[model] = result
+        self.storage.set(key, entry)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.storage.clear()
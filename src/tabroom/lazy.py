@@ -0,0 +1,42 @@
+"""Lazy re-exports for packages whose modules are slow to import."""
+
+from importlib import import_module
+from typing import Any, Callable, Mapping
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build a package's module ``__getattr__`` and ``__dir__`` (PEP 562).
+
+    Each exported name is imported from its module the first time it is
+    read and then cached in the package namespace, so importing the package
+    itself is nearly free and unused modules (and their dependencies) are
+    never loaded.
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {"Person": ".user"})
+
+    Args:
+        package: ``__name__`` of the package
+        exports: Exported name to the module defining it, relative to the
+            package
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions of the package
+    """
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,15 +1,47 @@
-"""Pydantic models for Tabroom API."""
+"""
+Pydantic models for Tabroom API.
 
-from .auth import LoginRequest, Session
-from .caselist import CaselistLink, Student
-from .common import Err
-from .school import Chapter, School, SchoolSetting
-from .share import Share
-from .tournament import Ad, Event, Invite, Round, Search
-from .user import Person
+Model modules are imported on first use, so only the schemas a program
+touches are built.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .auth import LoginRequest, Session
+    from .caselist import CaselistLink, Student
+    from .common import Err, TabroomTimestamp
+    from .school import Chapter, School, SchoolSetting
+    from .share import Share
+    from .tournament import Ad, Event, Invite, Round, Search
+    from .user import Person
+
+_EXPORTS = {
+    "LoginRequest": ".auth",
+    "Session": ".auth",
+    "CaselistLink": ".caselist",
+    "Student": ".caselist",
+    "Err": ".common",
+    "TabroomTimestamp": ".common",
+    "Chapter": ".school",
+    "School": ".school",
+    "SchoolSetting": ".school",
+    "Share": ".share",
+    "Ad": ".tournament",
+    "Event": ".tournament",
+    "Invite": ".tournament",
+    "Round": ".tournament",
+    "Search": ".tournament",
+    "Person": ".user",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "Err",
+    "TabroomTimestamp",
     "LoginRequest",
     "Session",
     "Person",
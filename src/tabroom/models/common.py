@@ -1,9 +1,10 @@
 """Common models shared across the API."""
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, BeforeValidator, Field, field_validator
 
 
 class Err(BaseModel):
@@ -12,20 +13,50 @@ class Err(BaseModel):
     message: str
 
 
+def _canonical(value: str) -> bool:
+    """Whether a value is exactly ``YYYY-MM-DD`` or ``YYYY-MM-DD HH:MM:SS``."""
+    if len(value) == 19:
+        if value[10] != " " or value[13] != ":" or value[16] != ":":
+            return False
+    elif len(value) != 10:
+        return False
+    return value[4] == "-" and value[7] == "-"
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime | None:
+    try:
+        # Canonical layouts go through the C fromisoformat; anything else (e.g.
+        # unpadded fields) falls back to strptime so accepted inputs are unchanged
+        if _canonical(value):
+            return datetime.fromisoformat(value)
+        if " " in value:
+            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+        else:
+            return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
 class TabroomDateTime(BaseModel):
     """Helper for parsing Tabroom's datetime format: YYYY-MM-DD HH:MM:SS"""
 
     @classmethod
     def parse_tabroom_datetime(cls, value: str | None) -> datetime | None:
-        """Parse Tabroom's datetime format."""
+        """Parse Tabroom's datetime format; unparseable values become None.
+
+        Results are memoized, since bulk responses repeat the same timestamps.
+        """
         if value is None or value == "":
             return None
+        if isinstance(value, datetime):
+            return value
 
         # Tabroom format: YYYY-MM-DD HH:MM:SS or YYYY-MM-DD
-        try:
-            if " " in value:
-                return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-            else:
-                return datetime.strptime(value, "%Y-%m-%d")
-        except ValueError:
-            return None
+        return _parse_timestamp(value)
+
+
+# Field type for Tabroom timestamps, e.g. ``start: TabroomTimestamp = None``
+TabroomTimestamp = Annotated[
+    datetime | None, BeforeValidator(TabroomDateTime.parse_tabroom_datetime)
+]
@@ -0,0 +1,75 @@
+"""Connection pool configuration for the HTTP clients."""
+
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """
+    Connection pool sizing shared by the sync and async clients.
+
+    The API (api.tabroom.com) and the site (www.tabroom.com) get separate
+    pools so heavy HTML scraping cannot starve API calls. Size each pool to at
+    least the number of worker threads that share the client, otherwise
+    urllib3 discards surplus connections ("Connection pool is full").
+
+    Attributes:
+        api_max_connections: Connections kept open to the API host
+        site_max_connections: Connections kept open to the site host
+        block: Wait for a free connection instead of opening a throwaway one
+        keep_alive: Reuse connections between requests
+        keepalive_expiry: Seconds an idle connection is kept (async client only)
+    """
+
+    api_max_connections: int = 10
+    site_max_connections: int = 10
+    block: bool = False
+    keep_alive: bool = True
+    keepalive_expiry: float | None = 5.0
+
+    @property
+    def max_connections(self) -> int:
+        """Total connections across both hosts."""
+        return self.api_max_connections + self.site_max_connections
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/"
+
+
+def mount_pools(
+    session: requests.Session, limits: PoolLimits, api_base_url: str, site_base_url: str
+) -> None:
+    """
+    Mount per-host HTTP adapters sized by ``limits`` on a requests session.
+
+    Args:
+        session: Session to configure
+        limits: Pool sizing
+        api_base_url: Base URL of the API host
+        site_base_url: Base URL of the site host
+    """
+    api_origin = _origin(api_base_url)
+    site_origin = _origin(site_base_url)
+
+    if api_origin == site_origin:
+        sizes = {api_origin: limits.max_connections}
+    else:
+        sizes = {
+            api_origin: limits.api_max_connections,
+            site_origin: limits.site_max_connections,
+        }
+
+    for origin, size in sizes.items():
+        session.mount(
+            origin,
+            HTTPAdapter(pool_connections=1, pool_maxsize=size, pool_block=limits.block),
+        )
+
+    if not limits.keep_alive:
+        session.headers["Connection"] = "close"
@@ -0,0 +1,176 @@
+"""Client-side token-bucket rate limiting."""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from urllib.parse import urlsplit
+
+
+class MemoryBucketBackend:
+    """Token-bucket state held in process memory, shared by threads."""
+
+    def __init__(self):
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        """
+        Take one token from bucket ``key`` and return how long to wait for it.
+
+        Buckets may go into debt, so concurrent callers are spaced ``1/rate``
+        seconds apart instead of bursting and backing off.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate) - 1
+            self._buckets[key] = (tokens, now)
+        return max(0.0, -tokens / rate)
+
+
+class SQLiteBucketBackend:
+    """
+    Token-bucket state in a SQLite file, shared by every process using it.
+
+    Each reservation runs in an immediate transaction, so workers on one
+    machine pointing at the same file stay under the configured rates
+    together.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Initialize the backend.
+
+        Args:
+            path: SQLite database file (created if missing)
+            timeout: Seconds to wait for the database lock
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS buckets "
+                "(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            self._local.conn = conn
+        return conn
+
+    def reserve(self, key: str, rate: float, burst: float) -> float:
+        """Take one token from bucket ``key`` and return how long to wait for it."""
+        conn = self._connect()
+        # Wall-clock time: monotonic clocks are not comparable across processes
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row if row else (burst, now)
+            tokens = min(burst, tokens + max(0.0, now - updated) * rate) - 1
+            conn.execute(
+                "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return max(0.0, -tokens / rate)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    A requests-per-second limit for the URLs matching a host and path pattern.
+
+    Patterns use shell-style wildcards matched against the URL host and path,
+    e.g. ``RateLimit(5, host="api.tabroom.com", path="/v1/tab/*")`` or
+    ``RateLimit(1, path="*.mhtml")``.
+
+    Attributes:
+        rate: Sustained requests per second
+        burst: Requests allowed back-to-back after an idle period
+        host: Host pattern (default: any host)
+        path: Path pattern (default: any path)
+    """
+
+    rate: float
+    burst: float = 1.0
+    host: str = "*"
+    path: str = "*"
+
+    def matches(self, host: str, path: str) -> bool:
+        """Check whether this limit applies to a request."""
+        return fnmatchcase(host, self.host) and fnmatchcase(path, self.path)
+
+    @property
+    def key(self) -> str:
+        """Bucket key identifying this limit in a shared backend."""
+        return f"{self.host}{self.path}"
+
+
+class RateLimiter:
+    """
+    Paces requests against a set of :class:`RateLimit` rules.
+
+    Every rule matching a request must grant a token, so a host-wide limit and
+    an endpoint-family limit can be combined. Use a
+    :class:`SQLiteBucketBackend` to share limits across processes.
+
+    Example:
+        >>> limiter = RateLimiter(
+        ...     [
+        ...         RateLimit(10, burst=5, host="api.tabroom.com"),
+        ...         RateLimit(2, host="api.tabroom.com", path="/v1/tab/*"),
+        ...         RateLimit(1, host="www.tabroom.com", path="*.mhtml"),
+        ...     ],
+        ...     backend=SQLiteBucketBackend("/tmp/tabroom-rate.db"),
+        ... )
+    """
+
+    def __init__(
+        self,
+        limits: list[RateLimit],
+        backend: MemoryBucketBackend | SQLiteBucketBackend | None = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            limits: Rules to enforce
+            backend: Bucket state storage (default: in-process memory)
+        """
+        self.limits = list(limits)
+        self.backend = backend or MemoryBucketBackend()
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserve a slot for a request to ``url``.
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        parts = urlsplit(url)
+        delay = 0.0
+        for limit in self.limits:
+            if limit.matches(parts.hostname or "", parts.path):
+                delay = max(
+                    delay, self.backend.reserve(limit.key, limit.rate, limit.burst)
+                )
+        return delay
+
+    def acquire(self, url: str) -> None:
+        """Block until a request to ``url`` may be sent."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
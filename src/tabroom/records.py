@@ -0,0 +1,171 @@
+"""Compact record and columnar containers for large list results."""
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Mapping, NamedTuple, cast, overload
+
+from pydantic import BaseModel
+from pydantic_core import SchemaValidator, core_schema
+
+
+def make_record(
+    name: str, fields: Iterable[str], module: str | None = None
+) -> type[NamedTuple]:
+    """
+    Create a namedtuple record class with runtime field names.
+
+    Args:
+        name: Class name
+        fields: Field names
+        module: ``__module__`` of the class; records pickle only when the
+            class can be found there under ``name``
+    """
+    return cast("type[NamedTuple]", namedtuple(name, list(fields), module=module))
+
+
+@lru_cache(maxsize=None)
+def record_type(model: type[BaseModel]) -> type[NamedTuple]:
+    """
+    Get the namedtuple record class mirroring a model's declared fields.
+
+    Records carry the validated field values without a per-instance dict, so
+    they take a fraction of the memory of a model. Extra keys of
+    ``extra="allow"`` models are not kept.
+
+    Example:
+        >>> PersonRecord = record_type(Person)
+        >>> PersonRecord._fields[:3]
+        ('id', 'email', 'first')
+    """
+    return make_record(f"{model.__name__}Record", model.model_fields)
+
+
+def to_record(instance: BaseModel) -> NamedTuple:
+    """Convert a validated model into its record."""
+    return record_type(type(instance))._make(instance.__dict__.values())
+
+
+@lru_cache(maxsize=None)
+def record_validator(model: type[BaseModel], many: bool) -> SchemaValidator | None:
+    """
+    Get a validator that checks payloads against a model and yields records.
+
+    It runs the model's own field validation, but hands each item's field
+    values straight to the record class, so no model instance is built.
+
+    Args:
+        model: Model describing the payload
+        many: Validate a list of payloads rather than one
+
+    Returns:
+        The validator, or None for models whose validation is more than their
+        fields (model validators, ``model_post_init``, recursive definitions)
+    """
+    schema = model.__pydantic_core_schema__
+    if (
+        schema["type"] != "model"
+        or schema.get("post_init")
+        or schema["schema"]["type"] != "model-fields"
+    ):
+        return None
+    record = record_type(model)
+    # model-fields validation yields (field values, extra, fields set)
+    item = core_schema.no_info_after_validator_function(
+        lambda fields: record._make(fields[0].values()), schema["schema"]
+    )
+    title = f"list[{model.__name__}]" if many else model.__name__
+    config = core_schema.CoreConfig(**{**schema.get("config", {}), "title": title})
+    return SchemaValidator(core_schema.list_schema(item) if many else item, config)
+
+
+def validate_records(model: type[BaseModel], data: Any) -> Any:
+    """
+    Validate a payload (an object or a list of objects) into records.
+
+    Only one item's field values are alive besides the records themselves, so
+    peak memory stays close to that of the result.
+
+    Raises:
+        pydantic.ValidationError: If the data does not match the model
+    """
+    many = isinstance(data, list)
+    validator = record_validator(model, many)
+    if validator is not None:
+        return validator.validate_python(data)
+    if many:
+        return [to_record(model.model_validate(item)) for item in data]
+    return to_record(model.model_validate(data))
+
+
+class Columns:
+    """
+    Column-oriented table of records: one list per field.
+
+    Index with a field name to get a column, or with an integer to get one
+    row as a record. Iterating yields rows, so code written against a list of
+    records keeps working.
+
+    Example:
+        >>> with use_parse_mode("columns"):
+        ...     students = client.caselist.get_students(123)
+        >>> students["name"][:2]
+        ['Ada', 'Grace']
+        >>> students[0]
+        StudentRecord(id=1, name='Ada')
+    """
+
+    __slots__ = ("record", "_columns", "_length")
+
+    def __init__(self, record: type[NamedTuple], columns: Mapping[str, list[Any]]):
+        """
+        Initialize the table.
+
+        Args:
+            record: Record class describing the columns
+            columns: One equally long list per record field
+        """
+        self.record = record
+        self._columns = {name: columns[name] for name in record._fields}
+        lengths = {len(column) for column in self._columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Columns must all have the same length")
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_records(
+        cls, record: type[NamedTuple], rows: Iterable[tuple]
+    ) -> "Columns":
+        """Build a table from records (or plain tuples in field order)."""
+        rows = list(rows)
+        if not rows:
+            return cls(record, {name: [] for name in record._fields})
+        return cls(record, dict(zip(record._fields, map(list, zip(*rows)))))
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Column names."""
+        return self.record._fields
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, key: str) -> list[Any]: ...
+
+    @overload
+    def __getitem__(self, key: int) -> NamedTuple: ...
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._columns[key]
+        return self.record._make(column[key] for column in self._columns.values())
+
+    def __iter__(self) -> Iterator[NamedTuple]:
+        return map(self.record._make, zip(*self._columns.values()))
+
+    def __repr__(self) -> str:
+        return f"Columns[{self.record.__name__}]({self._length} rows)"
+
+    def to_records(self) -> list[NamedTuple]:
+        """Get every row as a record."""
+        return list(self)
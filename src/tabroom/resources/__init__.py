@@ -1,15 +1,58 @@
-"""API resource modules."""
-
-from .access import AccessResource
-from .caselist import CaselistResource
-from .extra import ExtraResource
-from .nsda import NsdaResource
-from .payment import PaymentResource
-from .public import PublicResource
-from .share import ShareResource
-from .system import SystemResource
-from .tab import TabResource
-from .user import UserResource
+"""
+API resource modules.
+
+Resources only build paths and delegate to their client, so the same classes
+serve both :class:`~tabroom.client.BaseClient` and
+:class:`~tabroom.async_client.AsyncBaseClient`; with the latter every method
+returns an awaitable. Resources that post-process responses have an explicit
+``Async*`` variant.
+
+Resource modules are imported on first use, so e.g. the scrapers of
+:mod:`tabroom.resources.extra` (and BeautifulSoup) only load when needed.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .access import AccessResource
+    from .caselist import CaselistResource
+    from .extra import (
+        AsyncExtraResource,
+        BidRecord,
+        ExtraResource,
+        FieldRecord,
+        SeasonBidRecord,
+        TournamentFieldRecord,
+    )
+    from .nsda import NsdaResource
+    from .payment import PaymentResource
+    from .public import PublicResource
+    from .share import ShareResource
+    from .system import SystemResource
+    from .tab import TabResource
+    from .user import UserResource
+
+_EXPORTS = {
+    "AccessResource": ".access",
+    "CaselistResource": ".caselist",
+    "AsyncExtraResource": ".extra",
+    "BidRecord": ".extra",
+    "ExtraResource": ".extra",
+    "FieldRecord": ".extra",
+    "SeasonBidRecord": ".extra",
+    "TournamentFieldRecord": ".extra",
+    "NsdaResource": ".nsda",
+    "PaymentResource": ".payment",
+    "PublicResource": ".public",
+    "ShareResource": ".share",
+    "SystemResource": ".system",
+    "TabResource": ".tab",
+    "UserResource": ".user",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "UserResource",
@@ -22,4 +65,9 @@ __all__ = [
     "PaymentResource",
     "SystemResource",
     "ExtraResource",
+    "AsyncExtraResource",
+    "BidRecord",
+    "FieldRecord",
+    "SeasonBidRecord",
+    "TournamentFieldRecord",
 ]
@@ -3,13 +3,13 @@
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from ..client import BaseClient
+    from ..client import ResourceClient
 
 
 class EventAccessResource:
     """Access control for a specific event."""
 
-    def __init__(self, client: "BaseClient", tourn_id: int, event_id: int):
+    def __init__(self, client: "ResourceClient", tourn_id: int, event_id: int):
         self._client = client
         self._tourn_id = tourn_id
         self._event_id = event_id
@@ -32,7 +32,7 @@ class EventAccessResource:
             json=permissions,
         )
 
-    def revoke(self, person_id: int) -> None:
+    def revoke(self, person_id: int) -> dict[str, Any] | None:
         """
         Revoke event access permissions for a user.
 
@@ -40,8 +40,11 @@ class EventAccessResource:
 
         Args:
             person_id: The person to revoke access from
+
+        Returns:
+            The API response, if any
         """
-        self._client.delete(
+        return self._client.delete(
             f"/tab/{self._tourn_id}/event/{self._event_id}/access/{person_id}"
         )
 
@@ -49,7 +52,7 @@ class EventAccessResource:
 class CategoryAccessResource:
     """Access control for a specific category."""
 
-    def __init__(self, client: "BaseClient", tourn_id: int, category_id: int):
+    def __init__(self, client: "ResourceClient", tourn_id: int, category_id: int):
         self._client = client
         self._tourn_id = tourn_id
         self._category_id = category_id
@@ -72,7 +75,7 @@ class CategoryAccessResource:
             json=permissions,
         )
 
-    def revoke(self, person_id: int) -> None:
+    def revoke(self, person_id: int) -> dict[str, Any] | None:
         """
         Revoke category access permissions for a user.
 
@@ -80,8 +83,11 @@ class CategoryAccessResource:
 
         Args:
             person_id: The person to revoke access from
+
+        Returns:
+            The API response, if any
         """
-        self._client.delete(
+        return self._client.delete(
             f"/tab/{self._tourn_id}/category/{self._category_id}/access/{person_id}"
         )
 
@@ -89,7 +95,7 @@ class CategoryAccessResource:
 class TournamentAccessResource:
     """Access control for a specific tournament."""
 
-    def __init__(self, client: "BaseClient", tourn_id: int):
+    def __init__(self, client: "ResourceClient", tourn_id: int):
         self._client = client
         self._tourn_id = tourn_id
 
@@ -110,7 +116,7 @@ class TournamentAccessResource:
             f"/tab/{self._tourn_id}/access/{person_id}", json=permissions
         )
 
-    def revoke(self, person_id: int) -> None:
+    def revoke(self, person_id: int) -> dict[str, Any] | None:
         """
         Revoke tournament access permissions for a user.
 
@@ -118,8 +124,11 @@ class TournamentAccessResource:
 
         Args:
             person_id: The person to revoke access from
+
+        Returns:
+            The API response, if any
         """
-        self._client.delete(f"/tab/{self._tourn_id}/access/{person_id}")
+        return self._client.delete(f"/tab/{self._tourn_id}/access/{person_id}")
 
     def event(self, event_id: int) -> EventAccessResource:
         """
@@ -149,7 +158,7 @@ class TournamentAccessResource:
 class AccessResource:
     """Access control and permissions operations."""
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(self, client: "ResourceClient"):
         self._client = client
 
     def tournament(self, tourn_id: int) -> TournamentAccessResource:
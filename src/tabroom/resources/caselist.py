@@ -5,13 +5,13 @@ from typing import TYPE_CHECKING, Any
 from ..models import CaselistLink, Chapter, Student
 
 if TYPE_CHECKING:
-    from ..client import BaseClient
+    from ..client import ResourceClient
 
 
 class CaselistResource:
     """Caselist integration operations."""
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(self, client: "ResourceClient"):
         self._client = client
 
     def get_students(self, person_id: int) -> list[Student]:
@@ -1,14 +1,219 @@
 """Collection of extra operations not in API spec"""
 
-from typing import TYPE_CHECKING, Any, Dict, List
+from dataclasses import replace
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+)
 
-from bs4 import BeautifulSoup
+from pydantic import ValidationError
 
 from tabroom.types import DebateEvent
 
+from ..batch import run_batch, run_batch_async
+from ..changes import Change, ChangeTracker
+from ..exceptions import TabroomValidationError
+from ..models import Event
+from ..parsing import ParseMode, list_adapter, resolve_mode
+from ..records import Columns, make_record
+from ..scraping import HTMLPage, HTMLStream, TableRowParser
+from ..tables import Column, TableExtractor, TableSpec, integer
+
 if TYPE_CHECKING:
+    from ..async_client import AsyncBaseClient
     from ..client import BaseClient
 
+BIDS_PATH = "/index/results/toc_bids.mhtml"
+
+BIDS = TableSpec(
+    "BidRecord",
+    (
+        Column("school", 0),
+        Column("state", 1),
+        Column("entry", 2),
+        Column("bids", 3, integer),
+    ),
+).compile(__name__)
+
+FIELDS = TableSpec(
+    "FieldRecord",
+    (
+        Column("school", 0),
+        Column("location", 1),
+        Column("entry", 2),
+        Column("code", 3),
+    ),
+    table_id="fieldsort",
+).compile(__name__)
+
+BidRecord = BIDS.record
+FieldRecord = FIELDS.record
+
+# Fields identifying a bid or an entry between polls (see ChangeTracker)
+ROW_KEY = ("school", "entry")
+
+# One bid of a multi-event, multi-year fetch (see ``get_bids_many``)
+SeasonBidRecord = make_record(
+    "SeasonBidRecord", ("event", "year", *BidRecord._fields), __name__
+)
+
+# One entry of a whole tournament (see ``get_tournament_fields``)
+TournamentFieldRecord = make_record(
+    "TournamentFieldRecord", ("event_id", "event", *FieldRecord._fields), __name__
+)
+
+
+def _fields_path(tournament_id: str, event_id: str) -> str:
+    return f"/index/tourn/fields.mhtml?tourn_id={tournament_id}&event_id={event_id}"
+
+
+def _invite_path(tournament_id: str) -> str:
+    return f"/public/invite/tourn/{tournament_id}"
+
+
+def _tournament_events(invite: Any) -> List[Event]:
+    """Get the distinct events listed in a tournament's invite."""
+    try:
+        events = list_adapter(Event).validate_python((invite or {}).get("events") or [])
+    except ValidationError as e:
+        raise TabroomValidationError(f"Response validation failed: {str(e)}")
+    unique: Dict[int, Event] = {}
+    for event in events:
+        unique.setdefault(event.id, event)
+    return list(unique.values())
+
+
+def _tournament_fields(
+    events: List[Event], pages: List[List[NamedTuple]]
+) -> List[NamedTuple]:
+    """Tag the entries of each event page with the event, dropping duplicates."""
+    rows = (
+        TournamentFieldRecord._make((event.id, event.name, *record))
+        for event, records in zip(events, pages)
+        for record in records
+    )
+    return list(dict.fromkeys(rows))
+
+
+def _bids_form(event: DebateEvent, year: str) -> Dict[str, Any]:
+    return {"code": event.value.id, "year": year}
+
+
+def _compact(client: Any) -> bool:
+    """Whether scraped rows are returned as records rather than dicts."""
+    mode = resolve_mode(None, client.parse_mode)
+    return mode in (ParseMode.RECORDS, ParseMode.COLUMNS)
+
+
+def _bid_pairs(
+    events: Iterable[DebateEvent], years: Iterable[str]
+) -> List[Tuple[DebateEvent, str]]:
+    years = [str(year) for year in years]
+    return [(event, year) for event in events for year in years]
+
+
+def _season_bids(
+    pairs: List[Tuple[DebateEvent, str]], pages: List[List[NamedTuple]]
+) -> List[NamedTuple]:
+    """Tag the bids of each (event, year) page with its event and year."""
+    return [
+        SeasonBidRecord._make((event, year, *record))
+        for (event, year), records in zip(pairs, pages)
+        for record in records
+    ]
+
+
+def _recall(
+    client: Any,
+    table: TableExtractor,
+    page: HTMLPage | None,
+    path: str,
+    data: Dict[str, Any] | None = None,
+) -> Tuple[Tuple[str, str] | None, List[NamedTuple] | None]:
+    """
+    Look a downloaded page up in the client's snapshot store.
+
+    Returns:
+        The page's key and digest to :func:`_remember` on a miss (None without
+        a store), and the records of the unchanged page on a hit
+    """
+    store = client.snapshots
+    if store is None or page is None:
+        return None, None
+    slot = (store.key(path, data, table.spec.name), store.digest(page))
+    rows = store.get(*slot)
+    return slot, None if rows is None else table.records(rows)
+
+
+def _remember(
+    client: Any, slot: Tuple[str, str] | None, records: List[NamedTuple]
+) -> None:
+    if slot is not None:
+        client.snapshots.put(*slot, records)
+
+
+def _bid_scope(event: DebateEvent, year: str) -> Tuple[str, int, str]:
+    return ("bids", event.value.id, str(year))
+
+
+def _field_scope(tournament_id: str, event_id: Any) -> Tuple[str, str, str]:
+    return ("fields", str(tournament_id), str(event_id))
+
+
+def _changes(client: Any, changes: List[Change]) -> List[Change]:
+    """Return changed rows as dicts, or as records in the compact parse modes."""
+    if _compact(client):
+        return changes
+    return [
+        replace(
+            change,
+            row=None if change.row is None else change.row._asdict(),
+            previous=None if change.previous is None else change.previous._asdict(),
+        )
+        for change in changes
+    ]
+
+
+def _result(client: Any, record: "type[NamedTuple]", records: List[NamedTuple]) -> Any:
+    """Return scraped records as dicts, records or columns per parse mode."""
+    mode = resolve_mode(None, client.parse_mode)
+    if mode is ParseMode.RECORDS:
+        return records
+    if mode is ParseMode.COLUMNS:
+        return Columns.from_records(record, records)
+    return [record._asdict() for record in records]
+
+
+def _stream_rows(stream: HTMLStream, table_id: str) -> Iterator[list[str]]:
+    """Yield table rows of a streamed page as each ``</tr>`` arrives."""
+    parser = TableRowParser(table_id, stream.content_type)
+    with stream:
+        for chunk in stream:
+            yield from parser.feed(chunk)
+            if parser.done:
+                break
+        yield from parser.close()
+
+
+async def _astream_rows(stream: HTMLStream, table_id: str) -> AsyncIterator[list[str]]:
+    """Async variant of :func:`_stream_rows`."""
+    parser = TableRowParser(table_id, stream.content_type)
+    async with stream:
+        async for chunk in stream:
+            for cells in parser.feed(chunk):
+                yield cells
+            if parser.done:
+                break
+        for cells in parser.close():
+            yield cells
+
 
 class ExtraResource:
     """System status operations."""
@@ -27,73 +232,388 @@ class ExtraResource:
             year: the school year starting to get bids for
 
         Returns:
-            List of bids
+            List of bids; :class:`BidRecord` records or a
+            :class:`~tabroom.records.Columns` table in the ``records`` and
+            ``columns`` parse modes
         """
+        return _result(self._client, BidRecord, self._bid_records(event, year))
 
-        form_data = {"code": event.value.id, "year": year}
+    def get_bids_many(
+        self,
+        events: Iterable[DebateEvent],
+        years: Iterable[str],
+        max_workers: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the bids of several events and years in one call.
 
-        html = self._client.request_html(
-            "/index/results/toc_bids.mhtml", "POST", data=form_data
-        )
+        Every (event, year) page is fetched concurrently on a bounded thread
+        pool over the client's shared session.
 
-        if html is None:
-            return []
+        Example:
+            >>> bids = client.extra.get_bids_many(DebateEvent, ["2024", "2025"])
 
-        soup = BeautifulSoup(html, "html.parser")
+        Args:
+            events: the events to get bids for
+            years: the school years to get bids for
+            max_workers: pages fetched at the same time (default: the site
+                connection pool size)
 
-        table = soup.find(id=str(event.value.id))
-        policy_teams = []
+        Returns:
+            One merged list of bids, each with its ``event`` (a
+            :class:`DebateEvent`) and ``year``, in event then year order;
+            :class:`SeasonBidRecord` records or a
+            :class:`~tabroom.records.Columns` table in the ``records`` and
+            ``columns`` parse modes
 
-        for row in table.tbody.find_all("tr"):
-            school = (
-                row.contents[1].get_text().replace("\\t", "").replace("\\n", "").strip()
-            )
-            state = (
-                row.contents[3].get_text().replace("\\t", "").replace("\\n", "").strip()
-            )
-            entry = (
-                row.contents[5].get_text().replace("\\t", "").replace("\\n", "").strip()
-            )
-            bids = (
-                row.contents[7].get_text().replace("\\t", "").replace("\\n", "").strip()
-            )
-            policy_teams.append(
-                {"school": school, "state": state, "entry": entry, "bids": bids}
-            )
+        Raises:
+            TabroomError: The first error of any page, in event then year order
+        """
+        client = self._client
+        pairs = _bid_pairs(events, years)
+        if max_workers is None:
+            max_workers = client.pool_limits.site_max_connections
+        results = run_batch(
+            [lambda pair=pair: self._bid_records(*pair) for pair in pairs],
+            max_workers,
+        )
+        pages = [result.unwrap() for result in results]
+        return _result(client, SeasonBidRecord, _season_bids(pairs, pages))
 
-        return policy_teams
+    def _bid_records(self, event: DebateEvent, year: str) -> List[NamedTuple]:
+        client = self._client
+        form = _bids_form(event, year)
+        page = client.request_html_page(BIDS_PATH, "POST", data=form)
+        slot, records = _recall(client, BIDS, page, BIDS_PATH, form)
+        if records is None:
+            records = BIDS.extract_in(
+                client.parse_executor, page, client.html_backend, str(event.value.id)
+            )
+            _remember(client, slot, records)
+        return records
 
     def get_teams_attending(
         self, tournament_id: str, event_id: str
     ) -> List[Dict[str, Any]]:
-        html = self._client.request_html(
-            f"/index/tourn/fields.mhtml?tourn_id={tournament_id}&event_id={event_id}",
+        records = self._field_records(tournament_id, event_id)
+        return _result(self._client, FieldRecord, records)
+
+    def get_tournament_fields(
+        self, tournament_id: str, max_workers: int | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the entries of every event of a tournament.
+
+        The events are read from the tournament's public invite, then every
+        event's fields page is fetched concurrently and parsed with the
+        client's HTML backend and parse executor.
+
+        Args:
+            tournament_id: the tournament to get entries for
+            max_workers: pages fetched at the same time (default: the site
+                connection pool size)
+
+        Returns:
+            One list of distinct entries, each with its ``event_id`` and
+            ``event`` name, grouped by event in invite order;
+            :class:`TournamentFieldRecord` records or a
+            :class:`~tabroom.records.Columns` table in the ``records`` and
+            ``columns`` parse modes
+
+        Raises:
+            TabroomError: The first error of the invite or any page
+        """
+        client = self._client
+        events = _tournament_events(client.get(_invite_path(tournament_id)))
+        if max_workers is None:
+            max_workers = client.pool_limits.site_max_connections
+        results = run_batch(
+            [
+                lambda event=event: self._field_records(tournament_id, event.id)
+                for event in events
+            ],
+            max_workers,
+        )
+        pages = [result.unwrap() for result in results]
+        return _result(client, TournamentFieldRecord, _tournament_fields(events, pages))
+
+    def _field_records(self, tournament_id: str, event_id: Any) -> List[NamedTuple]:
+        client = self._client
+        path = _fields_path(tournament_id, event_id)
+        page = client.request_html_page(path, "GET")
+        slot, records = _recall(client, FIELDS, page, path)
+        if records is None:
+            records = FIELDS.extract_in(
+                client.parse_executor, page, client.html_backend
+            )
+            _remember(client, slot, records)
+        return records
+
+    def get_bid_changes(
+        self, tracker: ChangeTracker, event: DebateEvent, year: str = "2025"
+    ) -> List[Change]:
+        """
+        Get what changed in the bids of an event since the last call.
+
+        Rows are keyed by school and entry, within the ``("bids", event id,
+        year)`` scope of ``tracker``.
+
+        Args:
+            tracker: keeps the rows of the previous call
+            event: the event to get bids for
+            year: the school year starting to get bids for
+
+        Returns:
+            Inserted, updated and deleted bids; their rows are dicts, or
+            :class:`BidRecord` records in the ``records`` and ``columns``
+            parse modes
+        """
+        records = self._bid_records(event, year)
+        changes = tracker.diff(_bid_scope(event, year), records, ROW_KEY)
+        return _changes(self._client, changes)
+
+    def get_field_changes(
+        self, tracker: ChangeTracker, tournament_id: str, event_id: str
+    ) -> List[Change]:
+        """
+        Get what changed in the entries of an event since the last call.
+
+        Rows are keyed by school and entry, within the ``("fields",
+        tournament id, event id)`` scope of ``tracker``.
+        See :meth:`get_bid_changes`.
+        """
+        records = self._field_records(tournament_id, event_id)
+        changes = tracker.diff(_field_scope(tournament_id, event_id), records, ROW_KEY)
+        return _changes(self._client, changes)
+
+    def iter_bids(self, event: DebateEvent, year: str = "2025") -> Iterator[Any]:
+        """
+        Stream the bids of an event, yielding each entry as it is parsed.
+
+        Rows are parsed while the page downloads, so the first ones arrive
+        early and memory stays flat on season-long pages.
+
+        Args:
+            event: the event to get bids for
+            year: the school year starting to get bids for
+
+        Returns:
+            An iterator of bid dicts, or of :class:`BidRecord` records in the
+            ``records`` and ``columns`` parse modes active at the call
+        """
+        return self._iter_rows(
+            BIDS,
+            str(event.value.id),
+            _compact(self._client),
+            BIDS_PATH,
+            "POST",
+            data=_bids_form(event, year),
+        )
+
+    def iter_teams_attending(self, tournament_id: str, event_id: str) -> Iterator[Any]:
+        """
+        Stream the entries of an event, yielding each one as it is parsed.
+
+        See :meth:`iter_bids`.
+        """
+        return self._iter_rows(
+            FIELDS,
+            FIELDS.spec.table_id,
+            _compact(self._client),
+            _fields_path(tournament_id, event_id),
             "GET",
         )
 
-        if html is None:
-            return []
+    def _iter_rows(
+        self,
+        table: TableExtractor,
+        table_id: str,
+        compact: bool,
+        path: str,
+        method: str,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Stream a table, with the parse mode resolved by the caller."""
+        stream = self._client.request_html(path, method, stream=True, **kwargs)
+        for record in table.rows(_stream_rows(stream, table_id)):
+            yield record if compact else record._asdict()
 
-        soup = BeautifulSoup(html, "html.parser")
 
-        table = soup.find(id="fieldsort")
-        teams = []
+class AsyncExtraResource:
+    """Async variant of :class:`ExtraResource` for :class:`AsyncBaseClient`."""
 
-        for row in table.tbody.find_all("tr"):
-            school = (
-                row.contents[1].get_text().replace("\\t", "").replace("\\n", "").strip()
-            )
-            location = (
-                row.contents[3].get_text().replace("\\t", "").replace("\\n", "").strip()
-            )
-            entry = (
-                row.contents[5].get_text().replace("\\t", "").replace("\\n", "").strip()
-            )
-            code = (
-                row.contents[7].get_text().replace("\\t", "").replace("\\n", "").strip()
+    def __init__(self, client: "AsyncBaseClient"):
+        self._client = client
+
+    async def get_bids(
+        self, event: DebateEvent, year: str = "2025"
+    ) -> List[Dict[str, Any]]:
+        """
+        Get list of entrys with bids in a specific event.
+
+        See :meth:`ExtraResource.get_bids`.
+        """
+        return _result(self._client, BidRecord, await self._bid_records(event, year))
+
+    async def get_bids_many(
+        self,
+        events: Iterable[DebateEvent],
+        years: Iterable[str],
+        max_concurrency: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the bids of several events and years in one call.
+
+        See :meth:`ExtraResource.get_bids_many`.
+
+        Args:
+            events: the events to get bids for
+            years: the school years to get bids for
+            max_concurrency: pages fetched at the same time (default: the
+                site connection pool size)
+        """
+        client = self._client
+        pairs = _bid_pairs(events, years)
+        if max_concurrency is None:
+            max_concurrency = client.pool_limits.site_max_connections
+        results = await run_batch_async(
+            [lambda pair=pair: self._bid_records(*pair) for pair in pairs],
+            max_concurrency,
+        )
+        pages = [result.unwrap() for result in results]
+        return _result(client, SeasonBidRecord, _season_bids(pairs, pages))
+
+    async def _bid_records(self, event: DebateEvent, year: str) -> List[NamedTuple]:
+        client = self._client
+        form = _bids_form(event, year)
+        page = await client.request_html_page(BIDS_PATH, "POST", data=form)
+        slot, records = _recall(client, BIDS, page, BIDS_PATH, form)
+        if records is None:
+            records = await BIDS.extract_async(
+                client.parse_executor, page, client.html_backend, str(event.value.id)
             )
-            teams.append(
-                {"school": school, "location": location, "entry": entry, "code": code}
+            _remember(client, slot, records)
+        return records
+
+    async def get_teams_attending(
+        self, tournament_id: str, event_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Get entries attending an event of a tournament.
+
+        See :meth:`ExtraResource.get_teams_attending`.
+        """
+        records = await self._field_records(tournament_id, event_id)
+        return _result(self._client, FieldRecord, records)
+
+    async def get_tournament_fields(
+        self, tournament_id: str, max_concurrency: int | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get the entries of every event of a tournament.
+
+        See :meth:`ExtraResource.get_tournament_fields`.
+
+        Args:
+            tournament_id: the tournament to get entries for
+            max_concurrency: pages fetched at the same time (default: the
+                site connection pool size)
+        """
+        client = self._client
+        events = _tournament_events(await client.get(_invite_path(tournament_id)))
+        if max_concurrency is None:
+            max_concurrency = client.pool_limits.site_max_connections
+        results = await run_batch_async(
+            [
+                lambda event=event: self._field_records(tournament_id, event.id)
+                for event in events
+            ],
+            max_concurrency,
+        )
+        pages = [result.unwrap() for result in results]
+        return _result(client, TournamentFieldRecord, _tournament_fields(events, pages))
+
+    async def _field_records(
+        self, tournament_id: str, event_id: Any
+    ) -> List[NamedTuple]:
+        client = self._client
+        path = _fields_path(tournament_id, event_id)
+        page = await client.request_html_page(path, "GET")
+        slot, records = _recall(client, FIELDS, page, path)
+        if records is None:
+            records = await FIELDS.extract_async(
+                client.parse_executor, page, client.html_backend
             )
+            _remember(client, slot, records)
+        return records
+
+    async def get_bid_changes(
+        self, tracker: ChangeTracker, event: DebateEvent, year: str = "2025"
+    ) -> List[Change]:
+        """
+        Get what changed in the bids of an event since the last call.
+
+        See :meth:`ExtraResource.get_bid_changes`.
+        """
+        records = await self._bid_records(event, year)
+        changes = tracker.diff(_bid_scope(event, year), records, ROW_KEY)
+        return _changes(self._client, changes)
+
+    async def get_field_changes(
+        self, tracker: ChangeTracker, tournament_id: str, event_id: str
+    ) -> List[Change]:
+        """
+        Get what changed in the entries of an event since the last call.
+
+        See :meth:`ExtraResource.get_field_changes`.
+        """
+        records = await self._field_records(tournament_id, event_id)
+        changes = tracker.diff(_field_scope(tournament_id, event_id), records, ROW_KEY)
+        return _changes(self._client, changes)
+
+    def iter_bids(self, event: DebateEvent, year: str = "2025") -> AsyncIterator[Any]:
+        """
+        Stream the bids of an event, yielding each entry as it is parsed.
+
+        See :meth:`ExtraResource.iter_bids`.
+        """
+        return self._iter_rows(
+            BIDS,
+            str(event.value.id),
+            _compact(self._client),
+            BIDS_PATH,
+            "POST",
+            data=_bids_form(event, year),
+        )
+
+    def iter_teams_attending(
+        self, tournament_id: str, event_id: str
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the entries of an event, yielding each one as it is parsed.
+
+        See :meth:`ExtraResource.iter_bids`.
+        """
+        return self._iter_rows(
+            FIELDS,
+            FIELDS.spec.table_id,
+            _compact(self._client),
+            _fields_path(tournament_id, event_id),
+            "GET",
+        )
 
-        return teams
+    async def _iter_rows(
+        self,
+        table: TableExtractor,
+        table_id: str,
+        compact: bool,
+        path: str,
+        method: str,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """Async variant of :meth:`ExtraResource._iter_rows`."""
+        stream = await self._client.request_html(path, method, stream=True, **kwargs)
+        async for cells in _astream_rows(stream, table_id):
+            record = table.row(cells)
+            if record is not None:
+                yield record if compact else record._asdict()
@@ -3,13 +3,13 @@
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from ..client import BaseClient
+    from ..client import ResourceClient
 
 
 class NsdaResource:
     """NSDA integration operations."""
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(self, client: "ResourceClient"):
         self._client = client
 
     def get_history(self, nsda_id: int) -> dict[str, Any]:
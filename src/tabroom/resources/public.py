@@ -1,17 +1,17 @@
 """Public tournament search and listing operations."""
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 
 from ..models import Ad, Invite, Search
 
 if TYPE_CHECKING:
-    from ..client import BaseClient
+    from ..client import ResourceClient
 
 
 class PublicResource:
     """Public tournament search and listing operations."""
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(self, client: "ResourceClient"):
         self._client = client
 
     def search_tournaments(
@@ -38,6 +38,30 @@ class PublicResource:
 
         return self._client.get(path, response_model=Search)
 
+    def iter_search_tournaments(
+        self, time: str, search_string: str, circuit_id: int | None = None
+    ) -> Iterator[Search]:
+        """
+        Stream search results for non-hidden tournaments.
+
+        Like :meth:`search_tournaments`, but yields each result as soon as it
+        is downloaded.
+
+        Args:
+            time: Time filter - 'past', 'future', or 'both'
+            search_string: Search query
+            circuit_id: Optional circuit ID to filter by
+
+        Returns:
+            Iterator of search results
+        """
+        if circuit_id:
+            path = f"/public/search/{time}/{search_string}/circuit/{circuit_id}"
+        else:
+            path = f"/public/search/{time}/{search_string}"
+
+        return self._client.stream_json("GET", path, response_model=Search)
+
     def get_upcoming_tournaments(self, circuit: int | None = None) -> list[Invite]:
         """
         Get the public listing of upcoming tournaments.
@@ -58,6 +82,26 @@ class PublicResource:
 
         return self._client.get(path, response_model=Invite)
 
+    def iter_upcoming_tournaments(self, circuit: int | None = None) -> Iterator[Invite]:
+        """
+        Stream the public listing of upcoming tournaments.
+
+        Like :meth:`get_upcoming_tournaments`, but yields each invite as soon
+        as it is downloaded instead of building the whole list in memory.
+
+        Args:
+            circuit: Optional circuit ID to filter by
+
+        Returns:
+            Iterator of tournament invites
+        """
+        if circuit:
+            path = f"/public/invite/upcoming/{circuit}"
+        else:
+            path = "/public/invite/upcoming"
+
+        return self._client.stream_json("GET", path, response_model=Invite)
+
     def get_ads(self) -> list[Ad]:
         """
         Get list of ads to display on front page.
@@ -5,13 +5,13 @@ from typing import TYPE_CHECKING, Any
 from ..models import Share
 
 if TYPE_CHECKING:
-    from ..client import BaseClient
+    from ..client import ResourceClient
 
 
 class ShareResource:
     """Document sharing operations."""
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(self, client: "ResourceClient"):
         self._client = client
 
     def send_share_file(self, data: dict[str, Any]) -> Share:
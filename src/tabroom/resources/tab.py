@@ -3,13 +3,13 @@
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from ..client import BaseClient
+    from ..client import ResourceClient
 
 
 class RoundResource:
     """Operations for a specific round within a tournament."""
 
-    def __init__(self, client: "BaseClient", tourn_id: int, round_id: int):
+    def __init__(self, client: "ResourceClient", tourn_id: int, round_id: int):
         self._client = client
         self._tourn_id = tourn_id
         self._round_id = round_id
@@ -60,7 +60,7 @@ class RoundResource:
 class TimeslotResource:
     """Operations for a specific timeslot within a tournament."""
 
-    def __init__(self, client: "BaseClient", tourn_id: int, timeslot_id: int):
+    def __init__(self, client: "ResourceClient", tourn_id: int, timeslot_id: int):
         self._client = client
         self._tourn_id = tourn_id
         self._timeslot_id = timeslot_id
@@ -111,7 +111,7 @@ class TimeslotResource:
 class TournamentTabResource:
     """Tab operations for a specific tournament."""
 
-    def __init__(self, client: "BaseClient", tourn_id: int):
+    def __init__(self, client: "ResourceClient", tourn_id: int):
         self._client = client
         self._tourn_id = tourn_id
 
@@ -195,7 +195,7 @@ class TournamentTabResource:
 class TabResource:
     """Tournament tabulation operations."""
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(self, client: "ResourceClient"):
         self._client = client
 
     def tournament(self, tourn_id: int) -> TournamentTabResource:
@@ -5,13 +5,13 @@ from typing import TYPE_CHECKING
 from ..models import Person
 
 if TYPE_CHECKING:
-    from ..client import BaseClient
+    from ..client import ResourceClient
 
 
 class UserResource:
     """User profile operations."""
 
-    def __init__(self, client: "BaseClient"):
+    def __init__(self, client: "ResourceClient"):
         self._client = client
 
     def get_profile(self) -> Person:
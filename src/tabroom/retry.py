@@ -0,0 +1,167 @@
+"""Retry policy for transient Tabroom failures."""
+
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of recent traffic so retries cannot amplify an
+    outage.
+
+    Within a sliding ``window`` a retry is allowed while the number of retries
+    stays below ``ratio`` times the number of requests, with a floor of
+    ``min_retries`` so a quiet client can still retry. Thread-safe; share one
+    budget between clients to cap a whole process.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 10, window: float = 10.0):
+        """
+        Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per request within the window
+            min_retries: Retries always allowed within the window
+            window: Sliding window length in seconds
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] < cutoff:
+                events.popleft()
+
+    def deposit(self) -> None:
+        """Record a new (first-attempt) request."""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            self._requests.append(now)
+
+    def withdraw(self) -> bool:
+        """Try to spend one retry; return False if the budget is exhausted."""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            allowed = max(self.min_retries, self.ratio * len(self._requests))
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed request.
+
+    Only methods in ``methods`` are retried, so a POST that may have reached
+    the server is never replayed unless explicitly allowed. Delays grow
+    exponentially from ``backoff_base`` up to ``backoff_max`` with full jitter;
+    a ``Retry-After`` header on 429/503 sets the minimum wait.
+
+    Attributes:
+        max_retries: Retries after the first attempt
+        backoff_base: Delay before the first retry, in seconds
+        backoff_max: Upper bound for a computed backoff delay
+        jitter: Randomize delays between 0 and the computed backoff
+        statuses: Response status codes that are retried
+        methods: HTTP methods that are safe to retry
+        retry_connection_errors: Retry when no response was received
+        respect_retry_after: Honour ``Retry-After`` on 429/503
+        max_retry_after: Give up instead of waiting longer than this
+        budget: Shared budget limiting the overall retry rate
+    """
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    statuses: frozenset[int] = RETRY_STATUSES
+    methods: frozenset[str] = IDEMPOTENT_METHODS
+    retry_connection_errors: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = 120.0
+    budget: RetryBudget | None = field(default_factory=RetryBudget)
+
+    def begin(self) -> None:
+        """Record the first attempt of a request against the budget."""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def backoff(self, attempt: int) -> float:
+        """Get the backoff delay before retry number ``attempt + 1``."""
+        delay = min(self.backoff_max, self.backoff_base * (2**attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: int | None = None,
+        retry_after: str | None = None,
+    ) -> float | None:
+        """
+        Decide whether to retry a failed attempt.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of retries already made
+            status_code: Response status, or None for a connection error
+            retry_after: Value of the response's Retry-After header
+
+        Returns:
+            Seconds to wait before retrying, or None to stop retrying
+        """
+        if attempt >= self.max_retries or method.upper() not in self.methods:
+            return None
+        if status_code is None:
+            if not self.retry_connection_errors:
+                return None
+        elif status_code not in self.statuses:
+            return None
+
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and status_code in RETRY_AFTER_STATUSES:
+            requested = parse_retry_after(retry_after)
+            if requested is not None:
+                if requested > self.max_retry_after:
+                    return None
+                delay = max(delay, requested)
+
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+        return delay
@@ -0,0 +1,420 @@
+"""Pluggable HTML parser backends for scraping tables out of Tabroom pages."""
+
+import codecs
+import inspect
+import re
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AnyStr,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Protocol,
+)
+
+try:
+    import lxml.etree
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+_SNIFF_BYTES = 2048
+_TABLE_TAG = re.compile(r"<(/?)table\b", re.IGNORECASE)
+_TABLE_TAG_BYTES = re.compile(rb"<(/?)table\b", re.IGNORECASE)
+_META_CHARSET = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE
+)
+_HEADER_CHARSET = re.compile(r"""charset\s*=\s*["']?([\w.:-]+)""", re.IGNORECASE)
+
+
+def find_table(markup: AnyStr, table_id: str) -> AnyStr | None:
+    """
+    Cut the markup of one table out of a page without parsing the page.
+
+    Works on decoded text and on raw bytes of ASCII-compatible encodings.
+
+    Args:
+        markup: Page HTML
+        table_id: ``id`` attribute of the table
+
+    Returns:
+        The ``<table ...>...</table>`` source, or None if there is no such table
+    """
+    # The id attribute itself, not the tail of data-id= or similar
+    pattern = rf"<table\b[^>]*?\sid\s*=\s*[\"']?{re.escape(table_id)}[\"'\s>/]"
+    if isinstance(markup, bytes):
+        opening = re.search(pattern.encode(), markup, re.IGNORECASE)
+        tags, close = _TABLE_TAG_BYTES, b">"
+    else:
+        opening = re.search(pattern, markup, re.IGNORECASE)
+        tags, close = _TABLE_TAG, ">"
+    if opening is None:
+        return None
+
+    # Match the closing tag, skipping over nested tables
+    depth = 0
+    for tag in tags.finditer(markup, opening.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return markup[opening.start() : markup.index(close, tag.end()) + 1]
+    return markup[opening.start() :]
+
+
+def sniff_encoding(content_type: str | None, content: bytes) -> str:
+    """
+    Work out the charset of an HTML response.
+
+    Uses the ``Content-Type`` charset, then a ``<meta>`` charset near the top
+    of the page, then UTF-8.
+    """
+    for source, pattern in (
+        (content_type or "", _HEADER_CHARSET),
+        (content[:_SNIFF_BYTES], _META_CHARSET),
+    ):
+        match = pattern.search(source)
+        if match:
+            name = match.group(1)
+            name = name.decode("ascii") if isinstance(name, bytes) else name
+            try:
+                return codecs.lookup(name).name
+            except LookupError:
+                pass
+    return "utf-8"
+
+
+@dataclass(frozen=True)
+class HTMLPage:
+    """
+    Raw body of a scraped page and its charset.
+
+    Attributes:
+        content: Response bytes
+        encoding: Charset the bytes are decoded with
+    """
+
+    content: bytes
+    encoding: str = "utf-8"
+
+    @property
+    def text(self) -> str:
+        """The whole page as text."""
+        return self.content.decode(self.encoding, errors="replace")
+
+    def table(self, table_id: str) -> str | None:
+        """Decode only the source of one table (see :func:`find_table`)."""
+        fragment = find_table(self.content, table_id)
+        if fragment is None:
+            return None
+        return fragment.decode(self.encoding, errors="replace")
+
+
+def _fragment(markup: str | HTMLPage, table_id: str) -> str | None:
+    if isinstance(markup, HTMLPage):
+        return markup.table(table_id)
+    return find_table(markup, table_id)
+
+
+class HTMLBackend(Protocol):
+    """Extracts the body rows of a table from HTML."""
+
+    name: str
+
+    def table_rows(self, markup: str | HTMLPage, table_id: str) -> list[list[str]]:
+        """
+        Get the stripped cell texts of every body row of a table.
+
+        Only the target table is decoded and parsed. Rows come from
+        ``<tbody>`` when the table has one, otherwise from every row outside
+        ``<thead>``.
+
+        Args:
+            markup: Page HTML, as text or as a raw :class:`HTMLPage`
+            table_id: ``id`` attribute of the table
+
+        Returns:
+            One list of cell texts per row; empty if the table is missing
+        """
+        ...
+
+
+class Bs4Backend:
+    """Backend using BeautifulSoup's pure-Python ``html.parser``."""
+
+    name = "bs4"
+
+    def table_rows(self, markup: str | HTMLPage, table_id: str) -> list[list[str]]:
+        """Get the stripped cell texts of every body row of a table."""
+        # Imported here: BeautifulSoup is slow to import and often unused
+        from bs4 import BeautifulSoup
+
+        fragment = _fragment(markup, table_id)
+        if fragment is None:
+            return []
+        table = BeautifulSoup(fragment, "html.parser").table
+        body = table.find("tbody", recursive=False)
+        if body is not None:
+            rows = body.find_all("tr", recursive=False)
+        else:
+            rows = [
+                row
+                for row in table.find_all("tr")
+                if row.find_parent("table") is table
+                and row.find_parent("thead") is None
+            ]
+        return [
+            [
+                cell.get_text().strip()
+                for cell in row.find_all(["td", "th"], recursive=False)
+            ]
+            for row in rows
+        ]
+
+
+class LxmlBackend:
+    """Backend using lxml's C HTML parser."""
+
+    name = "lxml"
+
+    def __init__(self):
+        if lxml is None:
+            raise ImportError("LxmlBackend requires lxml: pip install lxml")
+
+    def table_rows(self, markup: str | HTMLPage, table_id: str) -> list[list[str]]:
+        """Get the stripped cell texts of every body row of a table."""
+        fragment = _fragment(markup, table_id)
+        if fragment is None:
+            return []
+        table = lxml.html.fragment_fromstring(fragment)
+        rows = table.xpath("./tbody/tr") or table.xpath("./tr")
+        return [
+            [cell.text_content().strip() for cell in row if cell.tag in ("td", "th")]
+            for row in rows
+        ]
+
+
+class SelectolaxBackend:
+    """Backend using selectolax's Lexbor engine."""
+
+    name = "selectolax"
+
+    def __init__(self):
+        if LexborHTMLParser is None:
+            raise ImportError(
+                "SelectolaxBackend requires selectolax: pip install selectolax"
+            )
+
+    def table_rows(self, markup: str | HTMLPage, table_id: str) -> list[list[str]]:
+        """Get the stripped cell texts of every body row of a table."""
+        fragment = _fragment(markup, table_id)
+        if fragment is None:
+            return []
+        # HTML5 parsing always wraps body rows of a table in <tbody>
+        table = LexborHTMLParser(fragment).css_first("table")
+        body = next((node for node in table.iter() if node.tag == "tbody"), table)
+        return [
+            [cell.text().strip() for cell in row.iter() if cell.tag in ("td", "th")]
+            for row in body.iter()
+            if row.tag == "tr"
+        ]
+
+
+def default_html_backend() -> HTMLBackend:
+    """Get the fastest installed backend: selectolax, then lxml, then bs4."""
+    if LexborHTMLParser is not None:
+        return SelectolaxBackend()
+    if lxml is not None:
+        return LxmlBackend()
+    return Bs4Backend()
+
+
+class HTMLStream:
+    """
+    Body of a streamed web page, read chunk by chunk.
+
+    Returned by ``request_html(..., stream=True)``. Iterate it (``async for``
+    on the async client) to get raw byte chunks, and close it, or use it as a
+    context manager, to release the connection early.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes] | AsyncIterable[bytes],
+        content_type: str | None = None,
+        close: Callable[[], Any] | None = None,
+    ):
+        """
+        Initialize the stream.
+
+        Args:
+            chunks: Byte chunks of the body (sync or async iterable)
+            content_type: ``Content-Type`` header of the response
+            close: Releases the underlying response; may return an awaitable
+        """
+        self.content_type = content_type
+        self._chunks = chunks
+        self._close = close
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._chunks)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return aiter(self._chunks)
+
+    def close(self) -> None:
+        """Release the response."""
+        if self._close is not None:
+            self._close()
+
+    async def aclose(self) -> None:
+        """Release the response of an async client."""
+        if self._close is not None:
+            result = self._close()
+            if inspect.isawaitable(result):
+                await result
+
+    def __enter__(self) -> "HTMLStream":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "HTMLStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+class TableRowParser:
+    """
+    Extracts the body rows of one table from byte chunks as they arrive.
+
+    Each call to :meth:`feed` returns the rows whose ``</tr>`` it completed,
+    and finished elements are discarded, so memory does not grow with the
+    page. :attr:`done` turns true once the table has closed and the rest of
+    the page can be skipped. Row selection matches :class:`HTMLBackend`.
+
+    Uses lxml's incremental parser; without lxml the page is buffered and
+    parsed by :class:`Bs4Backend` on :meth:`close`.
+
+    Example:
+        >>> parser = TableRowParser("fieldsort", "text/html; charset=utf-8")
+        >>> for chunk in stream:
+        ...     for cells in parser.feed(chunk):
+        ...         print(cells)
+        ...     if parser.done:
+        ...         break
+        >>> rest = parser.close()
+    """
+
+    def __init__(self, table_id: str, content_type: str | None = None):
+        """
+        Initialize the parser.
+
+        Args:
+            table_id: ``id`` attribute of the table
+            content_type: ``Content-Type`` header, for the charset
+        """
+        self.table_id = table_id
+        self.content_type = content_type
+        self.done = False
+        self._buffer = b""
+        self._parser = None
+        self._table = None
+
+    def feed(self, chunk: bytes) -> list[list[str]]:
+        """Add a chunk and return every row it completes."""
+        if self.done or not chunk:
+            return []
+        if self._parser is not None:
+            self._parser.feed(chunk)
+            return self._drain()
+        self._buffer += chunk
+        if lxml is None or len(self._buffer) < _SNIFF_BYTES:
+            # Hold the start of the page until its <meta> charset is in view
+            return []
+        self._start()
+        return self._drain()
+
+    def close(self) -> list[list[str]]:
+        """Finish parsing and return any remaining rows."""
+        if self.done:
+            return []
+        if lxml is None:
+            self.done = True
+            encoding = sniff_encoding(self.content_type, self._buffer)
+            return Bs4Backend().table_rows(
+                HTMLPage(self._buffer, encoding), self.table_id
+            )
+        if self._parser is None:
+            if not self._buffer:
+                self.done = True
+                return []
+            self._start()
+        self._parser.close()
+        rows = self._drain()
+        self.done = True
+        return rows
+
+    def _start(self) -> None:
+        encoding = sniff_encoding(self.content_type, self._buffer)
+        self._parser = lxml.etree.HTMLPullParser(
+            events=("start", "end"), encoding=encoding
+        )
+        self._parser.feed(self._buffer)
+        self._buffer = b""
+
+    def _drain(self) -> list[list[str]]:
+        rows = []
+        for event, element in self._parser.read_events():
+            if self.done:
+                break
+            table = self._table
+            if event == "start":
+                if (
+                    table is None
+                    and element.tag == "table"
+                    and element.get("id") == self.table_id
+                ):
+                    self._table = element
+                continue
+
+            if element is table:
+                self.done = True
+            elif table is None:
+                # Nothing before the table is needed
+                self._discard(element)
+            elif element.tag == "tr" and self._is_body_row(element):
+                rows.append(
+                    [
+                        "".join(cell.itertext()).strip()
+                        for cell in element
+                        if cell.tag in ("td", "th")
+                    ]
+                )
+                self._discard(element)
+            elif element.tag == "thead" and element.getparent() is table:
+                self._discard(element)
+        return rows
+
+    def _is_body_row(self, row: Any) -> bool:
+        parent = row.getparent()
+        return parent is self._table or (
+            parent.tag == "tbody" and parent.getparent() is self._table
+        )
+
+    @staticmethod
+    def _discard(element: Any) -> None:
+        element.clear()
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
@@ -0,0 +1,151 @@
+"""Content-hash snapshots of the rows extracted from scraped pages."""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Mapping
+
+from .http_cache import HTTPCache
+
+if TYPE_CHECKING:
+    from .scraping import HTMLPage
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Rows extracted from one version of a page.
+
+    Attributes:
+        digest: Hash of the page body the rows came from
+        rows: Extracted rows
+    """
+
+    digest: str
+    rows: tuple[tuple, ...]
+
+
+class SnapshotStore:
+    """
+    Remembers what was extracted from each scraped page, by body hash.
+
+    Pollers download the same pages over and over while they rarely change.
+    With a store, each downloaded body is hashed; if the hash matches the
+    last one seen for the same URL and form data, the rows extracted then
+    are reused and the page is not parsed again. Pages are still downloaded,
+    so a changed page is never missed.
+
+    Snapshots are kept in memory (least recently used evicted first) and,
+    with ``directory``, also as one JSON file per page so they survive
+    restarts. Persisted rows must be JSON-serializable.
+
+    Example:
+        >>> client = TabroomClient(snapshots=SnapshotStore(".tabroom-snapshots"))
+        >>> client.extra.get_bids(DebateEvent.POLICY)  # parsed
+        >>> client.extra.get_bids(DebateEvent.POLICY)  # page unchanged: reused
+        >>> client._base_client.snapshots.hits
+        1
+    """
+
+    def __init__(self, directory: str | None = None, max_entries: int = 1024):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory persisting snapshots (default: memory only)
+            max_entries: Snapshots kept in memory
+        """
+        self.directory = directory
+        self.max_entries = max_entries
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._entries: OrderedDict[str, Snapshot] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(path: str, data: Mapping[str, Any] | None, table: str) -> str:
+        """Build the key of a page: its path, form data and the table read."""
+        return HTTPCache.key(f"/{path.lstrip('/')} {table}", data, None)
+
+    @staticmethod
+    def digest(page: "HTMLPage") -> str:
+        """Hash a page body and its charset."""
+        digest = hashlib.blake2b(page.content, digest_size=16)
+        digest.update(page.encoding.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str, digest: str) -> tuple[tuple, ...] | None:
+        """
+        Get the rows of a page if its body is unchanged.
+
+        Args:
+            key: Page key (see :meth:`key`)
+            digest: Hash of the body just downloaded (see :meth:`digest`)
+
+        Returns:
+            The rows extracted from the same body, or None on a miss
+        """
+        snapshot = self._load(key)
+        with self._lock:
+            if snapshot is None or snapshot.digest != digest:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return snapshot.rows
+
+    def put(self, key: str, digest: str, rows: list[tuple]) -> None:
+        """Remember the rows extracted from the body with ``digest``."""
+        snapshot = Snapshot(digest, tuple(rows))
+        self._remember(key, snapshot)
+        if self.directory is None:
+            return
+        data = {"digest": digest, "rows": snapshot.rows}
+        # Write atomically so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, self._path(key))
+
+    def clear(self) -> None:
+        """Remove every snapshot and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _load(self, key: str) -> Snapshot | None:
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is not None:
+                self._entries.move_to_end(key)
+                return snapshot
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        snapshot = Snapshot(data["digest"], tuple(map(tuple, data["rows"])))
+        self._remember(key, snapshot)
+        return snapshot
+
+    def _remember(self, key: str, snapshot: Snapshot) -> None:
+        with self._lock:
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,104 @@
+"""Incremental decoding of JSON array responses."""
+
+import codecs
+import json
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+# Characters that can continue a number token
+_NUMBER = frozenset("0123456789.eE+-")
+_COMPACT_AT = 64 * 1024
+
+
+class JSONArrayDecoder:
+    """
+    Decodes a top-level JSON array from byte chunks, one element at a time.
+
+    Each call to :meth:`feed` returns the elements completed by that chunk, so
+    memory holds at most one partial element plus a chunk. A document that is
+    not an array is buffered and returned whole by :meth:`close`.
+
+    Example:
+        >>> decoder = JSONArrayDecoder()
+        >>> decoder.feed(b'[{"id": 1}, {"i')
+        [{'id': 1}]
+        >>> decoder.feed(b'd": 2}]')
+        [{'id': 2}]
+        >>> decoder.close()
+        []
+    """
+
+    def __init__(self):
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        # One of "start", "value", "separator", "end" or "document"
+        self._state = "start"
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk and return every element it completes."""
+        self._buffer += self._text.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """Finish decoding and return any remaining elements."""
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._state == "document":
+            rest = self._buffer[self._pos :].strip()
+            return [json.loads(rest)] if rest else []
+        if self._state != "end":
+            raise ValueError("Truncated JSON array")
+        return items
+
+    def _skip_whitespace(self) -> bool:
+        """Advance past whitespace; return False if the buffer ran out."""
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+
+    def _drain(self, final: bool) -> list[Any]:
+        items = []
+        while self._state not in ("end", "document") and self._skip_whitespace():
+            char = self._buffer[self._pos]
+            if self._state == "start":
+                if char == "[":
+                    self._pos += 1
+                    self._state = "value"
+                else:
+                    self._state = "document"
+            elif self._state == "separator":
+                if char not in ",]":
+                    raise ValueError(f"Expected ',' or ']' at offset {self._pos}")
+                self._pos += 1
+                self._state = "value" if char == "," else "end"
+            elif char == "]":
+                # Empty array
+                self._pos += 1
+                self._state = "end"
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(self._buffer, self._pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                # A number may continue in the next chunk: "1" or "1." may
+                # become "1.5", "1e" may become "1e5"
+                if (
+                    not final
+                    and type(item) in (int, float)
+                    and _NUMBER.issuperset(self._buffer[end:])
+                ):
+                    break
+                items.append(item)
+                self._pos = end
+                self._state = "separator"
+
+        if self._pos > _COMPACT_AT:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        return items
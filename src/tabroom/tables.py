@@ -0,0 +1,240 @@
+"""Declarative extraction of typed records from scraped HTML tables."""
+
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple
+
+from .records import make_record
+from .scraping import HTMLBackend, HTMLPage
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+def integer(text: str) -> int | None:
+    """Convert a cell to an int; blank or non-numeric cells become None."""
+    try:
+        return int(text.replace(",", ""))
+    except ValueError:
+        return None
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    One column of a scraped table.
+
+    Attributes:
+        name: Field name in the extracted records
+        index: Position of the cell in the row
+        convert: Applied to the stripped cell text (default: keep the text)
+    """
+
+    name: str
+    index: int
+    convert: Callable[[str], Any] | None = None
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """
+    Which table of a page to read and how to turn its rows into records.
+
+    Compile a spec once with :meth:`compile` and reuse the extractor for
+    every page. Rows with fewer cells than the spec needs are skipped. For
+    records that can be pickled, compile with the module's ``__name__`` and
+    bind the extractor's ``record`` type to a module name equal to the spec
+    name.
+
+    Example:
+        >>> SCHOOLS = TableSpec(
+        ...     "SchoolRecord",
+        ...     (Column("school", 0), Column("entries", 2, integer)),
+        ...     table_id="schools",
+        ... ).compile(__name__)
+        >>> SCHOOLS.extract(page, client.html_backend)
+        [SchoolRecord(school='Alpha HS', entries=4), ...]
+
+    Attributes:
+        name: Name of the generated record type
+        columns: Columns to extract, in record field order
+        table_id: ``id`` of the table, unless given per page
+    """
+
+    name: str
+    columns: tuple[Column, ...]
+    table_id: str | None = None
+
+    def compile(self, module: str | None = None) -> "TableExtractor":
+        """
+        Build the extractor for this spec.
+
+        Args:
+            module: ``__module__`` of the record type, usually the calling
+                module's ``__name__``
+        """
+        return TableExtractor(self, module)
+
+
+class TableExtractor:
+    """Compiled :class:`TableSpec`: turns cell lists into records in one pass."""
+
+    def __init__(self, spec: TableSpec, module: str | None = None):
+        """
+        Initialize the extractor.
+
+        Args:
+            spec: Table description
+            module: ``__module__`` of the generated record type
+        """
+        if not spec.columns:
+            raise ValueError("A table spec needs at least one column")
+        self.spec = spec
+        self.record = make_record(
+            spec.name, [column.name for column in spec.columns], module
+        )
+        self._width = max(column.index for column in spec.columns) + 1
+        self._make = self._compile_row(spec.columns, self.record._make)
+        self._make_tuple = self._compile_row(spec.columns, tuple)
+
+    @staticmethod
+    def _compile_row(
+        columns: tuple[Column, ...], make: Callable[[Iterable[Any]], tuple]
+    ) -> Callable[[list[str]], Any]:
+        """Build the function that makes one record from a row's cells."""
+        indices = [column.index for column in columns]
+        pick: Callable[[list[str]], tuple] = itemgetter(*indices)
+        if len(indices) == 1:
+            # itemgetter of one index returns a bare value, not a tuple
+            index = indices[0]
+            pick = lambda cells: (cells[index],)  # noqa: E731
+
+        if not any(column.convert for column in columns):
+            return lambda cells: make(pick(cells))
+
+        converters = [column.convert or str for column in columns]
+        return lambda cells: make(
+            [convert(text) for convert, text in zip(converters, pick(cells))]
+        )
+
+    def row(self, cells: list[str]) -> "NamedTuple | None":
+        """Turn one row of cell texts into a record; None if it is too short."""
+        return self._make(cells) if len(cells) >= self._width else None
+
+    def rows(self, cells: Iterable[list[str]]) -> Iterator[NamedTuple]:
+        """Turn rows of cell texts into records, skipping short rows."""
+        make, width = self._make, self._width
+        for row in cells:
+            if len(row) >= width:
+                yield make(row)
+
+    def extract(
+        self,
+        markup: str | HTMLPage | None,
+        backend: HTMLBackend,
+        table_id: str | None = None,
+    ) -> list[NamedTuple]:
+        """
+        Extract the records of a page.
+
+        Args:
+            markup: Page HTML, as text or as a raw :class:`HTMLPage`
+            backend: Parser backend used to read the table
+            table_id: Overrides the spec's ``table_id``
+
+        Returns:
+            Records of the table's body rows; empty if the page or table is
+            missing
+        """
+        if markup is None:
+            return []
+        return list(self.rows(backend.table_rows(markup, self._table_id(table_id))))
+
+    def submit(
+        self,
+        executor: Executor,
+        page: HTMLPage,
+        backend: HTMLBackend,
+        table_id: str | None = None,
+    ) -> "Future[list[tuple]]":
+        """
+        Parse a page in an executor, typically a ``ProcessPoolExecutor``.
+
+        The worker receives the raw page bytes and returns plain tuples, which
+        are cheap to pickle; turn them into records with :meth:`records`.
+        Converters and the backend must be picklable (module-level functions
+        and the built-in backends are).
+
+        Returns:
+            Future of the rows as plain tuples
+        """
+        return executor.submit(
+            extract_tuples,
+            self.spec,
+            backend,
+            page.content,
+            page.encoding,
+            self._table_id(table_id),
+        )
+
+    def records(self, rows: Iterable[tuple]) -> list[NamedTuple]:
+        """Turn plain tuples from :meth:`submit` into records."""
+        return list(map(self.record._make, rows))
+
+    def extract_in(
+        self,
+        executor: Executor | None,
+        page: HTMLPage | None,
+        backend: HTMLBackend,
+        table_id: str | None = None,
+    ) -> list[NamedTuple]:
+        """Like :meth:`extract`, but parse in ``executor`` when one is given."""
+        if executor is None or page is None:
+            return self.extract(page, backend, table_id)
+        return self.records(self.submit(executor, page, backend, table_id).result())
+
+    async def extract_async(
+        self,
+        executor: Executor | None,
+        page: HTMLPage | None,
+        backend: HTMLBackend,
+        table_id: str | None = None,
+    ) -> list[NamedTuple]:
+        """Like :meth:`extract_in`, awaiting the executor without blocking the loop."""
+        if executor is None or page is None:
+            return self.extract(page, backend, table_id)
+        future = self.submit(executor, page, backend, table_id)
+        rows: list[tuple] = await asyncio.wrap_future(future)
+        return self.records(rows)
+
+    def _table_id(self, table_id: str | None) -> str:
+        table_id = table_id or self.spec.table_id
+        if table_id is None:
+            raise ValueError(f"No table id given for {self.spec.name}")
+        return table_id
+
+
+@lru_cache(maxsize=64)
+def _compiled(spec: TableSpec) -> TableExtractor:
+    return TableExtractor(spec)
+
+
+def extract_tuples(
+    spec: TableSpec,
+    backend: HTMLBackend,
+    content: bytes,
+    encoding: str,
+    table_id: str,
+) -> list[tuple]:
+    """
+    Extract the rows of a raw page as plain tuples.
+
+    Entry point of executor workers; the compiled spec is cached per process.
+    """
+    extractor = _compiled(spec)
+    make, width = extractor._make_tuple, extractor._width
+    rows = backend.table_rows(HTMLPage(content, encoding), table_id)
+    return [make(row) for row in rows if len(row) >= width]
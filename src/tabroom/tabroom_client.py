@@ -0,0 +1,278 @@
+"""High-level synchronous Tabroom client."""
+
+import threading
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Callable, Iterable, TypeVar
+
+from . import resources
+from .batch import BatchResult, run_batch
+from .cache import ResponseCache
+from .client import BaseClient
+from .codec import JSONCodec
+from .http_cache import HTTPCache
+from .parsing import ParseMode
+from .pool import PoolLimits
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from .resources import (
+        AccessResource,
+        CaselistResource,
+        ExtraResource,
+        NsdaResource,
+        PaymentResource,
+        PublicResource,
+        ShareResource,
+        SystemResource,
+        TabResource,
+        UserResource,
+    )
+    from .scraping import HTMLBackend
+    from .snapshots import SnapshotStore
+
+R = TypeVar("R")
+
+
+class TabroomClient:
+    """
+    Main client for interacting with the Tabroom API.
+
+    Example:
+        >>> client = TabroomClient(username="user@example.com", password="password")
+        >>> profile = client.user.get_profile()
+        >>> tournaments = client.public.search_tournaments("future", "TOC")
+        >>> dashboard = client.tab.tournament(123).get_dashboard()
+
+    A single client is safe to share across a thread pool: resources are
+    created once under a lock and requests share one pooled session. Pass
+    ``pool_limits`` sized to the number of threads.
+    """
+
+    def __init__(
+        self,
+        api_base_url: str = "https://api.tabroom.com/v1",
+        site_base_url: str = "https://www.tabroom.com",
+        username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+        timeout: float = 30.0,
+        auto_login: bool = True,
+        pool_limits: PoolLimits | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http_cache: HTTPCache | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = False,
+        codec: JSONCodec | None = None,
+        parse_mode: ParseMode | str = ParseMode.VALIDATE,
+        html_backend: "HTMLBackend | None" = None,
+        parse_executor: Executor | None = None,
+        snapshots: "SnapshotStore | None" = None,
+    ):
+        """
+        Initialize the Tabroom API client.
+
+        Args:
+            api_base_url: Base URL for API endpoints (default: https://api.tabroom.com/v1)
+            auth_base_url: Base URL for authentication (default: https://www.tabroom.com)
+            username: Username for login
+            password: Password for login
+            token: Optional existing TabroomToken (skips login if provided)
+            timeout: Request timeout in seconds (default: 30.0)
+            auto_login: Automatically login if username/password provided (default: True)
+            pool_limits: Per-host connection pool sizing and keep-alive
+            retry: Retry policy for transient failures (default: no retries)
+            rate_limiter: Client-side request pacing (default: unlimited)
+            http_cache: ETag/Last-Modified cache for GET responses (default: off)
+            cache: Per-endpoint TTL cache of parsed GET results (default: off)
+            coalesce: Share one request between identical concurrent GETs (default: False)
+            codec: JSON codec (default: orjson or msgspec if installed, else stdlib)
+            parse_mode: Default model parsing mode (see :class:`ParseMode`)
+            html_backend: HTML parser for scraped pages (default: selectolax or
+                lxml if installed, else BeautifulSoup)
+            parse_executor: Executor, e.g. a ProcessPoolExecutor, that parses
+                scraped pages off the calling thread (default: parse inline)
+            snapshots: Reuses the rows of scraped pages whose body is
+                unchanged (default: off)
+        """
+        self._base_client = BaseClient(
+            api_base_url=api_base_url,
+            site_base_url=site_base_url,
+            username=username,
+            password=password,
+            token=token,
+            timeout=timeout,
+            auto_login=auto_login,
+            pool_limits=pool_limits,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            http_cache=http_cache,
+            cache=cache,
+            coalesce=coalesce,
+            codec=codec,
+            parse_mode=parse_mode,
+            html_backend=html_backend,
+            parse_executor=parse_executor,
+            snapshots=snapshots,
+        )
+
+        # Initialize resources lazily
+        self._resource_lock = threading.Lock()
+        self._user_resource: UserResource | None = None
+        self._public_resource: PublicResource | None = None
+        self._tab_resource: TabResource | None = None
+        self._access_resource: AccessResource | None = None
+        self._caselist_resource: CaselistResource | None = None
+        self._nsda_resource: NsdaResource | None = None
+        self._share_resource: ShareResource | None = None
+        self._payment_resource: PaymentResource | None = None
+        self._system_resource: SystemResource | None = None
+        self._extra_resource: ExtraResource | None = None
+
+    def _resource(self, attr: str, factory: type) -> Any:
+        """Create the resource stored in ``attr`` once, safely across threads."""
+        resource = getattr(self, attr)
+        if resource is None:
+            with self._resource_lock:
+                resource = getattr(self, attr)
+                if resource is None:
+                    resource = factory(self._base_client)
+                    setattr(self, attr, resource)
+        return resource
+
+    def login(self, username: str, password: str) -> None:
+        """
+        Log in to Tabroom.
+
+        Args:
+            username: Username
+            password: Password
+        """
+        self._base_client.login(username, password)
+
+    def logout(self) -> None:
+        """Log out and clear authentication."""
+        self._base_client.logout()
+
+    def is_authenticated(self) -> bool:
+        """Check if client is authenticated."""
+        return self._base_client.is_authenticated()
+
+    @property
+    def token(self) -> str | None:
+        """Get the current authentication token."""
+        return self._base_client.token
+
+    @property
+    def user(self) -> "UserResource":
+        """Access user profile operations."""
+        return self._resource("_user_resource", resources.UserResource)
+
+    @property
+    def public(self) -> "PublicResource":
+        """Access public tournament search and listing operations."""
+        return self._resource("_public_resource", resources.PublicResource)
+
+    @property
+    def tab(self) -> "TabResource":
+        """Access tournament tabulation operations."""
+        return self._resource("_tab_resource", resources.TabResource)
+
+    @property
+    def access(self) -> "AccessResource":
+        """Access permission and access control operations."""
+        return self._resource("_access_resource", resources.AccessResource)
+
+    @property
+    def caselist(self) -> "CaselistResource":
+        """Access caselist integration operations."""
+        return self._resource("_caselist_resource", resources.CaselistResource)
+
+    @property
+    def nsda(self) -> "NsdaResource":
+        """Access NSDA integration operations."""
+        return self._resource("_nsda_resource", resources.NsdaResource)
+
+    @property
+    def share(self) -> "ShareResource":
+        """Access document sharing operations."""
+        return self._resource("_share_resource", resources.ShareResource)
+
+    @property
+    def payment(self) -> "PaymentResource":
+        """Access payment processing operations."""
+        return self._resource("_payment_resource", resources.PaymentResource)
+
+    @property
+    def system(self) -> "SystemResource":
+        """Access system status operations."""
+        return self._resource("_system_resource", resources.SystemResource)
+
+    @property
+    def extra(self) -> "ExtraResource":
+        """Access extra status operations."""
+        return self._resource("_extra_resource", resources.ExtraResource)
+
+    def batch(
+        self, calls: Iterable[Callable[[], R]], max_workers: int | None = None
+    ) -> list[BatchResult[R]]:
+        """
+        Run many calls concurrently over the shared session.
+
+        Failures are collected per call instead of aborting the batch.
+
+        Example:
+            >>> results = client.batch(
+            ...     [
+            ...         lambda: client.user.get_profile_by_id(1),
+            ...         lambda: client.caselist.get_students(2),
+            ...     ]
+            ... )
+            >>> profile = results[0].unwrap()
+
+        Args:
+            calls: Zero-argument callables, e.g. lambdas or functools.partial
+            max_workers: Concurrent calls (default: the API connection pool size)
+
+        Returns:
+            One BatchResult per call, in input order
+        """
+        if max_workers is None:
+            max_workers = self._base_client.pool_limits.api_max_connections
+        return run_batch(calls, max_workers)
+
+    def map_many(
+        self,
+        fn: Callable[[Any], R],
+        items: Iterable[Any],
+        max_workers: int | None = None,
+    ) -> list[BatchResult[R]]:
+        """
+        Call ``fn`` on every item concurrently.
+
+        Example:
+            >>> results = client.map_many(client.user.get_profile_by_id, judge_ids)
+            >>> profiles = [r.value for r in results if r.ok]
+
+        Args:
+            fn: Function taking one item, typically a resource method
+            items: Arguments to call ``fn`` with
+            max_workers: Concurrent calls (default: the API connection pool size)
+
+        Returns:
+            One BatchResult per item, in input order
+        """
+        return self.batch([lambda item=item: fn(item) for item in items], max_workers)
+
+    def close(self) -> None:
+        """Close the HTTP client connection."""
+        self._base_client.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -0,0 +1,90 @@
+"""Shared fixtures for the Tabroom client tests."""
+
+import json
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from tabroom import TabroomClient
+
+
+class StubAdapter(BaseAdapter):
+    """Requests transport adapter that answers from a handler function."""
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.requests: list[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        result = self.handler(request)
+        if isinstance(result, Exception):
+            raise result
+
+        status, body, *rest = result
+        headers = rest[0] if rest else {}
+
+        response = requests.Response()
+        response.status_code = status
+        response.url = request.url
+        response.request = request
+        response.headers.update(headers)
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode()
+            response.headers.setdefault("Content-Type", "application/json")
+        elif isinstance(body, str):
+            body = body.encode()
+        response._content = body or b""
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        pass
+
+
+def _table_page(table_id, rows):
+    cells = "\t<td>\n\t\t{}\n\t</td>\n"
+    body = "".join(
+        "<tr>\n" + "".join(cells.format(cell) for cell in row) + "</tr>\n"
+        for row in rows
+    )
+    return (
+        "<html><body><div>\n"
+        f'<table id="{table_id}">\n<thead><tr><th>h</th></tr></thead>\n'
+        f"<tbody>\n{body}</tbody>\n</table>\n</div></body></html>"
+    )
+
+
+@pytest.fixture
+def bids_page():
+    """Build a toc_bids page: ``bids_page(event_id, [(school, state, entry, bids)])``."""
+    return _table_page
+
+
+@pytest.fixture
+def fields_page():
+    """Build a fields page: ``fields_page([(school, location, entry, code)])``."""
+    return lambda rows: _table_page("fieldsort", rows)
+
+
+@pytest.fixture
+def stub_client():
+    """Build a TabroomClient whose HTTP traffic is answered by ``handler``."""
+    clients = []
+
+    def build(handler, **kwargs):
+        kwargs.setdefault("token", "tok")
+        client = TabroomClient(**kwargs)
+        adapter = StubAdapter(handler)
+        session = client._base_client._client
+        for prefix in list(session.adapters):
+            session.mount(prefix, adapter)
+        client.adapter = adapter
+        clients.append(client)
+        return client
+
+    yield build
+    for client in clients:
+        client.close()
@@ -0,0 +1,261 @@
+"""Tests for the asyncio Tabroom client."""
+
+import asyncio
+import json
+from urllib.parse import parse_qs
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from tabroom import (
+    AsyncTabroomClient,
+    CachePolicy,
+    DebateEvent,
+    ParseMode,
+    Person,
+    ResponseCache,
+    use_parse_mode,
+)
+from tabroom.exceptions import TabroomNotFoundError, TabroomServerError
+from tabroom.resources.extra import FieldRecord
+
+
+def make_client(handler, **kwargs) -> AsyncTabroomClient:
+    """Build an async client whose transport is served by ``handler``."""
+    client = AsyncTabroomClient(**kwargs)
+    cookies = client._base_client._client.cookies
+    client._base_client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), cookies=cookies
+    )
+    return client
+
+
+def test_async_get_profile():
+    """Test that resources return awaitables parsed into models."""
+
+    def handler(request):
+        assert request.url.path == "/v1/user/profile"
+        return httpx.Response(200, json={"id": 7, "first": "Ada"})
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            return await client.user.get_profile()
+
+    profile = asyncio.run(run())
+    assert isinstance(profile, Person)
+    assert profile.first == "Ada"
+
+
+def test_async_error_mapping():
+    """Test that async errors map to the same exceptions as the sync client."""
+
+    def handler(request):
+        if "missing" in request.url.path:
+            return httpx.Response(404, json={"message": "nope"})
+        return httpx.Response(502, text="bad gateway")
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            with pytest.raises(TabroomNotFoundError, match="nope"):
+                await client.public.get_tournament_by_webname("missing")
+            with pytest.raises(TabroomServerError):
+                await client.system.get_status()
+
+    asyncio.run(run())
+
+
+def test_async_deferred_login():
+    """Test that auto-login runs once on first use and stores the cookie."""
+    logins = []
+
+    def handler(request):
+        if request.url.path.endswith("login_save.mhtml"):
+            logins.append(request)
+            return httpx.Response(
+                200, headers={"Set-Cookie": "TabroomToken=abc; Domain=.tabroom.com"}
+            )
+        return httpx.Response(200, json={"status": "ok"})
+
+    async def run():
+        client = make_client(handler, username="u", password="p")
+        assert not client.is_authenticated()
+        await asyncio.gather(*(client.system.get_status() for _ in range(5)))
+        assert client.token == "abc"
+        await client.close()
+
+    asyncio.run(run())
+    assert len(logins) == 1
+
+
+def test_async_revoke():
+    """Test that access revokes return awaitables that send the DELETE."""
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.url.path))
+        return httpx.Response(204)
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            access = client.access.tournament(3)
+            await access.revoke(7)
+            await access.event(4).revoke(7)
+            await access.category(5).revoke(7)
+
+    asyncio.run(run())
+    assert requests == [
+        ("DELETE", "/v1/tab/3/access/7"),
+        ("DELETE", "/v1/tab/3/event/4/access/7"),
+        ("DELETE", "/v1/tab/3/category/5/access/7"),
+    ]
+
+
+@pytest.mark.filterwarnings("error::DeprecationWarning")
+def test_async_json_body():
+    """Test that JSON bodies are sent as raw content, as httpx expects."""
+    bodies = []
+
+    def handler(request):
+        bodies.append((request.headers.get("Content-Type"), request.content))
+        return httpx.Response(200, json={"ok": True})
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            await client.access.tournament(3).grant(7, {"tag": "owner"})
+
+    asyncio.run(run())
+    content_type, body = bodies[0]
+    assert content_type == "application/json"
+    assert json.loads(body) == {"tag": "owner"}
+
+
+def test_async_close_releases_refresh_claims():
+    """Test that closing mid-refresh leaves a shared cache refreshable."""
+    cache = ResponseCache({"/user/profile/*": CachePolicy(ttl=0.01, stale_ttl=60)})
+    started = []
+
+    async def handler(request):
+        started.append(request)
+        if len(started) > 1:
+            await asyncio.sleep(60)
+        return httpx.Response(200, json={"id": 1})
+
+    async def run():
+        client = make_client(handler, token="tok", cache=cache)
+        await client.user.get_profile_by_id(5)
+        await asyncio.sleep(0.02)
+        await client.user.get_profile_by_id(5)
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        await client.close()
+
+    asyncio.run(run())
+    key = cache.key("GET", "/user/profile/5", None, "tok", ParseMode.VALIDATE.value)
+    assert cache.begin_refresh(key)
+
+
+def test_async_streaming():
+    """Test that the async client streams list elements."""
+
+    def handler(request):
+        return httpx.Response(200, json=[{"name": "A"}, {"name": "B"}])
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            return [
+                invite.name
+                async for invite in client.public.iter_upcoming_tournaments()
+            ]
+
+    assert asyncio.run(run()) == ["A", "B"]
+
+
+def test_async_scraping(bids_page):
+    """Test that async scrapers decode pages with the response charset."""
+    page = bids_page(103, [("B\xe9ta HS", "TX", "B\xe9ta AB", "1")])
+
+    def handler(request):
+        assert request.url.path == "/index/results/toc_bids.mhtml"
+        return httpx.Response(
+            200,
+            content=page.encode("latin-1"),
+            headers={"Content-Type": "text/html; charset=latin-1"},
+        )
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            return await client.extra.get_bids(DebateEvent.POLICY)
+
+    assert asyncio.run(run())[0]["school"] == "B\xe9ta HS"
+
+
+def test_async_streamed_scraping(fields_page):
+    """Test that async scrapers can stream rows as the page arrives."""
+    page = fields_page([("Alpha", "TX", "Alpha AB", "AA"), ("Beta", "CA", "B", "BB")])
+
+    def handler(request):
+        return httpx.Response(200, content=page.encode())
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            return [
+                entry["code"]
+                async for entry in client.extra.iter_teams_attending("1", "2")
+            ]
+
+    assert asyncio.run(run()) == ["AA", "BB"]
+
+
+def test_async_iter_resolves_parse_mode_at_call(fields_page):
+    """Test that async streams keep the parse mode active when they were made."""
+    page = fields_page([("Alpha", "TX", "Alpha AB", "AA")])
+
+    def handler(request):
+        return httpx.Response(200, content=page.encode())
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            with use_parse_mode("records"):
+                entries = client.extra.iter_teams_attending("1", "2")
+            return [entry async for entry in entries]
+
+    assert [type(entry) for entry in asyncio.run(run())] == [FieldRecord]
+
+
+def test_async_get_bids_many(bids_page):
+    """Test that the async client gathers every page."""
+    def handler(request):
+        form = parse_qs(request.content.decode())
+        code, year = form["code"][0], form["year"][0]
+        page = bids_page(code, [(code, "TX", "AB", year[-1])])
+        return httpx.Response(200, content=page.encode())
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            return await client.extra.get_bids_many(
+                [DebateEvent.POLICY, DebateEvent.EXTEMP], ["2025"]
+            )
+
+    bids = asyncio.run(run())
+    assert [(bid["event"], bid["bids"]) for bid in bids] == [
+        (DebateEvent.POLICY, 5),
+        (DebateEvent.EXTEMP, 5),
+    ]
+
+
+def test_async_get_tournament_fields(fields_page):
+    """Test that the async client scrapes every event of a tournament."""
+
+    def handler(request):
+        if request.url.path == "/v1/public/invite/tourn/9":
+            return httpx.Response(200, json={"events": [{"id": 1, "name": "LD"}]})
+        assert request.url.params["event_id"] == "1"
+        page = fields_page([("Alpha", "TX", "Alpha AB", "AA")])
+        return httpx.Response(200, content=page.encode())
+
+    async def run():
+        async with make_client(handler, token="tok") as client:
+            return await client.extra.get_tournament_fields("9")
+
+    assert [(e["event"], e["code"]) for e in asyncio.run(run())] == [("LD", "AA")]
@@ -0,0 +1,66 @@
+"""Tests for batch fan-out."""
+
+import asyncio
+import threading
+import time
+
+from tabroom import BatchResult, Person
+from tabroom.batch import run_batch_async
+from tabroom.exceptions import TabroomNotFoundError
+
+
+def test_map_many_keeps_order_and_collects_errors(stub_client):
+    """Test that results come back in input order with per-item failures."""
+
+    def handler(request):
+        person_id = int(request.url.rsplit("/", 1)[1])
+        if person_id == 3:
+            return 404, {"message": "no such person"}
+        time.sleep(0.01 * (5 - person_id))
+        return 200, {"id": person_id}
+
+    client = stub_client(handler)
+    results = client.map_many(client.user.get_profile_by_id, [1, 2, 3, 4])
+
+    assert [r.ok for r in results] == [True, True, False, True]
+    assert [r.value.id for r in results if r.ok] == [1, 2, 4]
+    assert isinstance(results[0].value, Person)
+    assert isinstance(results[2].error, TabroomNotFoundError)
+
+
+def test_batch_bounds_concurrency(stub_client):
+    """Test that no more than max_workers calls run at once."""
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def handler(request):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.pop()
+        return 200, {"ok": True}
+
+    client = stub_client(handler)
+    client.batch([client.system.get_status for _ in range(12)], max_workers=3)
+
+    assert max(peak) == 3
+
+
+def test_async_batch():
+    """Test the asyncio batch runner."""
+
+    async def call(n):
+        await asyncio.sleep(0.001 * (5 - n))
+        if n == 2:
+            raise ValueError("bad")
+        return n
+
+    results = asyncio.run(
+        run_batch_async([lambda n=n: call(n) for n in range(5)], max_concurrency=2)
+    )
+    assert [r.value for r in results] == [0, 1, None, 3, 4]
+    assert isinstance(results[2].error, ValueError)
+    assert results[0] == BatchResult(value=0)
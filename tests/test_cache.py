@@ -0,0 +1,119 @@
+"""Tests for the TTL response cache."""
+
+import threading
+import time
+
+from tabroom import CachePolicy, ParseMode, Person, ResponseCache
+from tabroom.cache import CacheState
+
+
+def counting_handler(counter, body=None):
+    def handler(request):
+        counter.append(request.url)
+        return 200, body if body is not None else {"id": len(counter)}
+
+    return handler
+
+
+def test_fresh_hits_skip_the_server(stub_client):
+    """Test that a cached GET is served without a round trip."""
+    calls = []
+    cache = ResponseCache({"/user/profile/*": CachePolicy(ttl=60)})
+    client = stub_client(counting_handler(calls), cache=cache)
+
+    first = client.user.get_profile_by_id(5)
+    second = client.user.get_profile_by_id(5)
+
+    assert isinstance(first, Person)
+    assert second is first
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_uncached_paths_always_fetch(stub_client):
+    """Test that paths without a policy are never cached."""
+    calls = []
+    cache = ResponseCache({"/user/profile/*": CachePolicy(ttl=60)})
+    client = stub_client(counting_handler(calls), cache=cache)
+
+    client.tab.tournament(1).get_attendance()
+    client.tab.tournament(1).get_attendance()
+    assert len(calls) == 2
+
+
+def test_writes_invalidate_the_same_path(stub_client):
+    """Test that marking attendance drops the cached attendance."""
+    calls = []
+    cache = ResponseCache({"/tab/*/attendance": CachePolicy(ttl=60)})
+    client = stub_client(counting_handler(calls), cache=cache)
+    tourn = client.tab.tournament(1)
+
+    tourn.get_attendance()
+    tourn.mark_attendance({"present": True})
+    tourn.get_attendance()
+    assert len(calls) == 3
+
+
+def test_stale_while_revalidate(stub_client):
+    """Test that a stale value is served while a refresh runs in background."""
+    calls = []
+    refreshed = threading.Event()
+
+    def handler(request):
+        calls.append(request.url)
+        if len(calls) > 1:
+            refreshed.set()
+        return 200, {"id": len(calls)}
+
+    cache = ResponseCache({"/user/profile/*": CachePolicy(ttl=0.01, stale_ttl=60)})
+    client = stub_client(handler, cache=cache)
+
+    assert client.user.get_profile_by_id(5).id == 1
+    time.sleep(0.02)
+    assert client.user.get_profile_by_id(5).id == 1
+    assert refreshed.wait(2)
+
+    key = cache.key("GET", "/user/profile/5", None, "tok", ParseMode.VALIDATE.value)
+    for _ in range(100):
+        if cache.lookup(key)[0] is CacheState.FRESH:
+            break
+        time.sleep(0.01)
+    assert cache.lookup(key)[0] is CacheState.FRESH
+    assert client.user.get_profile_by_id(5).id == 2
+
+
+def test_refresh_pool_only_with_a_cache(stub_client):
+    """Test that refresh threads exist only for cached clients and are cancelled."""
+    assert stub_client(counting_handler([]))._base_client._refresh_pool is None
+
+    client = stub_client(counting_handler([]), cache=ResponseCache({}))
+    pool = client._base_client._refresh_pool
+    started, release = threading.Barrier(3), threading.Event()
+
+    def block():
+        started.wait(2)
+        release.wait(2)
+
+    # Occupy both workers so the next refresh stays queued
+    pool.submit(block)
+    pool.submit(block)
+    started.wait(2)
+    queued = pool.submit(lambda: None)
+    client.close()
+    release.set()
+    assert queued.cancelled()
+
+
+def test_size_accounting_evicts_lru():
+    """Test that entries beyond the byte budget evict the oldest first."""
+    policy = CachePolicy(ttl=60)
+    cache = ResponseCache({"*": policy}, max_bytes=100)
+
+    cache.put("a", "/a", "A", 60, policy)
+    cache.put("b", "/b", "B", 30, policy)
+    cache.lookup("a")
+    cache.put("c", "/c", "C", 30, policy)
+
+    assert cache.lookup("b")[0] is CacheState.MISS
+    assert cache.lookup("a")[0] is CacheState.FRESH
+    assert cache.size == 90
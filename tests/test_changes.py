@@ -0,0 +1,97 @@
+"""Tests for change tracking of scraped tables."""
+
+from collections import namedtuple
+
+from tabroom import ChangeKind, ChangeTracker, DebateEvent, use_parse_mode
+from tabroom.resources.extra import BidRecord
+
+Row = namedtuple("Row", ["school", "entry", "bids"])
+
+
+def test_diff_reports_inserts_updates_and_deletes():
+    """Test that rows are matched by key between extractions."""
+    tracker = ChangeTracker()
+    first = [Row("A", "A1", 1), Row("B", "B1", 2)]
+    changes = tracker.diff("s", first, ("school", "entry"))
+    assert [(c.kind, c.key) for c in changes] == [
+        (ChangeKind.INSERT, ("A", "A1")),
+        (ChangeKind.INSERT, ("B", "B1")),
+    ]
+
+    second = [Row("A", "A1", 3), Row("C", "C1", 1)]
+    changes = tracker.diff("s", second, ("school", "entry"))
+    assert [(c.kind, c.key) for c in changes] == [
+        (ChangeKind.UPDATE, ("A", "A1")),
+        (ChangeKind.INSERT, ("C", "C1")),
+        (ChangeKind.DELETE, ("B", "B1")),
+    ]
+    assert (changes[0].previous.bids, changes[0].row.bids) == (1, 3)
+    assert changes[2].row is None
+
+    assert tracker.diff("s", tracker.rows("s"), ("school", "entry")) == []
+    # Scopes are independent
+    assert len(tracker.diff("other", first, ("school", "entry"))) == 2
+
+
+def test_diff_keys_duplicates():
+    """Test that identical rows collapse and shared keys use the row content."""
+    tracker = ChangeTracker()
+    rows = [Row("A", "A1", 1), Row("A", "A1", 1), Row("A", "A1", 2)]
+    changes = tracker.diff("s", rows, ("school", "entry"))
+    assert [c.key for c in changes] == [("A", "A1", 1), ("A", "A1", 2)]
+
+    tracker.forget("s")
+    assert tracker.rows("s") == []
+
+
+def test_insert_above_duplicates_keeps_their_keys():
+    """Test that a new row sharing a key does not shift the other rows."""
+    tracker = ChangeTracker()
+    key = ("school", "entry")
+    tracker.diff("s", [Row("A", "A1", 1), Row("A", "A1", 2)], key)
+
+    changes = tracker.diff(
+        "s", [Row("A", "A1", 0), Row("A", "A1", 1), Row("A", "A1", 2)], key
+    )
+    assert [(c.kind, c.row) for c in changes] == [
+        (ChangeKind.INSERT, Row("A", "A1", 0))
+    ]
+
+    # A key that becomes shared, and one changed row of a shared key
+    tracker.diff("t", [Row("B", "B1", 1)], key)
+    changes = tracker.diff("t", [Row("B", "B1", 0), Row("B", "B1", 1)], key)
+    assert [c.kind for c in changes] == [ChangeKind.INSERT]
+    changes = tracker.diff("t", [Row("B", "B1", 0), Row("B", "B1", 5)], key)
+    assert [(c.kind, c.previous, c.row) for c in changes] == [
+        (ChangeKind.UPDATE, Row("B", "B1", 1), Row("B", "B1", 5))
+    ]
+
+
+def test_get_bid_changes(stub_client, bids_page):
+    """Test that the extra resource reports changed bids between polls."""
+    pages = [
+        bids_page(103, [("Alpha", "TX", "Alpha AB", "1"), ("Beta", "CA", "Beta", "2")]),
+        bids_page(103, [("Alpha", "TX", "Alpha AB", "2")]),
+    ]
+    client = stub_client(lambda request: (200, pages.pop(0)))
+    tracker = ChangeTracker()
+
+    assert len(client.extra.get_bid_changes(tracker, DebateEvent.POLICY)) == 2
+    with use_parse_mode("records"):
+        update, delete = client.extra.get_bid_changes(tracker, DebateEvent.POLICY)
+
+    assert update.kind is ChangeKind.UPDATE
+    assert update.scope == ("bids", 103, "2025")
+    assert update.row == BidRecord("Alpha", "TX", "Alpha AB", 2)
+    assert (delete.kind, delete.key) == (ChangeKind.DELETE, ("Beta", "Beta"))
+
+
+def test_get_field_changes(stub_client, fields_page):
+    """Test that entry changes are dicts in the default parse mode."""
+    client = stub_client(lambda request: (200, fields_page([("A", "TX", "A1", "AA")])))
+    tracker = ChangeTracker()
+
+    (insert,) = client.extra.get_field_changes(tracker, "9", "2")
+    assert insert.scope == ("fields", "9", "2")
+    assert insert.row == {"school": "A", "location": "TX", "entry": "A1", "code": "AA"}
+    assert client.extra.get_field_changes(tracker, "9", "2") == []
@@ -80,3 +80,32 @@ def test_all_resources_accessible():
     assert client.system is not None
 
     client.close()
+
+
+def test_pool_limits_mount_per_host_adapters():
+    """Test that pool limits size separate adapters for API and site hosts."""
+    from tabroom import PoolLimits
+
+    client = TabroomClient(
+        auto_login=False,
+        pool_limits=PoolLimits(api_max_connections=32, site_max_connections=4),
+    )
+    session = client._base_client._client
+
+    api_adapter = session.get_adapter("https://api.tabroom.com/v1/user/profile")
+    site_adapter = session.get_adapter("https://www.tabroom.com/index/index.mhtml")
+    assert api_adapter._pool_maxsize == 32
+    assert site_adapter._pool_maxsize == 4
+    client.close()
+
+
+def test_resource_creation_is_thread_safe():
+    """Test that concurrent first access creates a single resource instance."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = TabroomClient(auto_login=False)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        resources = list(pool.map(lambda _: client.tab, range(64)))
+
+    assert all(resource is resources[0] for resource in resources)
+    client.close()
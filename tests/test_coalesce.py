@@ -0,0 +1,79 @@
+"""Tests for single-flight request coalescing."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tabroom.coalesce import AsyncSingleFlight, SingleFlight
+from tabroom.exceptions import TabroomServerError
+
+
+def test_identical_concurrent_gets_share_one_request(stub_client):
+    """Test that a thundering herd of GETs sends a single request."""
+    release = threading.Event()
+
+    def handler(request):
+        release.wait(2)
+        return 200, {"events": []}
+
+    client = stub_client(handler, coalesce=True)
+    dashboard = client.tab.tournament(1).get_dashboard
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        futures = [pool.submit(dashboard) for _ in range(20)]
+        time.sleep(0.2)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(client.adapter.requests) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_different_gets_are_not_coalesced(stub_client):
+    """Test that distinct URLs and POSTs are sent separately."""
+    client = stub_client(lambda r: (200, {"ok": True}), coalesce=True)
+
+    client.tab.tournament(1).get_dashboard()
+    client.tab.tournament(2).get_dashboard()
+    client.tab.tournament(1).mark_attendance({})
+    assert len(client.adapter.requests) == 3
+
+
+def test_errors_are_shared_with_waiters():
+    """Test that followers receive the leader's exception."""
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise TabroomServerError("down", 502)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "k", fail)
+        started.wait()
+        follower = pool.submit(flight.do, "k", lambda: "unused")
+        with pytest.raises(TabroomServerError):
+            leader.result()
+        with pytest.raises(TabroomServerError):
+            follower.result()
+
+
+def test_async_single_flight():
+    """Test that concurrent coroutines share one call."""
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    async def run():
+        flight = AsyncSingleFlight()
+        return await asyncio.gather(*(flight.do("k", fetch) for _ in range(50)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
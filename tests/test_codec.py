@@ -0,0 +1,62 @@
+"""Tests for the pluggable JSON codecs."""
+
+import pytest
+
+from tabroom import MsgspecCodec, OrjsonCodec, StdlibCodec
+from tabroom.codec import default_codec
+
+
+def available_codecs():
+    codecs = [StdlibCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda c: c.name)
+def test_codec_round_trip(codec):
+    """Test that every codec encodes to bytes and decodes back."""
+    payload = {"present": True, "ids": [1, 2], "name": "Académie", "none": None}
+
+    encoded = codec.dumps(payload)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == payload
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda c: c.name)
+def test_codec_rejects_invalid_json(codec):
+    """Test that decode errors surface as ValueError for every codec."""
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_default_codec_prefers_fast_backends():
+    """Test that the default codec is the fastest installed one."""
+    names = [codec.name for codec in available_codecs()]
+    expected = next((n for n in ("orjson", "msgspec") if n in names), "json")
+
+    assert default_codec().name == expected
+
+
+def test_client_encodes_post_bodies_with_codec(stub_client):
+    """Test that POST bodies are encoded by the configured codec."""
+
+    class RecordingCodec(StdlibCodec):
+        encoded = []
+
+        def dumps(self, obj):
+            self.encoded.append(obj)
+            return super().dumps(obj)
+
+    codec = RecordingCodec()
+    client = stub_client(lambda r: (200, {"ok": True}), codec=codec)
+    result = client.tab.tournament(1).mark_attendance({"judge": 5, "present": True})
+
+    request = client.adapter.requests[0]
+    assert codec.encoded == [{"judge": 5, "present": True}]
+    assert request.body == b'{"judge":5,"present":true}'
+    assert request.headers["Content-Type"] == "application/json"
+    assert result == {"ok": True}
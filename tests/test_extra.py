@@ -0,0 +1,182 @@
+"""Tests for the multi-page scrapers of the extra resource."""
+
+import threading
+from urllib.parse import parse_qs
+
+import pytest
+
+from tabroom import Bs4Backend, DebateEvent, SnapshotStore, use_parse_mode
+from tabroom.exceptions import TabroomServerError
+from tabroom.resources.extra import SeasonBidRecord, TournamentFieldRecord
+
+
+def bids_handler(bids_page):
+    """Answer toc_bids posts with one entry naming the event and year."""
+
+    def handler(request):
+        form = parse_qs(request.body if isinstance(request.body, str) else "")
+        code, year = form["code"][0], form["year"][0]
+        return 200, bids_page(code, [(f"{code}-{year}", "TX", "AB", year[-1])])
+
+    return handler
+
+
+def test_get_bids_many_merges_events_and_years(stub_client, bids_page):
+    """Test that every (event, year) page is fetched and tagged."""
+    client = stub_client(bids_handler(bids_page))
+    events = [DebateEvent.POLICY, DebateEvent.PUBLIC_FORUM]
+
+    bids = client.extra.get_bids_many(events, ["2024", "2025"])
+
+    assert [(bid["event"], bid["year"], bid["school"]) for bid in bids] == [
+        (DebateEvent.POLICY, "2024", "103-2024"),
+        (DebateEvent.POLICY, "2025", "103-2025"),
+        (DebateEvent.PUBLIC_FORUM, "2024", "104-2024"),
+        (DebateEvent.PUBLIC_FORUM, "2025", "104-2025"),
+    ]
+    assert [bid["bids"] for bid in bids] == [4, 5, 4, 5]
+
+
+def test_get_bids_many_runs_concurrently(stub_client, bids_page):
+    """Test that pages are fetched in parallel, bounded by max_workers."""
+    answer = bids_handler(bids_page)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def handler(request):
+        barrier.wait()
+        return answer(request)
+
+    client = stub_client(handler)
+    bids = client.extra.get_bids_many(list(DebateEvent)[:3], ["2025"], max_workers=3)
+    assert len(bids) == 3
+
+
+def test_get_bids_many_columns(stub_client, bids_page):
+    """Test that compact parse modes return typed season records."""
+    client = stub_client(bids_handler(bids_page))
+
+    with use_parse_mode("columns"):
+        bids = client.extra.get_bids_many([DebateEvent.POLICY], ["2024", "2025"])
+
+    assert bids.record is SeasonBidRecord
+    assert bids["year"] == ["2024", "2025"]
+    assert bids["bids"] == [4, 5]
+
+
+def test_get_bids_many_raises_page_errors(stub_client, bids_page):
+    """Test that a failed page fails the whole call."""
+    answer = bids_handler(bids_page)
+
+    def handler(request):
+        if "year=2024" in request.body:
+            return 503, ""
+        return answer(request)
+
+    client = stub_client(handler, retry=None)
+    with pytest.raises(TabroomServerError):
+        client.extra.get_bids_many([DebateEvent.POLICY], ["2024", "2025"])
+
+
+
+def fields_handler(fields_page, events):
+    """Answer the invite of tournament 9 and one fields page per event."""
+
+    def handler(request):
+        if request.url.endswith("/public/invite/tourn/9"):
+            return 200, {"tourn": {"id": 9}, "events": events}
+        event_id = parse_qs(request.url.split("?", 1)[1])["event_id"][0]
+        rows = [("Alpha", "TX", f"Alpha {event_id}", "AA")]
+        # Entries listed twice on a page are kept once
+        return 200, fields_page(rows + rows + [("Beta", "CA", "Beta", "BB")])
+
+    return handler
+
+
+def test_get_tournament_fields(stub_client, fields_page):
+    """Test that every event of the invite is scraped and deduplicated."""
+    events = [
+        {"id": 1, "name": "Policy"},
+        {"id": 2, "name": "LD"},
+        {"id": 1, "name": "Policy"},
+    ]
+    client = stub_client(fields_handler(fields_page, events))
+
+    entries = client.extra.get_tournament_fields("9")
+
+    keys = [(entry["event_id"], entry["event"], entry["entry"]) for entry in entries]
+    assert keys == [
+        (1, "Policy", "Alpha 1"),
+        (1, "Policy", "Beta"),
+        (2, "LD", "Alpha 2"),
+        (2, "LD", "Beta"),
+    ]
+    fetched = [r.url for r in client.adapter.requests if "fields.mhtml" in r.url]
+    assert len(fetched) == 2
+
+
+def test_get_tournament_fields_records(stub_client, fields_page):
+    """Test the compact result and a tournament without events."""
+    client = stub_client(fields_handler(fields_page, [{"id": 5, "name": "PF"}]))
+    with use_parse_mode("records"):
+        entries = client.extra.get_tournament_fields("9")
+    assert type(entries[0]) is TournamentFieldRecord
+    assert entries[0] == (5, "PF", "Alpha", "TX", "Alpha 5", "AA")
+
+    client = stub_client(fields_handler(fields_page, []))
+    assert client.extra.get_tournament_fields("9") == []
+
+
+class CountingBackend(Bs4Backend):
+    """Backend that counts the pages it parses."""
+
+    def __init__(self):
+        self.parsed = 0
+
+    def table_rows(self, markup, table_id):
+        self.parsed += 1
+        return super().table_rows(markup, table_id)
+
+
+def test_snapshots_skip_unchanged_pages(stub_client, bids_page):
+    """Test that an unchanged body reuses its rows and a changed one is parsed."""
+    pages = {"body": bids_page(103, [("Alpha", "TX", "AB", "2")])}
+    backend = CountingBackend()
+    store = SnapshotStore()
+    client = stub_client(
+        lambda request: (200, pages["body"]), html_backend=backend, snapshots=store
+    )
+
+    first = client.extra.get_bids(DebateEvent.POLICY)
+    assert client.extra.get_bids(DebateEvent.POLICY) == first
+    assert (backend.parsed, store.hits, store.misses) == (1, 1, 1)
+
+    # Other form data is another page
+    client.extra.get_bids(DebateEvent.POLICY, year="2024")
+    assert (backend.parsed, store.misses) == (2, 2)
+
+    pages["body"] = bids_page(103, [("Alpha", "TX", "AB", "3")])
+    assert client.extra.get_bids(DebateEvent.POLICY)[0]["bids"] == 3
+    assert (backend.parsed, store.hits, store.misses) == (3, 1, 3)
+
+
+def test_snapshots_persist_to_disk(stub_client, fields_page, tmp_path):
+    """Test that snapshots on disk are reused by a new store."""
+    page = fields_page([("Alpha", "TX", "Alpha AB", "AA")])
+    backend = CountingBackend()
+
+    def fetch(store):
+        client = stub_client(
+            lambda request: (200, page), html_backend=backend, snapshots=store
+        )
+        with use_parse_mode("records"):
+            return client.extra.get_teams_attending("1", "2")
+
+    first = fetch(SnapshotStore(str(tmp_path)))
+    store = SnapshotStore(str(tmp_path))
+    assert fetch(store) == first
+    assert type(first[0]) is type(fetch(store)[0])
+    assert (backend.parsed, store.hits) == (1, 2)
+
+    store.clear()
+    assert list(tmp_path.iterdir()) == []
+    assert (store.hits, store.misses) == (0, 0)
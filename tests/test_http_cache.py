@@ -0,0 +1,86 @@
+"""Tests for the conditional-request HTTP cache."""
+
+from tabroom import FileCacheStorage, HTTPCache, Invite
+from tabroom.http_cache import CacheEntry
+
+INVITES = [{"id": 1, "name": "TOC"}, {"id": 2, "name": "Glenbrooks"}]
+
+
+def etag_handler(seen_headers):
+    def handler(request):
+        seen_headers.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, b""
+        return 200, INVITES, {"ETag": '"v1"'}
+
+    return handler
+
+
+def test_not_modified_returns_parsed_models(stub_client):
+    """Test that a 304 returns the identical parsed result."""
+    seen = []
+    client = stub_client(etag_handler(seen), http_cache=HTTPCache())
+
+    first = client.public.get_upcoming_tournaments()
+    second = client.public.get_upcoming_tournaments()
+
+    assert "If-None-Match" not in seen[0]
+    assert seen[1]["If-None-Match"] == '"v1"'
+    assert second is first
+    assert isinstance(second[0], Invite)
+
+
+def test_cache_keys_include_params_and_identity(stub_client):
+    """Test that different params and tokens do not share entries."""
+    seen = []
+    cache = HTTPCache()
+    client = stub_client(etag_handler(seen), http_cache=cache)
+
+    client.caselist.get_students(1)
+    client.caselist.get_students(2)
+    other = stub_client(etag_handler(seen), token="other", http_cache=cache)
+    other.caselist.get_students(1)
+
+    assert all("If-None-Match" not in headers for headers in seen)
+
+
+def test_file_storage_survives_new_cache(stub_client, tmp_path):
+    """Test that validators and bodies persist on disk."""
+    seen = []
+    client = stub_client(
+        etag_handler(seen), http_cache=HTTPCache(FileCacheStorage(str(tmp_path)))
+    )
+    client.public.get_upcoming_tournaments()
+
+    fresh = stub_client(
+        etag_handler(seen), http_cache=HTTPCache(FileCacheStorage(str(tmp_path)))
+    )
+    invites = fresh.public.get_upcoming_tournaments()
+
+    assert seen[1]["If-None-Match"] == '"v1"'
+    assert [invite.name for invite in invites] == ["TOC", "Glenbrooks"]
+
+
+def test_file_storage_keeps_binary_bodies(tmp_path):
+    """Test that bodies which are not UTF-8 round-trip through disk."""
+    body = "Café".encode("latin-1") + b"\x00\xff"
+    FileCacheStorage(str(tmp_path)).set("k", CacheEntry(body=body, etag='"v1"'))
+
+    entry = FileCacheStorage(str(tmp_path)).get("k")
+    assert entry == CacheEntry(body=body, etag='"v1"')
+
+
+def test_responses_without_validators_are_not_cached(stub_client):
+    """Test that only responses with ETag/Last-Modified are stored."""
+    seen = []
+
+    def handler(request):
+        seen.append(dict(request.headers))
+        return 200, INVITES
+
+    client = stub_client(handler, http_cache=HTTPCache())
+    client.public.get_upcoming_tournaments()
+    client.public.get_upcoming_tournaments()
+
+    assert "If-None-Match" not in seen[1]
+    assert "If-Modified-Since" not in seen[1]
@@ -0,0 +1,61 @@
+"""Import-time regression tests: heavy dependencies load only when used."""
+
+import subprocess
+import sys
+
+import pytest
+
+import tabroom
+import tabroom.models
+import tabroom.resources
+
+PARSERS = ("bs4", "lxml", "selectolax")
+
+
+def loaded_after(code: str, modules: tuple[str, ...]) -> list[str]:
+    """Run ``code`` in a fresh interpreter and list which ``modules`` it loaded."""
+    script = f"{code}\nimport sys\nprint(*[m for m in {modules!r} if m in sys.modules])"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+def test_import_tabroom_is_cheap():
+    """Test that importing the package loads no dependencies or submodules."""
+    modules = (*PARSERS, "httpx", "pydantic", "requests", "tabroom.client")
+    assert loaded_after("import tabroom", modules) == []
+
+
+def test_api_client_skips_scraping_and_unused_models():
+    """Test that API calls do not load the HTML parsers or unrelated models."""
+    code = "from tabroom import TabroomClient\nTabroomClient(token='t').user"
+    modules = (
+        *PARSERS,
+        "httpx",
+        "tabroom.scraping",
+        "tabroom.resources.extra",
+        "tabroom.models.tournament",
+        "tabroom.models.user",
+    )
+    assert loaded_after(code, modules) == ["tabroom.models.user"]
+
+
+def test_scraping_loads_only_the_chosen_parser():
+    """Test that BeautifulSoup is not imported when another backend is used."""
+    pytest.importorskip("lxml")
+    code = (
+        "from tabroom import LxmlBackend\n"
+        "LxmlBackend().table_rows('<table id=t><tr><td>a</td></tr></table>', 't')"
+    )
+    assert loaded_after(code, ("bs4",)) == []
+
+
+@pytest.mark.parametrize("package", [tabroom, tabroom.models, tabroom.resources])
+def test_lazy_exports_resolve(package):
+    """Test that every exported name resolves and unknown names still fail."""
+    for name in package.__all__:
+        assert getattr(package, name) is not None
+    assert set(package.__all__) <= set(dir(package))
+    with pytest.raises(AttributeError):
+        package.DoesNotExist
@@ -1,7 +1,11 @@
 """Tests for Pydantic models."""
 
 from datetime import datetime
-from tabroom.models import Person, Session, Invite, Search, Err
+
+from pydantic import BaseModel
+
+from tabroom.models import Person, Session, Invite, Search, Err, TabroomTimestamp
+from tabroom.models.common import TabroomDateTime
 
 
 def test_session_model():
@@ -68,3 +72,25 @@ def test_person_datetime_parsing():
     assert person.last_access.year == 2024
     assert person.last_access.month == 1
     assert person.last_access.day == 15
+
+
+def test_tabroom_datetime_layouts():
+    """Test the fast path, the strptime fallback and invalid values."""
+    parse = TabroomDateTime.parse_tabroom_datetime
+    assert parse("2024-01-15 10:30:00") == datetime(2024, 1, 15, 10, 30)
+    assert parse("2024-01-15") == datetime(2024, 1, 15)
+    assert parse("2024-1-5 9:03:00") == datetime(2024, 1, 5, 9, 3)
+    assert parse("2024-01-15T10:30:00") is None
+    assert parse("2024-02-30 00:00:00") is None
+    assert parse("") is None
+    assert parse(datetime(2024, 1, 15)) == datetime(2024, 1, 15)
+
+
+def test_tabroom_timestamp_field_type():
+    """Test the reusable timestamp annotation on another model."""
+
+    class Round(BaseModel):
+        start: TabroomTimestamp = None
+
+    assert Round(start="2024-01-15 10:30:00").start == datetime(2024, 1, 15, 10, 30)
+    assert Round(start="not a date").start is None
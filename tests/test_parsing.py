@@ -0,0 +1,131 @@
+"""Tests for bulk validation and parse modes."""
+
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel, Field
+
+from tabroom import CachePolicy, Invite, ModelView, ParseMode, Person, ResponseCache
+from tabroom import use_parse_mode
+from tabroom.exceptions import TabroomValidationError
+from tabroom.parsing import Parser, list_adapter
+
+
+class Tagged(BaseModel):
+    name: str
+    tags: list[str] = []
+    labels: dict[str, str] = Field(default_factory=dict)
+
+
+PEOPLE = [
+    {"id": i, "first": f"P{i}", "last_access": "2024-01-02 03:04:05"} for i in range(3)
+]
+
+
+def test_list_validated_in_one_pass():
+    """Test that lists go through a cached list TypeAdapter."""
+    people = Parser(Person).parse(PEOPLE)
+    assert [p.id for p in people] == [0, 1, 2]
+    assert isinstance(people[0].last_access, datetime)
+    assert list_adapter(Person) is list_adapter(Person)
+
+
+def test_list_validation_errors_are_mapped():
+    """Test that a bad element raises TabroomValidationError."""
+    with pytest.raises(TabroomValidationError):
+        Parser(Person).parse([{"id": 1}, {"first": "no id"}])
+
+
+def test_trusted_mode_skips_validation():
+    """Test that trusted parsing constructs models without conversion."""
+    people = Parser(Person, ParseMode.TRUSTED).parse(PEOPLE)
+    assert isinstance(people[0], Person)
+    assert people[0].last_access == "2024-01-02 03:04:05"
+
+
+@pytest.mark.parametrize(
+    "model, item",
+    [
+        (Person, {"id": 1, "pass_timstamp": "2023-06-07 08:09:10", "bogus": 1}),
+        (Person, {"first": "no id"}),
+        (Invite, {"name": "A", "circuit": 6}),
+        (Tagged, {"name": "A"}),
+    ],
+)
+def test_trusted_mode_matches_model_construct(model, item):
+    """Test that trusted models equal model_construct: aliases, extras, defaults."""
+    built = Parser(model, ParseMode.TRUSTED).parse([item])[0]
+    if model is Tagged:
+        # Mutable defaults are not shared between instances
+        assert built.tags is not Parser(model, ParseMode.TRUSTED).parse([item])[0].tags
+    expected = model.model_construct(**item)
+
+    assert list(built.__dict__.items()) == list(expected.__dict__.items())
+    assert built.model_fields_set == expected.model_fields_set
+    assert built.__pydantic_extra__ == expected.__pydantic_extra__
+    assert Parser(model, ParseMode.TRUSTED).parse_item(item) == built
+
+
+def test_parse_mode_per_client_and_per_call(stub_client):
+    """Test the client default, per-call and scoped parse mode overrides."""
+    body = {"id": 1, "last_access": "2024-01-02 03:04:05"}
+    client = stub_client(lambda request: (200, body), parse_mode="trusted")
+    assert client.user.get_profile().last_access == "2024-01-02 03:04:05"
+
+    validated = client._base_client.get(
+        "/user/profile", response_model=Person, parse_mode="validate"
+    )
+    assert isinstance(validated.last_access, datetime)
+
+    client = stub_client(lambda request: (200, [{"name": "A"}]))
+    with use_parse_mode(ParseMode.TRUSTED):
+        invites = client.public.get_upcoming_tournaments()
+    assert isinstance(invites[0], Invite)
+    assert invites[0].name == "A"
+
+
+def test_cache_keys_differ_by_parse_mode(stub_client):
+    """Test that validated and trusted results are cached separately."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return 200, {"id": 1, "last_access": "2024-01-02 03:04:05"}
+
+    cache = ResponseCache({"/user/profile": CachePolicy(ttl=60)})
+    client = stub_client(handler, cache=cache)
+
+    validated = client.user.get_profile()
+    with use_parse_mode("trusted"):
+        trusted = client.user.get_profile()
+        assert client.user.get_profile() is trusted
+    assert isinstance(validated.last_access, datetime)
+    assert trusted.last_access == "2024-01-02 03:04:05"
+    assert len(calls) == 2
+
+
+def test_lazy_view_validates_fields_on_access():
+    """Test that lazy views convert only the fields that are read."""
+    data = {"id": "7", "pass_timstamp": "2023-06-07 08:09:10", "last_access": "bad"}
+    view = Parser(Person, ParseMode.LAZY).parse(data)
+
+    assert isinstance(view, ModelView)
+    assert view.id == 7
+    assert view.pass_timestamp == datetime(2023, 6, 7, 8, 9, 10)
+    assert view.email is None
+    assert view.raw is data
+    with pytest.raises(AttributeError):
+        view.not_a_field
+
+
+def test_lazy_view_extras_and_materialize():
+    """Test extra keys of open models and full materialization."""
+    views = Parser(Invite, ParseMode.LAZY).parse([{"name": "A", "circuit": 6}])
+    assert views[0].circuit == 6
+
+    invite = views[0].materialize()
+    assert isinstance(invite, Invite)
+    assert invite.name == "A"
+
+    with pytest.raises(TabroomValidationError):
+        Parser(Person, ParseMode.LAZY).parse({"first": "no id"}).id
@@ -0,0 +1,57 @@
+"""Tests for client-side rate limiting."""
+
+import pytest
+
+from tabroom import RateLimit, RateLimiter, SQLiteBucketBackend
+
+API = "https://api.tabroom.com/v1"
+
+
+def test_requests_are_spaced_after_burst():
+    """Test that reservations beyond the burst are paced at 1/rate."""
+    limiter = RateLimiter([RateLimit(rate=10, burst=2)])
+
+    delays = [limiter.reserve(f"{API}/status") for _ in range(4)]
+    assert delays[:2] == [0, 0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_endpoint_family_limits_apply_separately():
+    """Test that a family limit does not throttle other endpoints."""
+    limiter = RateLimiter(
+        [
+            RateLimit(rate=1, host="api.tabroom.com", path="/v1/tab/*"),
+            RateLimit(rate=1, host="www.tabroom.com", path="*.mhtml"),
+        ]
+    )
+
+    assert limiter.reserve(f"{API}/tab/1/all/dashboard") == 0
+    assert limiter.reserve(f"{API}/tab/1/all/dashboard") > 0.9
+    assert limiter.reserve(f"{API}/public/ads") == 0
+    assert limiter.reserve("https://www.tabroom.com/index/tourn/fields.mhtml") == 0
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    """Test that limiters on the same file draw from one bucket."""
+    path = str(tmp_path / "rate.db")
+    first = RateLimiter([RateLimit(rate=1)], backend=SQLiteBucketBackend(path))
+    second = RateLimiter([RateLimit(rate=1)], backend=SQLiteBucketBackend(path))
+
+    assert first.reserve(f"{API}/status") == 0
+    assert second.reserve(f"{API}/status") > 0.9
+
+
+def test_client_waits_for_limiter(stub_client, monkeypatch):
+    """Test that the client acquires from the limiter before each request."""
+    waits = []
+    monkeypatch.setattr("tabroom.ratelimit.time.sleep", waits.append)
+    client = stub_client(
+        lambda r: (200, {"ok": True}),
+        rate_limiter=RateLimiter([RateLimit(rate=5, host="api.tabroom.com")]),
+    )
+
+    client.system.get_status()
+    client.system.get_status()
+    assert len(waits) == 1
+    assert waits[0] == pytest.approx(0.2, abs=0.02)
@@ -0,0 +1,105 @@
+"""Tests for compact record and columnar results."""
+
+import pytest
+from pydantic import BaseModel, ValidationError, model_validator
+
+from tabroom import Columns, DebateEvent, Invite, Person, Student, record_type
+from tabroom import use_parse_mode
+from tabroom.records import record_validator, to_record, validate_records
+from tabroom.resources.extra import BidRecord
+
+STUDENTS = [{"id": 1, "name": "Ada"}, {"id": 2, "name": "Grace"}]
+
+
+def test_record_type_mirrors_model_fields():
+    """Test that records are cached namedtuples of the model's fields."""
+    StudentRecord = record_type(Student)
+    assert StudentRecord is record_type(Student)
+    assert StudentRecord._fields == ("id", "name")
+    assert not hasattr(StudentRecord(1, "Ada"), "__dict__")
+
+
+class Checked(BaseModel):
+    low: int
+    high: int
+
+    @model_validator(mode="after")
+    def ordered(self):
+        if self.low > self.high:
+            raise ValueError("low above high")
+        return self
+
+
+@pytest.mark.parametrize(
+    "model, data",
+    [
+        (Person, {"id": 1, "pass_timstamp": "2023-06-07 08:09:10", "bogus": 1}),
+        (Person, [{"id": 1, "last_access": "2024-01-02 03:04:05"}, {"id": 2}]),
+        (Invite, [{"name": "A", "circuit": 6}]),
+        (Checked, [{"low": 1, "high": "2"}]),
+    ],
+)
+def test_validate_records_matches_models(model, data):
+    """Test that validating into records equals validating models first."""
+    items = data if isinstance(data, list) else [data]
+    expected = [to_record(model.model_validate(item)) for item in items]
+
+    records = validate_records(model, data)
+    assert (records if isinstance(data, list) else [records]) == expected
+    assert type(expected[0]) is record_type(model)
+
+
+def test_validate_records_errors_and_fallback():
+    """Test that bad items raise and model validators are not skipped."""
+    assert record_validator(Person, True) is not None
+    with pytest.raises(ValidationError):
+        validate_records(Person, [{"id": 1}, {"first": "no id"}])
+
+    assert record_validator(Checked, True) is None
+    with pytest.raises(ValidationError):
+        validate_records(Checked, [{"low": 3, "high": 2}])
+
+
+def test_columns_access_by_name_and_row():
+    """Test column, row and iteration access of a Columns table."""
+    Row = record_type(Student)
+    table = Columns.from_records(Row, [Row(1, "Ada"), Row(2, "Grace")])
+
+    assert len(table) == 2
+    assert table["name"] == ["Ada", "Grace"]
+    assert table[1] == Row(2, "Grace")
+    assert list(table) == table.to_records()
+    assert len(Columns.from_records(Row, [])) == 0
+    with pytest.raises(ValueError):
+        Columns(Row, {"id": [1], "name": []})
+
+
+def test_caselist_records_and_columns(stub_client):
+    """Test list methods in the records and columns parse modes."""
+    client = stub_client(lambda request: (200, STUDENTS))
+
+    with use_parse_mode("records"):
+        students = client.caselist.get_students(5)
+    assert students == [(1, "Ada"), (2, "Grace")]
+    assert students[0].name == "Ada"
+
+    with use_parse_mode("columns"):
+        table = client.caselist.get_students(5)
+    assert table["id"] == [1, 2]
+
+
+def test_scraped_bids_as_records(stub_client, bids_page):
+    """Test that scraped bid rows follow the parse mode."""
+    page = bids_page(103, [("Alpha HS", "TX", "Alpha AB", "2")])
+    client = stub_client(lambda request: (200, page, {"Content-Type": "text/html"}))
+
+    rows = client.extra.get_bids(DebateEvent.POLICY)
+    assert rows == [
+        {"school": "Alpha HS", "state": "TX", "entry": "Alpha AB", "bids": 2}
+    ]
+    with use_parse_mode("records"):
+        assert client.extra.get_bids(DebateEvent.POLICY) == [
+            BidRecord("Alpha HS", "TX", "Alpha AB", 2)
+        ]
+    with use_parse_mode("columns"):
+        assert client.extra.get_bids(DebateEvent.POLICY)["school"] == ["Alpha HS"]
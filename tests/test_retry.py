@@ -0,0 +1,91 @@
+"""Tests for the retry policy."""
+
+import pytest
+import requests
+
+from tabroom import RetryBudget, RetryPolicy
+from tabroom.exceptions import TabroomAPIError, TabroomServerError
+from tabroom.retry import parse_retry_after
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(backoff_base=0, jitter=False, **kwargs)
+
+
+def test_retries_transient_5xx_until_success(stub_client):
+    """Test that a burst of 502s is retried and the final result returned."""
+    statuses = iter([502, 502, 200])
+
+    def handler(request):
+        status = next(statuses)
+        return status, {"status": "ok"} if status == 200 else "bad gateway"
+
+    client = stub_client(handler, retry=fast_policy())
+    assert client.system.get_status() == {"status": "ok"}
+    assert len(client.adapter.requests) == 3
+
+
+def test_gives_up_after_max_retries(stub_client):
+    """Test that the last error is raised once retries are exhausted."""
+    client = stub_client(lambda r: (503, "down"), retry=fast_policy(max_retries=2))
+
+    with pytest.raises(TabroomServerError):
+        client.system.get_status()
+    assert len(client.adapter.requests) == 3
+
+
+def test_post_is_not_retried(stub_client):
+    """Test that non-idempotent methods are sent once."""
+    client = stub_client(lambda r: (502, "bad gateway"), retry=fast_policy())
+
+    with pytest.raises(TabroomServerError):
+        client.system.post_status()
+    assert len(client.adapter.requests) == 1
+
+
+def test_connection_errors_are_retried(stub_client):
+    """Test that connection errors on GET are retried."""
+    outcomes = iter([requests.ConnectionError("reset"), (200, {"ok": True})])
+    client = stub_client(lambda r: next(outcomes), retry=fast_policy())
+
+    assert client.system.get_status() == {"ok": True}
+
+
+def test_connection_error_raised_without_policy(stub_client):
+    """Test that the default client still fails fast."""
+    client = stub_client(lambda r: requests.ConnectionError("reset"))
+
+    with pytest.raises(TabroomAPIError):
+        client.system.get_status()
+    assert len(client.adapter.requests) == 1
+
+
+def test_retry_after_sets_minimum_delay():
+    """Test that Retry-After is honoured on 429 and too-long waits give up."""
+    policy = fast_policy(max_retry_after=10)
+
+    assert policy.delay("GET", 0, 429, "3") == 3
+    assert policy.delay("GET", 0, 503, "60") is None
+    assert policy.delay("GET", 0, 502, "3") == 0
+
+
+def test_backoff_is_capped():
+    """Test that exponential backoff never exceeds the cap."""
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+
+    assert [policy.backoff(n) for n in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_budget_limits_retries():
+    """Test that the budget stops retries beyond its ratio."""
+    budget = RetryBudget(ratio=0.5, min_retries=0)
+    for _ in range(4):
+        budget.deposit()
+
+    assert [budget.withdraw() for _ in range(3)] == [True, True, False]
+
+
+def test_parse_retry_after_http_date():
+    """Test that HTTP-date Retry-After values in the past mean no wait."""
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("garbage") is None
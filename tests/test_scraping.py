@@ -0,0 +1,176 @@
+"""Tests for the HTML parser backends."""
+
+import pytest
+
+from tabroom import Bs4Backend, DebateEvent, LxmlBackend, SelectolaxBackend
+from tabroom import use_parse_mode
+from tabroom.resources.extra import BidRecord, FieldRecord
+from tabroom.scraping import HTMLPage, TableRowParser, find_table, sniff_encoding
+
+
+def available_backends():
+    backends = [Bs4Backend()]
+    for backend in (LxmlBackend, SelectolaxBackend):
+        try:
+            backends.append(backend())
+        except ImportError:
+            pass
+    return backends
+
+
+BACKENDS = pytest.mark.parametrize(
+    "backend", available_backends(), ids=lambda backend: backend.name
+)
+
+NESTED = (
+    '<table id="other"><tr><td>skip</td></tr></table>'
+    '<table class="x" id="t"><thead><tr><th>Head</th></tr></thead>'
+    "<tbody><tr><td> a <table><tr><td>b</td></tr></table></td><td>c</td></tr>"
+    "</tbody></table><p>after</p>"
+)
+
+
+def test_find_table_skips_nested_tables():
+    """Test that the cut-out spans exactly the target table."""
+    fragment = find_table(NESTED, "t")
+    assert fragment.startswith('<table class="x" id="t">')
+    assert fragment.endswith("</tbody></table>")
+    assert find_table(NESTED, "missing") is None
+    assert find_table('<table id="tt"></table>', "t") is None
+
+
+@BACKENDS
+def test_data_id_is_not_the_table_id(backend):
+    """Test that a decoy table with a matching data-id is skipped."""
+    markup = (
+        "<table data-id='103'><tr><td>wrong</td></tr></table>"
+        "<table id='103'><tr><td>right</td></tr></table>"
+    )
+    assert find_table(markup, "103").startswith("<table id='103'>")
+    assert find_table(markup.encode(), "103").startswith(b"<table id='103'>")
+    assert backend.table_rows(markup, "103") == [["right"]]
+
+
+@BACKENDS
+def test_backends_agree(backend):
+    """Test that every backend extracts the same body rows."""
+    assert backend.table_rows(NESTED, "t") == [["a b", "c"]]
+    assert backend.table_rows(NESTED, "missing") == []
+
+
+@BACKENDS
+def test_get_bids_with_backend(stub_client, bids_page, backend):
+    """Test bid scraping end to end on each backend."""
+    page = bids_page(103, [("Alpha HS", "TX", "Alpha AB", "2")])
+    client = stub_client(lambda request: (200, page), html_backend=backend)
+
+    assert client.extra.get_bids(DebateEvent.POLICY) == [
+        {"school": "Alpha HS", "state": "TX", "entry": "Alpha AB", "bids": 2}
+    ]
+
+
+def test_sniff_encoding():
+    """Test charset detection from the header, then meta tags, then UTF-8."""
+    meta = b'<html><head><meta charset="windows-1252"></head>'
+    assert sniff_encoding("text/html; charset=ISO-8859-1", meta) == "iso8859-1"
+    assert sniff_encoding("text/html", meta) == "cp1252"
+    assert sniff_encoding(None, b"<html>") == "utf-8"
+    assert sniff_encoding("text/html; charset=bogus", b"") == "utf-8"
+
+
+def test_page_decodes_only_the_table():
+    """Test that a raw page decodes the table with its charset."""
+    page = HTMLPage(
+        '<p>caf\xe9</p><table id="t"><tr><td>B\xe9ta</td></tr></table>'.encode(
+            "latin-1"
+        ),
+        "latin-1",
+    )
+    assert page.table("t") == '<table id="t"><tr><td>B\xe9ta</td></tr></table>'
+    assert page.table("missing") is None
+
+
+@BACKENDS
+def test_scraped_text_honours_charset(stub_client, fields_page, backend):
+    """Test that non-ASCII names survive in the response's charset."""
+    page = fields_page([("\xc9cole B\xe9ta", "Qu\xe9bec", "B\xe9ta AB", "BA")])
+    client = stub_client(
+        lambda request: (
+            200,
+            page.encode("latin-1"),
+            {"Content-Type": "text/html; charset=ISO-8859-1"},
+        ),
+        html_backend=backend,
+    )
+
+    assert client.extra.get_teams_attending("1", "2") == [
+        {
+            "school": "\xc9cole B\xe9ta",
+            "location": "Qu\xe9bec",
+            "entry": "B\xe9ta AB",
+            "code": "BA",
+        }
+    ]
+    assert "Qu\xe9bec" in client._base_client.request_html("/page", "GET")
+
+
+def test_table_row_parser_yields_rows_incrementally(bids_page):
+    """Test that rows come out as their </tr> arrives, then parsing stops."""
+    # Without lxml the parser buffers the whole page
+    pytest.importorskip("lxml")
+    rows = [(f"School {i}", "TX", f"Entry {i}", "1") for i in range(200)]
+    trailer = '<table id="104"><tr><td>x</td></tr></table>' * 500
+    page = (bids_page(103, rows) + trailer).encode()
+    parser = TableRowParser("103")
+
+    seen, fed, first_row_at = [], 0, None
+    while fed < len(page) and not parser.done:
+        seen.extend(parser.feed(page[fed : fed + 512]))
+        fed += 512
+        if seen and first_row_at is None:
+            first_row_at = fed
+    seen.extend(parser.close())
+
+    assert seen == [list(row) for row in rows]
+    assert first_row_at < len(page) // 10
+    assert fed < len(page) // 2
+
+
+def test_table_row_parser_uses_meta_charset():
+    """Test that a charset declared in the page is honoured in tiny chunks."""
+    page = (
+        '<html><head><meta charset="latin-1"></head><body>'
+        '<table id="t"><tbody><tr><td>B\xe9ta</td></tr></tbody></table>'
+    ).encode("latin-1")
+    parser = TableRowParser("t")
+    rows = []
+    for byte in range(len(page)):
+        rows.extend(parser.feed(page[byte : byte + 1]))
+    assert rows + parser.close() == [["B\xe9ta"]]
+
+
+def test_iter_bids_streams_rows(stub_client, bids_page, fields_page):
+    """Test the streaming scraper end to end."""
+    rows = [("Alpha HS", "TX", "Alpha AB", "2"), ("Beta", "CA", "B", "1")]
+    pages = {"toc_bids": bids_page(103, rows), "fields": fields_page(rows)}
+    client = stub_client(
+        lambda request: (200, next(v for k, v in pages.items() if k in request.url))
+    )
+
+    bids = client.extra.iter_bids(DebateEvent.POLICY)
+    assert next(bids) == {
+        "school": "Alpha HS",
+        "state": "TX",
+        "entry": "Alpha AB",
+        "bids": 2,
+    }
+    assert [bid["school"] for bid in bids] == ["Beta"]
+
+    with use_parse_mode("records"):
+        entries = list(client.extra.iter_teams_attending("1", "2"))
+    assert entries == [FieldRecord(*row) for row in rows]
+
+    # The parse mode is the one active at the call, not at the first next()
+    with use_parse_mode("records"):
+        bids = client.extra.iter_bids(DebateEvent.POLICY)
+    assert [type(bid) for bid in bids] == [BidRecord, BidRecord]
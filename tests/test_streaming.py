@@ -0,0 +1,94 @@
+"""Tests for streaming JSON list responses."""
+
+import json
+
+import pytest
+
+from tabroom import Invite, Search
+from tabroom.exceptions import TabroomAPIError, TabroomServerError
+from tabroom.streaming import JSONArrayDecoder
+
+
+def feed_in_chunks(raw: bytes, size: int) -> list:
+    decoder = JSONArrayDecoder()
+    items = []
+    for start in range(0, len(raw), size):
+        items.extend(decoder.feed(raw[start : start + size]))
+    return items + decoder.close()
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64])
+def test_decoder_handles_any_chunking(size):
+    """Test that elements split across chunks (incl. UTF-8) decode correctly."""
+    data = [{"name": "Académie", "tourn": {"id": n}} for n in range(5)]
+    data += [12345, 1.5, -2.5e-300, 1e300, "x"]
+    raw = json.dumps(data, ensure_ascii=False).encode()
+
+    assert feed_in_chunks(raw, size) == data
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([b"[1.", b"5]"], [1.5]),
+        ([b"[1e", b"5]"], [1e5]),
+        ([b"[-2.5E", b"-", b"3, 4]"], [-2.5e-3, 4]),
+    ],
+)
+def test_decoder_holds_back_split_numbers(chunks, expected):
+    """Test that a number cut inside its fraction or exponent is not ended early."""
+    decoder = JSONArrayDecoder()
+    items = []
+    for chunk in chunks:
+        items.extend(decoder.feed(chunk))
+    assert items + decoder.close() == expected
+
+
+def test_decoder_yields_elements_before_the_end():
+    """Test that completed elements are returned before the array closes."""
+    decoder = JSONArrayDecoder()
+
+    assert decoder.feed(b'[{"name": "a"}, {"na') == [{"name": "a"}]
+    assert decoder.feed(b'me": "b"}') == [{"name": "b"}]
+    assert decoder.feed(b"]") == []
+    assert decoder.close() == []
+
+
+def test_decoder_rejects_truncated_arrays():
+    """Test that a body cut off mid-array is reported."""
+    decoder = JSONArrayDecoder()
+    decoder.feed(b'[{"name": "a"},')
+
+    with pytest.raises(ValueError):
+        decoder.close()
+
+
+def test_iter_upcoming_tournaments(stub_client):
+    """Test that the streaming listing yields validated invites."""
+    body = [{"name": f"T{n}", "webname": f"t{n}"} for n in range(3)]
+    client = stub_client(lambda r: (200, body))
+
+    invites = list(client.public.iter_upcoming_tournaments())
+    assert [invite.name for invite in invites] == ["T0", "T1", "T2"]
+    assert all(isinstance(invite, Invite) for invite in invites)
+    assert client.adapter.requests[0].url.endswith("/public/invite/upcoming")
+
+
+def test_iter_search_tournaments(stub_client):
+    """Test that streamed search results are validated."""
+    client = stub_client(lambda r: (200, [{"result": "TOC"}]))
+
+    assert list(client.public.iter_search_tournaments("future", "TOC")) == [
+        Search(result="TOC")
+    ]
+
+
+def test_stream_errors_are_mapped(stub_client):
+    """Test that HTTP and decoding errors map to Tabroom exceptions."""
+    failing = stub_client(lambda r: (502, "bad gateway"))
+    with pytest.raises(TabroomServerError):
+        list(failing.public.iter_upcoming_tournaments())
+
+    truncated = stub_client(lambda r: (200, b'[{"name": "a"}, {"na'))
+    with pytest.raises(TabroomAPIError):
+        list(truncated.public.iter_upcoming_tournaments())
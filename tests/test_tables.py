@@ -0,0 +1,75 @@
+"""Tests for declarative table extraction."""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from tabroom import Bs4Backend, Column, DebateEvent, TableSpec
+from tabroom.scraping import HTMLPage
+from tabroom.tables import extract_tuples, integer
+
+PAGE = (
+    '<table id="schools"><thead><tr><th>School</th></tr></thead><tbody>'
+    "<tr><td>Alpha</td><td>TX</td><td>1,204</td></tr>"
+    "<tr><td>short row</td></tr>"
+    "<tr><td>Beta</td><td>CA</td><td></td></tr>"
+    "</tbody></table>"
+)
+
+SCHOOLS = TableSpec(
+    "SchoolRecord",
+    (Column("school", 0), Column("entries", 2, integer)),
+    table_id="schools",
+).compile(__name__)
+SchoolRecord = SCHOOLS.record
+
+
+def test_extract_converts_and_skips_short_rows():
+    """Test column selection, converters and short-row skipping."""
+    records = SCHOOLS.extract(PAGE, Bs4Backend())
+    assert records == [("Alpha", 1204), ("Beta", None)]
+    assert records[0].entries == 1204
+    assert SCHOOLS.extract(None, Bs4Backend()) == []
+
+
+def test_records_pickle():
+    """Test that generated record types live in the defining module."""
+    record = SchoolRecord("Alpha", 3)
+    assert SCHOOLS.record.__module__ == __name__
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_single_column_and_row():
+    """Test a one-column spec and single-row conversion."""
+    names = TableSpec("Name", (Column("name", 1),)).compile()
+    assert names.row(["a", "b"]) == ("b",)
+    assert names.row(["a"]) is None
+    with pytest.raises(ValueError):
+        names.extract(PAGE, Bs4Backend())
+    with pytest.raises(ValueError):
+        TableSpec("Empty", ()).compile()
+
+
+def test_extract_in_process_pool():
+    """Test that worker processes return tuples that become records."""
+    page = HTMLPage(PAGE.encode())
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        rows = SCHOOLS.submit(pool, page, Bs4Backend()).result()
+        assert rows == [("Alpha", 1204), ("Beta", None)]
+        assert type(rows[0]) is tuple
+        assert SCHOOLS.extract_in(pool, page, Bs4Backend())[0].entries == 1204
+
+
+def test_scrapers_use_parse_executor(stub_client, bids_page):
+    """Test that clients hand scraped pages to their parse executor."""
+    page = bids_page(103, [("Alpha HS", "TX", "Alpha AB", "3")])
+    executor = ThreadPoolExecutor(max_workers=1)
+    submitted = []
+    real_submit = executor.submit
+    executor.submit = lambda *args: submitted.append(args) or real_submit(*args)
+    client = stub_client(lambda request: (200, page), parse_executor=executor)
+
+    with executor:
+        assert client.extra.get_bids(DebateEvent.POLICY)[0]["bids"] == 3
+    assert submitted[0][0] is extract_tuples